@@ -1,47 +1,68 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-from app.utils.data_processing import load_data
-from app.utils.visualization import update_chart_style, create_themed_line_chart
+from app.components.widgets import create_parameter_display, render_chart
+from app.utils.correlation import load_correlations
+from app.utils.fleet import load_fleet
+from app.utils.visualization import cached_figure, create_correlation_chart, create_sensor_comparison_chart
 
-def render():
+def render(dataset=None):
     """Render the analysis component"""
     # Analysis container
     st.markdown('<div class="container">', unsafe_allow_html=True)
     st.markdown('<div class="header">Engine Degradation Analysis</div>', unsafe_allow_html=True)
     
-    # Load data
-    train_data = load_data()
+    # Load data indexed by engine
+    fleet = load_fleet(dataset)
     
     # Feature correlation analysis
-    sensor_cols = [col for col in train_data.columns if 'sensor' in col]
+    sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
     
     if len(sensor_cols) > 0:
-        # Calculate correlations with RUL
-        correlations = train_data[sensor_cols + ['RUL']].corr()['RUL'].drop('RUL').abs().sort_values(ascending=False)
-        
-        # Plot correlations in a bar chart
-        fig = px.bar(
-            x=correlations.index,
-            y=correlations.values,
-            title="Sensor Correlations with RUL",
-            labels={'x': 'Sensor', 'y': 'Absolute Correlation'},
-            color=correlations.values,
-            color_continuous_scale='Viridis'
-        )
+        # Sensor-vs-RUL correlations, computed once per dataset version
+        correlations = load_correlations(fleet).ranking()
         
-        # Apply the styling
-        fig = update_chart_style(fig)
+        # Create enhanced correlation chart
+        fig = cached_figure(('correlation', fleet.version), lambda: create_correlation_chart(correlations))
         
-        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+        render_chart(fig, 'correlation')
         
         # Top correlated sensors
         top_sensors = correlations.index[:3].tolist()
         
-        # Display top correlations
-        st.markdown("### Top sensors for degradation monitoring:")
+        # Display parameter table with top correlations
+        correlation_params = {}
         for i, sensor in enumerate(top_sensors):
-            st.write(f"{sensor}: {correlations.iloc[i]:.3f} correlation")
+            correlation_params[sensor] = f"{correlations.iloc[i]:.3f} correlation"
+        
+        st.markdown(create_parameter_display(correlation_params), unsafe_allow_html=True)
+        
+        # Comparison across engines
+        st.markdown("<h3 style='color:#ffffff; margin-top:30px;'>Compare Engines</h3>", unsafe_allow_html=True)
+        
+        # Select engines to compare
+        engine_options = fleet.engines
+        selected_engines = st.multiselect(
+            "Select Engines to Compare",
+            options=engine_options,
+            default=engine_options[:3] if len(engine_options) >= 3 else engine_options
+        )
+        
+        # Select sensor to compare
+        selected_sensor = st.selectbox(
+            "Select Sensor for Comparison",
+            options=sensor_cols,
+            index=sensor_cols.index(top_sensors[0]) if top_sensors[0] in sensor_cols else 0
+        )
+        
+        if selected_engines and selected_sensor:
+            # Create data frames dictionary for the chart function
+            data_frames = fleet.engines_data(selected_engines)
+            
+            # Create enhanced sensor comparison chart
+            fig = cached_figure(
+                ('sensor_comparison', tuple(selected_engines), selected_sensor, fleet.version),
+                lambda: create_sensor_comparison_chart(data_frames, selected_sensor)
+            )
+            
+            render_chart(fig, 'sensor_comparison')
     
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -1,33 +1,44 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-from app.utils.data_processing import load_data
-from app.utils.visualization import create_health_distribution_chart
+from app.components.widgets import create_status_card, render_chart
+from app.utils.fleet import load_fleet, load_status_cube
+from app.utils.features import load_engine_sensor_std
+from app.utils.visualization import (
+    add_threshold_line, cached_figure, create_engine_sensors_chart, create_health_distribution_chart,
+    create_status_breakdown_chart, create_themed_line_chart
+)
+import app.config as config
 
-def render():
+def render(dataset=None):
     """Render the dashboard component"""
     # Dashboard container
     st.markdown('<div class="container">', unsafe_allow_html=True)
     st.markdown('<div class="header">Fleet Status Overview</div>', unsafe_allow_html=True)
     
-    # Load data
-    train_data = load_data()
+    # Load data indexed by engine
+    fleet = load_fleet(dataset)
     
-    # Calculate metrics
-    total_engines = train_data['unit_number'].nunique()
-    avg_lifecycle = train_data.groupby('unit_number')['cycle'].max().mean().round(1)
+    # Fleet health from the recorded RUL labels, or from the model's estimates
+    # at each engine's latest cycle (what matters for in-service engines)
+    health_source = st.radio("Health Source", ["Recorded RUL", "Predicted RUL"], horizontal=True)
     
-    # Get min RUL for each engine
-    engine_min_rul = train_data.groupby('unit_number')['RUL'].min().reset_index()
-    critical_engines = len(engine_min_rul[engine_min_rul['RUL'] < 30])
+    # Read precomputed fleet metrics
+    if health_source == "Predicted RUL":
+        # Imported on demand so the Dashboard starts without loading sklearn
+        from app.utils.model import load_fleet_health
+        with st.spinner("Scoring the fleet..."):
+            summary = load_fleet_health(dataset)
+    else:
+        summary = fleet.summary
+    total_engines = summary.total_engines
+    avg_lifecycle = summary.avg_lifecycle
+    critical_engines = summary.critical_engines
     
     # Calculate maintenance cost savings
     unscheduled_cost = 250000  # $ per event
     scheduled_cost = 75000     # $ per event
     potential_savings = critical_engines * (unscheduled_cost - scheduled_cost)
     
-    # Display metrics
+    # Display metrics in a stylish way
     st.markdown(f'''
     <div class="metric-container">
         <div class="metric-card">
@@ -50,19 +61,94 @@ def render():
     ''', unsafe_allow_html=True)
     
     # Health status distribution
-    engine_min_rul['Status'] = pd.cut(
-        engine_min_rul['RUL'],
-        bins=[0, 20, 50, 100, 200, 1000],
-        labels=['Critical', 'Warning', 'Moderate', 'Good', 'Excellent']
+    status_counts = summary.status_counts
+    
+    status_order = config.STATUS_LABELS
+    
+    # Create horizontal bar chart with enhanced colors
+    fig = cached_figure(
+        ('health_distribution', summary.rul_column, tuple(status_counts['Count'])),
+        lambda: create_health_distribution_chart(status_counts, status_order)
+    )
+    
+    render_chart(fig, 'health_distribution')
+    
+    # Status breakdowns read from the pre-aggregated status cube
+    breakdown_options = {'Operating condition': 'condition', 'Operator': 'operator'}
+    if summary.rul_column == 'min_RUL':
+        # Predicted health is scored per subset, so only recorded health spans datasets
+        breakdown_options['Dataset'] = 'dataset'
+    breakdown_by = st.selectbox("Break Down Health By", list(breakdown_options))
+    dimension = breakdown_options[breakdown_by]
+    cube = load_status_cube() if dimension == 'dataset' else summary.cube
+    breakdown = cube.breakdown(dimension)
+    
+    fig = cached_figure(
+        ('status_breakdown', dimension, summary.rul_column, tuple(map(tuple, breakdown.itertuples()))),
+        lambda: create_status_breakdown_chart(breakdown, dimension)
     )
     
-    status_counts = engine_min_rul['Status'].value_counts().reset_index()
-    status_counts.columns = ['Status', 'Count']
+    render_chart(fig, 'status_breakdown')
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Engine details section
+    st.markdown('<div class="container">', unsafe_allow_html=True)
+    st.markdown('<div class="header">Individual Engine Monitor</div>', unsafe_allow_html=True)
     
-    status_order = ['Critical', 'Warning', 'Moderate', 'Good', 'Excellent']
+    # Engine selector
+    engine_options = fleet.engines
+    selected_engine = st.selectbox("Select Engine", engine_options)
     
-    # Create and display the chart
-    fig = create_health_distribution_chart(status_counts, status_order)
-    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    if selected_engine:
+        # Get engine data
+        engine_data = fleet.engine(selected_engine)
+        engine_rul = summary.engines.at[selected_engine, summary.rul_column]
+        if summary.rul_column == 'predicted_RUL':
+            engine_rul = round(float(engine_rul), 1)
+        
+        # Display enhanced status card
+        st.markdown(create_status_card("Status", engine_rul), unsafe_allow_html=True)
+        
+        # Create tabs for different visualizations
+        engine_tabs = st.tabs(["RUL Trend", "Sensor Readings"])
+        
+        with engine_tabs[0]:
+            # Plot RUL trend with enhanced styling and the critical threshold
+            fig = cached_figure(
+                ('rul_trend', selected_engine, fleet.version),
+                lambda: add_threshold_line(
+                    create_themed_line_chart(
+                        engine_data,
+                        'cycle',
+                        'RUL',
+                        f"Remaining Useful Life (RUL) for Engine #{selected_engine}"
+                    ),
+                    config.CRITICAL_RUL
+                )
+            )
+            
+            render_chart(fig, 'rul_trend')
+        
+        with engine_tabs[1]:
+            # Find most variable sensors
+            sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
+            sensor_std = load_engine_sensor_std(fleet).loc[selected_engine].sort_values(ascending=False)
+            top_sensors = sensor_std.head(5).index.tolist()
+            
+            # Let user select sensors
+            selected_sensors = st.multiselect(
+                "Select Sensors",
+                options=sensor_cols,
+                default=top_sensors[:3]
+            )
+            
+            if selected_sensors:
+                # One decimated trace per selected sensor
+                fig = cached_figure(
+                    ('engine_sensors', selected_engine, tuple(selected_sensors), fleet.version),
+                    lambda: create_engine_sensors_chart(engine_data, selected_sensors, selected_engine)
+                )
+                
+                render_chart(fig, 'engine_sensors')
     
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('</div>', unsafe_allow_html=True)
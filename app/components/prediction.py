@@ -1,63 +1,81 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from app.utils.data_processing import load_data
-from app.utils.model import train_model
-from app.utils.visualization import update_chart_style
+from app.components.widgets import create_maintenance_recommendation, create_prediction_display, render_chart
+from app.utils.model import get_versioned_model, load_model_fleet, predict_rul_batch
+from app.utils.visualization import (
+    cached_figure, create_feature_importance_chart, create_rul_gauge, create_rul_trajectory_chart
+)
+import app.config as config
 
-def render():
+def render(dataset=None):
     """Render the prediction component"""
     # Prediction container
     st.markdown('<div class="container">', unsafe_allow_html=True)
     st.markdown('<div class="header">RUL Prediction Engine</div>', unsafe_allow_html=True)
     
-    # Load data
-    train_data = load_data()
-    
-    # Train model
-    with st.spinner("Training machine learning model..."):
-        model, scaler, importance = train_model(train_data)
+    # Load the model and the fleet columns it was trained on
+    with st.spinner("Loading machine learning model..."):
+        fleet = load_model_fleet(dataset)
+        model_version, (model, scaler, importance, forest) = get_versioned_model(fleet.data, fleet.version, dataset=dataset)
     
     # Display feature importance
-    st.markdown("### Feature Importance")
-    
-    fig = px.bar(
-        importance.head(10),
-        x='Importance',
-        y='Feature',
-        orientation='h',
-        title="Top 10 Most Important Sensors",
-        color='Importance',
-        color_continuous_scale='Viridis'
-    )
+    st.markdown("<h3 style='color:#ffffff; margin-top:20px;'>Feature Importance</h3>", unsafe_allow_html=True)
     
-    # Apply styling
-    fig = update_chart_style(fig)
+    # Create enhanced feature importance chart
+    fig = cached_figure(('feature_importance', model_version), lambda: create_feature_importance_chart(importance))
     
-    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+    render_chart(fig, 'feature_importance')
     
     # Prediction interface
-    st.markdown("### Predict Remaining Useful Life")
+    st.markdown("<h3 style='color:#ffffff; margin-top:30px;'>Predict Remaining Useful Life</h3>", unsafe_allow_html=True)
     
     # Engine selection
-    engine_options = sorted(train_data['unit_number'].unique())
+    engine_options = fleet.engines
     selected_engine = st.selectbox("Select Engine", engine_options, key="pred_engine")
     
     if selected_engine:
-        # Get engine data
-        engine_data = train_data[train_data['unit_number'] == selected_engine]
-        
         # Select cycle
-        max_cycle = engine_data['cycle'].max()
+        max_cycle = fleet.max_cycle(selected_engine)
         cycle = st.slider("Select Operating Cycle", 1, int(max_cycle), int(max_cycle//2))
         
-        # Get data for that cycle
-        cycle_data = engine_data[engine_data['cycle'] == cycle]
+        sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
+        
+        # Score the engine's whole trajectory in one batch, with prediction
+        # intervals from the per-tree outputs, then pick the selected cycle
+        trajectory = predict_rul_batch(
+            model, scaler, fleet.engine(selected_engine), sensor_cols,
+            forest=forest, interval=config.PREDICTION_INTERVAL
+        )
+        cycle_prediction = trajectory[trajectory['cycle'] == cycle]
+        
+        if not cycle_prediction.empty:
+            prediction = cycle_prediction['predicted_RUL'].iloc[0]
+            lower = cycle_prediction['RUL_lower'].iloc[0]
+            upper = cycle_prediction['RUL_upper'].iloc[0]
+            actual_rul = cycle_prediction['RUL'].iloc[0]
+            
+            # Display prediction and actual with enhanced styling
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown(create_prediction_display(f"{prediction:.1f} cycles", "Predicted RUL", color=config.CHART_COLORS['accent']), unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(create_prediction_display(f"{actual_rul} cycles", "Actual RUL", color=config.CHART_COLORS['highlight']), unsafe_allow_html=True)
+            
+            # Enhanced RUL gauge
+            fig = create_rul_gauge(prediction, actual_rul, interval=(lower, upper, config.PREDICTION_INTERVAL))
+            
+            render_chart(fig, 'rul_gauge')
+            
+            # Enhanced maintenance recommendation
+            st.markdown(create_maintenance_recommendation(prediction, lower=lower), unsafe_allow_html=True)
+        
+        # Predicted vs actual RUL over the whole trajectory
+        fig = cached_figure(
+            ('rul_trajectory', selected_engine, fleet.version, model_version),
+            lambda: create_rul_trajectory_chart(trajectory, selected_engine)
+        )
         
-        if not cycle_data.empty:
-            # Make prediction
-            st.write(f"Predictions for Engine #{selected_engine} at cycle {cycle} will appear here")
+        render_chart(fig, 'rul_trajectory')
     
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -1,25 +1,24 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-from app.utils.visualization import update_chart_style
+from app.components.widgets import create_mission_box, create_sustainability_metric, render_chart
+from app.utils.visualization import create_emissions_chart
 import app.config as config
 
-def render():
+def render(dataset=None):
     """Render the sustainability component"""
     # Sustainability container
     st.markdown('<div class="container">', unsafe_allow_html=True)
     st.markdown('<div class="header">Environmental Impact</div>', unsafe_allow_html=True)
     
     st.markdown('''
-    <div style="color:#d0d0d0; margin-bottom:20px;">
+    <div style="color:#ffffff; margin-bottom:20px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">
         Predictive maintenance directly supports SITA's mission to reduce the aviation sector's CO₂ emissions
         through data-driven solutions.
     </div>
     ''', unsafe_allow_html=True)
     
-    # Calculator inputs
-    st.markdown("### Impact Calculator")
+    # Calculator inputs in a clean layout
+    st.markdown("<h3 style='color:#ffffff; margin-top:20px;'>Impact Calculator</h3>", unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
     
@@ -50,19 +49,40 @@ def render():
     fuel_saved = total_annual_fuel * (maintenance_improvement / 100)
     co2_saved = fuel_saved * co2_per_kg_fuel
     
-    # Display results
-    st.markdown("### Annual Impact")
+    # Display results in a clean, minimalist style
+    st.markdown('''
+    <div style="margin-top:30px; margin-bottom:20px;">
+        <div style="font-size:20px; color:#ffffff; margin-bottom:15px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">Annual Impact</div>
+    </div>
+    ''', unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Fuel Saved", f"{fuel_saved/1000:,.1f} tonnes")
+        st.markdown(create_sustainability_metric("Fuel Saved", f"{fuel_saved/1000:,.1f} tonnes", color=config.CHART_COLORS['accent2']), unsafe_allow_html=True)
     
     with col2:
-        st.metric("CO₂ Reduced", f"{co2_saved/1000:,.1f} tonnes")
+        st.markdown(create_sustainability_metric("CO₂ Reduced", f"{co2_saved/1000:,.1f} tonnes", color=config.CHART_COLORS['Good']), unsafe_allow_html=True)
     
     with col3:
         trees_equivalent = int(co2_saved / 25)  # Approx 25kg CO2 per tree per year
-        st.metric("Tree Equivalent", f"{trees_equivalent:,} trees")
+        st.markdown(create_sustainability_metric("Tree Equivalent", f"{trees_equivalent:,} trees", color=config.CHART_COLORS['Good']), unsafe_allow_html=True)
+    
+    # Emissions comparison chart
+    emissions_data = pd.DataFrame({
+        'Scenario': ['Without Predictive Maintenance', 'With Predictive Maintenance'],
+        'CO₂ Emissions (tonnes)': [
+            total_annual_fuel * co2_per_kg_fuel / 1000,
+            (total_annual_fuel - fuel_saved) * co2_per_kg_fuel / 1000
+        ]
+    })
+    
+    # Create enhanced emissions chart
+    fig = create_emissions_chart(emissions_data, co2_saved)
+    
+    render_chart(fig, 'emissions')
+    
+    # Enhanced SITA mission connection
+    st.markdown(create_mission_box(), unsafe_allow_html=True)
     
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,127 @@
+import streamlit as st
+from app.utils.profiling import span
+
+def render_chart(fig, name):
+    """Send a figure to the browser, timing its serialization as a span"""
+    with span(f"plotly_chart:{name}"):
+        st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+def create_status_card(status, rul_value):
+    """Create a high-contrast status card with appropriate styling based on RUL value"""
+    if rul_value < 20:
+        status_class = "status-critical"
+        status_text = "CRITICAL"
+        border_color = "#ff3333"
+        bg_color = "rgba(40, 0, 0, 0.95)"
+    elif rul_value < 50:
+        status_class = "status-warning"
+        status_text = "WARNING"
+        border_color = "#ffaa00"
+        bg_color = "rgba(40, 20, 0, 0.95)"
+    else:
+        status_class = "status-good"
+        status_text = "GOOD"
+        border_color = "#33ff33"
+        bg_color = "rgba(0, 40, 0, 0.95)"
+    
+    return f'''
+    <div style="background-color: {bg_color}; padding:15px; border-radius:8px; border-left: 4px solid {border_color}; margin-bottom: 15px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid {border_color};">
+        <span style="font-size:18px; color: #ffffff;">Status: <span class="{status_class}">{status_text}</span></span>
+        <br>
+        <span style="color:#ffffff; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">Remaining Useful Life: {rul_value} cycles</span>
+    </div>
+    '''
+
+def create_parameter_display(parameters):
+    """Create a styled parameter display with high contrast for key-value pairs"""
+    html = '''
+    <div style="background-color: rgba(5, 5, 15, 0.95); padding:15px; border-radius:8px; margin-top:15px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid rgba(140, 131, 255, 0.6);">
+    <table style="width:100%;">
+    '''
+    
+    for key, value in parameters.items():
+        html += f'''
+        <tr>
+            <td style="padding:10px; color:#9966ff; font-weight:bold; width:40%; border-bottom: 1px solid rgba(140, 131, 255, 0.4); text-shadow: 0 1px 2px rgba(0,0,0,0.9);">{key}</td>
+            <td style="padding:10px; color:#ffffff; width:60%; border-bottom: 1px solid rgba(140, 131, 255, 0.4); text-shadow: 0 1px 2px rgba(0,0,0,0.9);">{value}</td>
+        </tr>
+        '''
+    
+    html += '''
+    </table>
+    </div>
+    '''
+    return html
+
+def create_prediction_display(value, label, color="#9966ff"):
+    """Create a solid card showing one large value under a label"""
+    return f'''
+    <div style="background-color: rgba(5, 5, 15, 0.95); padding:20px; border-radius:8px; text-align:center; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid rgba(140, 131, 255, 0.6);">
+        <div style="font-size:16px; color:#ffffff; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">{label}</div>
+        <div style="font-size:32px; font-weight:bold; color:{color}; text-shadow: 0 2px 4px rgba(0,0,0,0.9);">{value}</div>
+    </div>
+    '''
+
+def create_maintenance_recommendation(prediction, lower=None):
+    """Create the maintenance advice box for a predicted RUL
+
+    With the ``lower`` end of a prediction interval the advice is planned on
+    that pessimistic estimate rather than the point prediction.
+    """
+    basis = ''
+    if lower is not None:
+        basis = f'<div style="color:#ffffff; margin-top:8px; font-size:13px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">Planned on the pessimistic end of the prediction interval ({lower:.0f} cycles).</div>'
+        prediction = min(prediction, lower)
+    
+    if prediction <= 30:
+        return f'''
+        <div style="background-color:rgba(40, 0, 0, 0.95); border-left:4px solid #ff3333; padding:15px; border-radius:4px; margin-top:20px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid #ff3333;">
+            <div style="font-size:18px; color:#ff3333; font-weight:bold; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">🚨 CRITICAL: IMMEDIATE MAINTENANCE REQUIRED</div>
+            <div style="color:#ffffff; margin-top:10px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">
+                Engine is approaching end of useful life. Schedule maintenance within the next 30 cycles to prevent failure.
+            </div>
+            {basis}
+        </div>
+        '''
+    elif prediction <= 70:
+        return f'''
+        <div style="background-color:rgba(40, 20, 0, 0.95); border-left:4px solid #ffaa00; padding:15px; border-radius:4px; margin-top:20px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid #ffaa00;">
+            <div style="font-size:18px; color:#ffaa00; font-weight:bold; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">⚠️ WARNING: MAINTENANCE REQUIRED SOON</div>
+            <div style="color:#ffffff; margin-top:10px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">
+                Engine is showing early signs of degradation. Plan for maintenance within the next 50-60 cycles.
+            </div>
+            {basis}
+        </div>
+        '''
+    else:
+        return f'''
+        <div style="background-color:rgba(0, 40, 0, 0.95); border-left:4px solid #33ff33; padding:15px; border-radius:4px; margin-top:20px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid #33ff33;">
+            <div style="font-size:18px; color:#33ff33; font-weight:bold; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">✅ HEALTHY: NO IMMEDIATE ACTION REQUIRED</div>
+            <div style="color:#ffffff; margin-top:10px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">
+                Engine is in good condition. Continue with standard operation procedures.
+            </div>
+            {basis}
+        </div>
+        '''
+
+def create_mission_box():
+    """Create the box linking the calculator to SITA's sustainability mission"""
+    return '''
+    <div style="background-color:rgba(25, 25, 50, 0.95); border-left:4px solid #9966ff; padding:15px; border-radius:4px; margin-top:30px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6); border: 1px solid #9966ff;">
+        <div style="font-size:18px; color:#ffffff; font-weight:bold; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">SITA's Sustainability Mission</div>
+        <div style="color:#ffffff; margin-top:10px; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">
+            This predictive maintenance system directly supports SITA's Data Intelligence team's goal to develop 
+            "data-driven and AI-powered solutions to optimize operations in the aviation industry, with a specific 
+            focus on reducing the sector's CO₂ emissions."
+        </div>
+    </div>
+    '''
+
+def create_sustainability_metric(label, value, color="#33ffff"):
+    """Create a card for one annual impact figure"""
+    return f'''
+    <div style="background-color:rgba(5, 5, 15, 0.95); padding:20px; border-radius:8px; text-align:center; border: 1px solid {color}; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.6);">
+        <div style="font-size:16px; color:#ffffff; text-shadow: 0 1px 2px rgba(0,0,0,0.9);">{label}</div>
+        <div style="font-size:26px; font-weight:bold; color:{color}; text-shadow: 0 2px 4px rgba(0,0,0,0.9);">{value}</div>
+    </div>
+    '''
@@ -5,9 +5,104 @@ LAYOUT = "wide"
 SIDEBAR_STATE = "collapsed"
 APP_TITLE = "Aircraft Predictive Maintenance System"
 
-# Data paths
-DATA_PATH = "data/raw/fixed_train_FD001.csv"
+# C-MAPSS subsets: each has train/test trajectories and the test set's true RUL
+DATASETS = {
+    'FD001': "One operating condition, HPC degradation",
+    'FD002': "Six operating conditions, HPC degradation",
+    'FD003': "One operating condition, HPC and fan degradation",
+    'FD004': "Six operating conditions, HPC and fan degradation",
+}
+DEFAULT_DATASET = 'FD001'
+
+# Data paths, formatted with the subset and split ('train' or 'test')
+RAW_DATA_PATH = "data/raw/{split}_{dataset}.txt"
+RAW_RUL_PATH = "data/raw/RUL_{dataset}.txt"
+CSV_DATA_PATH = "data/raw/fixed_{split}_{dataset}.csv"
+FLEET_STORE_TEMPLATE = "data/processed/{split}_{dataset}.parquet"
+DATA_PATH = CSV_DATA_PATH.format(split='train', dataset=DEFAULT_DATASET)
+FLEET_STORE_PATH = FLEET_STORE_TEMPLATE.format(split='train', dataset=DEFAULT_DATASET)
+MODELS_DIR = "models"
+
+# Most memory the loaded subsets may hold per process before the least
+# recently used one is evicted
+DATASET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Limits of the other in-process caches
+FEATURE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+MODEL_CACHE_MAX_ENTRIES = 4
+CORRELATION_CACHE_MAX_ENTRIES = 8
+FLEET_HEALTH_CACHE_MAX_ENTRIES = 4
+STATUS_CUBE_CACHE_ENTRIES = 4
+
+# Rows per chunk when fitting the feature scaler (bounds its float64 temporaries)
+SCALER_CHUNK_ROWS = 65536
+
+# Largest batch scored with the compact forest; bigger batches go to sklearn
+FAST_FOREST_MAX_ROWS = 1000
+
+# Central coverage of RUL prediction intervals, taken from the spread of the
+# forest's per-tree predictions
+PREDICTION_INTERVAL = 0.8
+
+# Styling assets: built once per process; the background image is scaled
+# down to BACKGROUND_MAX_WIDTH and re-encoded as JPEG when Pillow is installed.
+# With Streamlit static serving enabled they are written to STATIC_DIR (next
+# to run.py) and fetched by the browser once instead of inlined every rerun
+STYLESHEET = "app/utils/styles.css"
 BACKGROUND_IMAGE = "assets/images/moon_landscape.png"
+BACKGROUND_MAX_WIDTH = 1920
+BACKGROUND_JPEG_QUALITY = 70
+STATIC_DIR = "static"
+
+# Engine health status bins on RUL (right edge inclusive) and alert threshold
+STATUS_BINS = [0, 20, 50, 100, 200, 1000]
+STATUS_LABELS = ['Critical', 'Warning', 'Moderate', 'Good', 'Excellent']
+CRITICAL_RUL = 30
+
+# Status breakdowns: column naming each engine's operator, and the label used
+# for fleets that don't record one
+OPERATOR_COLUMN = 'operator'
+DEFAULT_OPERATOR = 'Unassigned'
+
+# Local TCP port for streaming cycle records (newline-delimited JSON)
+STREAM_PORT = 8765
+
+# HTTP scoring service: port, largest micro-batch and how long to wait filling it
+SERVE_PORT = 8080
+SERVE_MAX_BATCH = 512
+SERVE_MAX_WAIT_MS = 2
+
+# Operating conditions: op_setting values rounded to these decimals
+CONDITION_ROUNDING = {'op_setting_1': 0, 'op_setting_2': 2, 'op_setting_3': 0}
+
+# Process pool for fleet-wide per-engine jobs: workers (None = all cores),
+# smallest fleet worth sharding and how workers are started
+PARALLEL_WORKERS = None
+PARALLEL_MIN_ROWS = 100000
+PARALLEL_START_METHOD = 'forkserver'
+
+# Rolling feature stage: trailing window (cycles) and EWMA span
+FEATURE_WINDOW = 10
+FEATURE_EWM_SPAN = 10
+
+# Chart rendering: most points sent per line trace (LTTB-decimated beyond this)
+# and total points in a figure above which traces switch to WebGL
+CHART_POINT_BUDGET = 1000
+CHART_DECIMATION = 'lttb'
+WEBGL_POINT_THRESHOLD = 5000
+
+# Most seconds importing the app shell and the Dashboard page may take in a
+# fresh interpreter (checked by tests/test_startup.py)
+COLD_START_BUDGET_S = 5.0
+
+# Built figures kept for reuse across reruns
+FIGURE_CACHE_SIZE = 64
+
+# Per-rerun profiling: on by default or not, reruns kept per session and
+# where the "Save" button appends them (JSON lines)
+PROFILING_ENABLED = False
+PROFILE_HISTORY = 100
+PROFILE_LOG_PATH = "logs/profile.jsonl"
 
 # Chart colors
 CHART_COLORS = {
@@ -0,0 +1,166 @@
+import pickle
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from app.utils.fleet_store import fingerprint_data
+
+# Every named cache, for reporting
+_registry = {}
+
+def estimate_nbytes(value):
+    """Approximate memory held by a cached value
+
+    Uses ``nbytes`` where objects expose it (arrays, FleetData), the column
+    buffers of DataFrames, sums over containers, and the pickled size for
+    anything else (e.g. fitted models), which is only measured once on insert.
+    """
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item) for item in value.values())
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return 0
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+def frame_fingerprint(data, sample_rows=1024):
+    """Cheap fingerprint of a DataFrame: schema, length and an even sample of rows
+
+    Costs O(sample_rows) instead of hashing every row, so it suits cache keys
+    for frames that are replaced rather than edited in place; use
+    ``fingerprint_data`` where an exact content hash is needed.
+    """
+    positions = np.unique(np.linspace(0, len(data) - 1, min(len(data), sample_rows)).astype(np.intp))
+    sample = data.take(positions) if len(data) else data
+    return f"{len(data)}-{fingerprint_data(sample)}"
+
+class LRUCache:
+    """Thread-safe LRU cache with explicit keys, byte accounting and hit/miss counters
+
+    Entries are evicted least recently used first once the cache holds more
+    than ``max_entries`` values or more than ``max_bytes`` (the entry just
+    added is always kept). Concurrent misses on the same key build the value
+    once.
+    """
+
+    def __init__(self, name, max_bytes=None, max_entries=None, sizeof=estimate_nbytes):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self._build_locks = {}
+        _registry[name] = self
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return a cached value (counting a hit or miss) without building it"""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, then evict down to the limits"""
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._sizes[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def get_or_create(self, key, build):
+        """Return the value for ``key``, calling ``build()`` on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            # Another thread may have built it while we waited
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+                self.misses += 1
+            try:
+                return self.put(key, build())
+            finally:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+
+    def pop(self, key):
+        """Remove an entry, returning it (or None)"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self.nbytes -= self._sizes.pop(key)
+            return self._entries.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def items(self):
+        """(key, size in bytes) pairs, least recently used first"""
+        with self._lock:
+            return [(key, self._sizes[key]) for key in self._entries]
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self.nbytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def stats(self):
+        """Counters and occupancy as a dict"""
+        lookups = self.hits + self.misses
+        return {
+            'cache': self.name,
+            'entries': len(self._entries),
+            'nbytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+def cache_stats():
+    """Statistics of every project cache, one row per cache"""
+    return pd.DataFrame([cache.stats() for cache in _registry.values()])
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import app.config as config
+from app.utils.cache import LRUCache
+from app.utils.fleet import load_fleet
+from app.utils.profiling import profiled
+from app.utils.status_cube import condition_labels
+
+# Correlation engines keyed by dataset version
+_correlation_cache = LRUCache('correlations', max_entries=config.CORRELATION_CACHE_MAX_ENTRIES)
+
+class GroupStats:
+    """Sufficient statistics for sensor-vs-RUL correlations, one row per group
+
+    Keeps the count and the sums of x, x², y, y² and x·y for every group
+    (engine, operating condition, ...), so correlations for any group, or
+    any union of groups, follow without rescanning the data. Sensor values
+    are shifted by a fixed per-sensor offset first, which leaves
+    correlations unchanged and keeps the sums well conditioned.
+    """
+
+    def __init__(self, labels, n, sum_x, sum_xx, sum_y, sum_yy, sum_xy, sensor_cols, shift):
+        self.labels = labels
+        self.n = n
+        self.sum_x = sum_x
+        self.sum_xx = sum_xx
+        self.sum_y = sum_y
+        self.sum_yy = sum_yy
+        self.sum_xy = sum_xy
+        self.sensor_cols = list(sensor_cols)
+        self.shift = shift
+
+    @classmethod
+    def from_arrays(cls, labels, X, y, sensor_cols, shift):
+        """Accumulate statistics per label with one sort and segmented sums"""
+        # Rows without a known RUL (in-service engines) carry no information here
+        known = ~np.isnan(y)
+        labels, X, y = labels[known], X[known], y[known]
+
+        order = np.argsort(labels, kind='stable')
+        labels = labels[order]
+        X = X[order] - shift
+        y = y[order]
+        if len(labels):
+            starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+        else:
+            starts = np.array([], dtype=np.intp)
+
+        def segment_sum(values):
+            if not len(starts):
+                return np.zeros((0,) + values.shape[1:])
+            return np.add.reduceat(values, starts, axis=0)
+
+        return cls(
+            labels=labels[starts],
+            n=np.diff(np.r_[starts, len(labels)]).astype(np.float64),
+            sum_x=segment_sum(X),
+            sum_xx=segment_sum(X * X),
+            sum_y=segment_sum(y),
+            sum_yy=segment_sum(y * y),
+            sum_xy=segment_sum(X * y[:, None]),
+            sensor_cols=sensor_cols,
+            shift=shift,
+        )
+
+    def merge(self, other):
+        """Add another set of statistics (same sensors and shift), matching groups by label"""
+        labels = np.union1d(self.labels, other.labels)
+        merged = {}
+        for name in ('n', 'sum_x', 'sum_xx', 'sum_y', 'sum_yy', 'sum_xy'):
+            mine = getattr(self, name)
+            total = np.zeros((len(labels),) + mine.shape[1:])
+            total[np.searchsorted(labels, self.labels)] += mine
+            total[np.searchsorted(labels, other.labels)] += getattr(other, name)
+            merged[name] = total
+        return GroupStats(labels, sensor_cols=self.sensor_cols, shift=self.shift, **merged)
+
+    def total(self):
+        """Collapse all groups into one"""
+        return GroupStats(
+            labels=np.array(['all']),
+            n=self.n.sum(keepdims=True),
+            sum_x=self.sum_x.sum(axis=0, keepdims=True),
+            sum_xx=self.sum_xx.sum(axis=0, keepdims=True),
+            sum_y=self.sum_y.sum(keepdims=True),
+            sum_yy=self.sum_yy.sum(keepdims=True),
+            sum_xy=self.sum_xy.sum(axis=0, keepdims=True),
+            sensor_cols=self.sensor_cols,
+            shift=self.shift,
+        )
+
+    def correlations(self):
+        """Pearson correlation of every sensor with RUL, one row per group
+
+        Groups where a sensor or RUL is constant get NaN, like ``DataFrame.corr``.
+        """
+        n = self.n[:, None]
+        covariance = n * self.sum_xy - self.sum_x * self.sum_y[:, None]
+        variance_x = n * self.sum_xx - self.sum_x ** 2
+        variance_y = n * self.sum_yy[:, None] - self.sum_y[:, None] ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlations = covariance / np.sqrt(variance_x * variance_y)
+        correlations[~((variance_x > 0) & (variance_y > 0))] = np.nan
+        return pd.DataFrame(correlations, index=self.labels, columns=self.sensor_cols)
+
+class SensorCorrelations:
+    """Sensor-vs-RUL correlations overall, per engine and per operating condition
+
+    Only the sensor/RUL pairs are computed, never the full correlation
+    matrix. The fleet is scanned once; ``update`` folds in newly arrived
+    cycles, and the overall figures are derived from the per-engine
+    statistics.
+    """
+
+    def __init__(self, data, sensor_cols=None):
+        if sensor_cols is None:
+            sensor_cols = [col for col in data.columns if col.startswith('sensor') and col.count('_') == 1]
+        self.sensor_cols = list(sensor_cols)
+        # First reading of each sensor as the fixed shift
+        self.shift = data[self.sensor_cols].iloc[0].to_numpy(dtype=np.float64) if len(data) else 0.0
+        self.by_engine_stats, self.by_condition_stats = self._accumulate(data)
+
+    def _accumulate(self, data):
+        X = data[self.sensor_cols].to_numpy(dtype=np.float64)
+        y = data['RUL'].to_numpy(dtype=np.float64) if 'RUL' in data.columns else np.full(len(data), np.nan)
+        engines = data['unit_number'].to_numpy()
+        # Labels are the rounded op_setting values, so they mean the same in every batch
+        conditions = condition_labels(data)
+        return (
+            GroupStats.from_arrays(engines, X, y, self.sensor_cols, self.shift),
+            GroupStats.from_arrays(conditions, X, y, self.sensor_cols, self.shift),
+        )
+
+    def update(self, rows):
+        """Fold newly arrived cycles into the statistics"""
+        by_engine, by_condition = self._accumulate(rows)
+        self.by_engine_stats = self.by_engine_stats.merge(by_engine)
+        self.by_condition_stats = self.by_condition_stats.merge(by_condition)
+
+    def overall(self):
+        """Correlation of each sensor with RUL over the whole fleet"""
+        return self.by_engine_stats.total().correlations().iloc[0].rename('RUL')
+
+    def by_engine(self):
+        """Per-engine correlations, indexed by unit_number"""
+        return self.by_engine_stats.correlations().rename_axis('unit_number')
+
+    def by_condition(self):
+        """Per-operating-condition correlations, indexed by condition"""
+        return self.by_condition_stats.correlations().rename_axis('condition')
+
+    def ranking(self):
+        """Sensors ordered by absolute overall correlation with RUL"""
+        return self.overall().abs().sort_values(ascending=False)
+
+@profiled()
+def load_correlations(fleet=None):
+    """Correlation statistics for the fleet, computed once per dataset version"""
+    fleet = fleet or load_fleet()
+    return _correlation_cache.get_or_create(fleet.version, lambda: SensorCorrelations(fleet.data))
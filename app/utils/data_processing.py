@@ -1,59 +1,116 @@
 import pandas as pd
 import numpy as np
 import streamlit as st
-from sklearn.preprocessing import StandardScaler
 import app.config as config
+from app.utils.datasets import read_dataset
+from app.utils.fleet_store import to_compact_dtypes
+from app.utils.profiling import profiled
 
-@st.cache_data
-def load_data():
-    """Load and preprocess the dataset"""
+@profiled()
+def load_data(columns=None, dataset=None, split='train'):
+    """Load one C-MAPSS subset, optionally restricted to the columns a page needs
+
+    Reads the columnar fleet store when it has been ingested and falls back to
+    the CSV or raw text files otherwise. Not cached here: the app goes through
+    the dataset catalog (``load_fleet``), which bounds memory across subsets.
+    """
     try:
-        train_data = pd.read_csv(config.DATA_PATH)
-        return train_data
-    except:
+        return read_dataset(dataset, split, columns)
+    except FileNotFoundError:
         # Create sample data if file doesn't exist
         st.warning("Could not load data file. Using synthetic data instead.")
-        return create_synthetic_data()
-
-def create_synthetic_data():
-    """Create synthetic data for demonstration purposes"""
-    engines = 100
-    cycles_per_engine = 200
-    
-    data = []
-    for engine in range(1, engines + 1):
-        max_cycle = np.random.randint(100, 300)
-        for cycle in range(1, max_cycle + 1):
-            # Create synthetic sensor readings
-            row = {
-                'unit_number': engine,
-                'cycle': cycle,
-                'max_cycle': max_cycle,
-                'RUL': max_cycle - cycle
-            }
-            
-            # Add synthetic sensor readings
-            for i in range(1, 20):
-                base_value = np.random.uniform(100, 1000)
-                noise = np.random.normal(0, base_value * 0.01)
-                degradation = cycle / max_cycle * np.random.uniform(0, base_value * 0.2)
-                row[f'sensor_{i}'] = base_value + noise + degradation
-            
-            data.append(row)
+        train_data = to_compact_dtypes(create_synthetic_data())
+        if columns is not None:
+            train_data = train_data[list(columns)]
+        return train_data
+
+def create_synthetic_data(engines=100, min_cycles=100, max_cycles=300, n_sensors=19, seed=None):
+    """Create synthetic data for demonstration purposes
+
+    Every engine runs for a random number of cycles in ``[min_cycles, max_cycles)``
+    and each sensor reading is a base value plus noise plus a degradation term
+    that grows with the fraction of life consumed. All rows are generated in a
+    single batched pass so large fleets can be produced quickly.
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Lifetime of each engine and the resulting row layout
+    engine_max_cycle = rng.integers(min_cycles, max_cycles, size=engines)
+    n_rows = int(engine_max_cycle.sum())
+    unit_number = np.repeat(np.arange(1, engines + 1), engine_max_cycle)
+    max_cycle = np.repeat(engine_max_cycle, engine_max_cycle)
+    
+    # Cycle counter restarting at 1 for every engine
+    starts = np.cumsum(engine_max_cycle) - engine_max_cycle
+    cycle = np.arange(1, n_rows + 1) - np.repeat(starts, engine_max_cycle)
+    
+    data = {
+        'unit_number': unit_number,
+        'cycle': cycle,
+        'max_cycle': max_cycle,
+        'RUL': max_cycle - cycle
+    }
+    
+    # Synthetic sensor readings: base value + 1% noise + up to 20% degradation,
+    # drawn in float32 and combined in place to keep large fleets cheap
+    shape = (n_sensors, n_rows)
+    life_fraction = (cycle / max_cycle).astype(np.float32)
+    readings = rng.random(size=shape, dtype=np.float32)
+    readings *= life_fraction
+    readings *= 0.2
+    readings += 1
+    readings += 0.01 * rng.standard_normal(size=shape, dtype=np.float32)
+    readings *= 100 + 900 * rng.random(size=shape, dtype=np.float32)
+    
+    for i in range(n_sensors):
+        data[f'sensor_{i + 1}'] = readings[i]
     
     return pd.DataFrame(data)
 
+def feature_matrix(data, columns, dtype=np.float32):
+    """Copy columns into one C-contiguous (rows x columns) array, a column at a time
+
+    Skips the intermediate DataFrame (and its block consolidation) that
+    ``data[columns].to_numpy()`` builds. Float32 is what the forest
+    evaluates on, so the model never converts it again.
+    """
+    X = np.empty((len(data), len(columns)), dtype=dtype)
+    for i, col in enumerate(columns):
+        X[:, i] = data[col].to_numpy()
+    return X
+
+def scale_in_place(X, scaler):
+    """Standardize a float32 feature matrix in place with a fitted scaler's statistics"""
+    # Same arithmetic as StandardScaler.transform(copy=False), statistics cast
+    # to the matrix dtype, without its per-call validation
+    X -= scaler.mean_.astype(X.dtype)
+    X /= scaler.scale_.astype(X.dtype)
+    return X
+
+def scale_features(data, columns, scaler):
+    """Scaled float32 feature matrix of ``data``, built once and scaled in place"""
+    return scale_in_place(feature_matrix(data, columns), scaler)
+
 def preprocess_data(data):
-    """Preprocess data for model training"""
+    """Preprocess data for model training
+
+    Returns the scaled float32, C-contiguous feature matrix, the RUL target,
+    the fitted scaler and the sensor columns. The matrix is the only full
+    copy made: the scaler is fitted in row chunks, which keeps its float64
+    temporaries small, and the matrix is then scaled in place.
+    """
     # Get sensor columns
     sensor_cols = [col for col in data.columns if 'sensor' in col]
     
     # Create feature matrix and target
-    X = data[sensor_cols]
+    X = feature_matrix(data, sensor_cols)
     y = data['RUL']
     
-    # Scale features
+    # Scale features; sklearn is imported here so loading data doesn't pay for it
+    from sklearn.preprocessing import StandardScaler
     scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    for start in range(0, len(X), config.SCALER_CHUNK_ROWS):
+        scaler.partial_fit(X[start:start + config.SCALER_CHUNK_ROWS])
+    X_scaled = scale_in_place(X, scaler)
     
-    return X_scaled, y, scaler, sensor_cols
\ No newline at end of file
+    return X_scaled, y, scaler, sensor_cols
@@ -0,0 +1,136 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+import app.config as config
+from app.utils.cache import LRUCache
+from app.utils.fleet_store import fleet_dtypes, read_fleet, read_fleet_csv, to_compact_dtypes, write_fleet
+
+SPLITS = ('train', 'test')
+
+# Column layout of the whitespace-separated C-MAPSS text files
+CMAPSS_COLUMNS = (
+    ['unit_number', 'cycle']
+    + [f'op_setting_{i}' for i in range(1, 4)]
+    + [f'sensor_{i}' for i in range(1, 22)]
+)
+
+def dataset_paths(dataset, split='train'):
+    """Candidate files for one subset and split, in the order they are tried"""
+    if dataset not in config.DATASETS:
+        raise KeyError(f"Unknown dataset {dataset!r}; expected one of {', '.join(config.DATASETS)}")
+    if split not in SPLITS:
+        raise KeyError(f"Unknown split {split!r}; expected one of {', '.join(SPLITS)}")
+    return {
+        'store': config.FLEET_STORE_TEMPLATE.format(dataset=dataset, split=split),
+        'csv': config.CSV_DATA_PATH.format(dataset=dataset, split=split),
+        'raw': config.RAW_DATA_PATH.format(dataset=dataset, split=split),
+        'rul': config.RAW_RUL_PATH.format(dataset=dataset),
+    }
+
+def add_rul(data, final_rul=None):
+    """Add max_cycle and RUL columns to run-to-failure or truncated trajectories
+
+    Training trajectories end at failure, so RUL counts down to 0 at each
+    engine's last cycle. Test trajectories stop early; ``final_rul`` gives
+    each engine's true RUL at its last recorded cycle (in unit_number order).
+    """
+    max_cycle = data.groupby('unit_number')['cycle'].transform('max')
+    rul = max_cycle - data['cycle']
+    if final_rul is not None:
+        units = np.sort(data['unit_number'].unique())
+        offsets = pd.Series(np.asarray(final_rul)[:len(units)], index=units)
+        rul = rul + data['unit_number'].map(offsets).to_numpy()
+    data = data.assign(max_cycle=max_cycle, RUL=rul)
+    columns = ['unit_number', 'cycle', 'max_cycle', 'RUL']
+    return to_compact_dtypes(data[columns + [col for col in data.columns if col not in columns]])
+
+def read_cmapss_txt(path, rul_path=None):
+    """Parse a raw C-MAPSS trajectory file (and the test set's RUL file) into a fleet frame"""
+    data = pd.read_csv(path, sep=r'\s+', header=None, names=CMAPSS_COLUMNS, dtype=fleet_dtypes(CMAPSS_COLUMNS))
+    final_rul = None
+    if rul_path is not None:
+        final_rul = pd.read_csv(rul_path, sep=r'\s+', header=None).iloc[:, 0].to_numpy()
+    return add_rul(data, final_rul)
+
+def read_dataset(dataset=None, split='train', columns=None):
+    """Read one subset from the first source that exists
+
+    Tries the columnar fleet store, then the preprocessed CSV, then the raw
+    C-MAPSS text files. Raises FileNotFoundError when none is present.
+    """
+    paths = dataset_paths(dataset or config.DEFAULT_DATASET, split)
+    if os.path.exists(paths['store']):
+        return read_fleet(paths['store'], columns)
+    if os.path.exists(paths['csv']):
+        return read_fleet_csv(paths['csv'], columns)
+    if os.path.exists(paths['raw']):
+        rul_path = paths['rul'] if split == 'test' else None
+        data = read_cmapss_txt(paths['raw'], rul_path)
+        return data if columns is None else data[list(columns)]
+    raise FileNotFoundError(f"No data found for {dataset or config.DEFAULT_DATASET} ({split})")
+
+def available_datasets():
+    """Subsets with at least a training file on disk"""
+    available = []
+    for dataset in config.DATASETS:
+        paths = dataset_paths(dataset)
+        if any(os.path.exists(paths[kind]) for kind in ('store', 'csv', 'raw')):
+            available.append(dataset)
+    return available
+
+class DatasetCatalog:
+    """Lazily loaded subsets, kept within a memory budget
+
+    ``loader(dataset, split)`` builds an entry on first access; entries must
+    expose ``nbytes``. When the loaded entries together exceed ``max_bytes``
+    the least recently used ones are evicted (the entry just requested is
+    always kept), so a process only holds the subsets it is serving.
+    """
+
+    def __init__(self, loader, max_bytes=None):
+        self.loader = loader
+        self.cache = LRUCache(
+            'datasets',
+            max_bytes=max_bytes or config.DATASET_CACHE_MAX_BYTES,
+            sizeof=lambda entry: entry.nbytes
+        )
+
+    @property
+    def max_bytes(self):
+        return self.cache.max_bytes
+
+    @property
+    def nbytes(self):
+        return self.cache.nbytes
+
+    def get(self, dataset=None, split='train'):
+        """Return the entry for a subset, loading it on first access"""
+        key = (dataset or config.DEFAULT_DATASET, split)
+        return self.cache.get_or_create(key, lambda: self.loader(*key))
+
+    def evict(self, dataset=None, split='train'):
+        """Drop a subset from memory"""
+        self.cache.pop((dataset or config.DEFAULT_DATASET, split))
+
+    def loaded(self):
+        """Loaded (dataset, split) keys with their size in bytes, least recently used first"""
+        return dict(self.cache.items())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert raw C-MAPSS subsets into columnar fleet stores")
+    parser.add_argument('datasets', nargs='*', default=list(config.DATASETS), help="Subsets to convert (default: all)")
+    args = parser.parse_args(argv)
+
+    for dataset in args.datasets:
+        for split in SPLITS:
+            paths = dataset_paths(dataset, split)
+            try:
+                data = read_dataset(dataset, split)
+            except FileNotFoundError:
+                print(f"Skipping {dataset} ({split}): no source files")
+                continue
+            print(f"Wrote {write_fleet(data, paths['store'])}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import numpy as np
+
+def _bucket_edges(n, n_buckets):
+    """Edges splitting rows 1..n-2 into ``n_buckets`` near-equal buckets (first and last rows are kept apart)"""
+    return np.linspace(1, n - 1, n_buckets + 1).astype(np.intp)
+
+def lttb_indices(x, y, n_out):
+    """Row positions kept by Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last points and, from each of ``n_out - 2`` buckets,
+    the point forming the largest triangle with the previously kept point
+    and the mean of the next bucket. Preserves the visual shape of a line
+    (peaks, drops) far better than taking every k-th point.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = _bucket_edges(n, n_out - 2)
+    # Mean point of every bucket, plus the last point as the final "next bucket"
+    x_means = np.append(np.add.reduceat(x[:-1], edges[:-1]) / np.diff(edges), x[-1])
+    y_means = np.append(np.add.reduceat(y[:-1], edges[:-1]) / np.diff(edges), y[-1])
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - x_means[i + 1]) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (y_means[i + 1] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+def minmax_indices(y, n_out):
+    """Row positions of the minimum and maximum of each bucket (plus both ends)
+
+    Cheaper than LTTB and fully vectorized; keeps every spike, which suits
+    noisy sensor traces.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    n_buckets = (n_out - 2) // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+
+    edges = _bucket_edges(n, n_buckets)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    inner = np.arange(1, n - 1)
+    # Sort by (bucket, y): each bucket's first entry is its min, last its max
+    order = inner[np.lexsort((y[1:-1], bucket))]
+    lows = order[edges[:-1] - 1]
+    highs = order[edges[1:] - 2]
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+def decimate_indices(x, y, budget, method='lttb'):
+    """Row positions to plot so a trace keeps at most ``budget`` points"""
+    if method == 'minmax':
+        return minmax_indices(y, budget)
+    if method == 'lttb':
+        return lttb_indices(x, y, budget)
+    raise ValueError(f"Unknown decimation method: {method}")
@@ -0,0 +1,130 @@
+import numpy as np
+
+class CompactForest:
+    """Flat NumPy export of a fitted RandomForestRegressor for low-latency scoring
+
+    All trees are concatenated into shared node arrays (feature, threshold,
+    children, leaf value). Prediction walks every tree for every row
+    at once, one tree level per step, which avoids sklearn's per-call joblib
+    dispatch and input validation. Leaves point to themselves, and (row, tree)
+    pairs drop out of the walk as soon as they reach one.
+    """
+
+    # Tree levels advanced between two compactions of the active set
+    LEVELS_PER_PASS = 4
+
+    def __init__(self, feature, threshold, children, value, roots, max_depth, n_features_in):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.n_features_in_ = n_features_in
+        self._is_leaf = None
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Export the trees of a fitted sklearn forest"""
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count, dtype=np.intp)
+            is_leaf = tree.children_left < 0
+
+            roots.append(offset)
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+            values.append(tree.value[:, 0, 0])
+
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            # Interleaved [left, right] pairs so a child is children[2 * node + go_right]
+            children=np.column_stack((np.concatenate(lefts), np.concatenate(rights))).ravel().astype(np.intp),
+            value=np.concatenate(values).astype(np.float64),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=max_depth,
+            n_features_in=model.n_features_in_,
+        )
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.feature, self.threshold, self.children, self.value, self.roots))
+
+    @property
+    def n_estimators(self):
+        return len(self.roots)
+
+    @property
+    def is_leaf(self):
+        if self._is_leaf is None:
+            self._is_leaf = self.children[::2] == np.arange(len(self.value))
+        return self._is_leaf
+
+    def apply(self, X):
+        """Return the leaf node reached by every row in every tree, shape (n_rows, n_trees)"""
+        # sklearn evaluates trees on float32 input
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[1]} features, but the forest expects {self.n_features_in_}")
+
+        n_rows, n_features = X.shape
+        flat_X = X.ravel()
+        nodes = np.tile(self.roots, n_rows)
+        row_offsets = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, self.n_estimators)
+
+        # Walk the (row, tree) pairs that have not reached a leaf yet, a few
+        # levels per pass (leaves are fixed points), then drop finished pairs
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        current = nodes[active]
+        row_offsets = row_offsets[active]
+        while current.size:
+            for _ in range(self.LEVELS_PER_PASS):
+                go_right = flat_X[row_offsets + self.feature[current]] > self.threshold[current]
+                current = self.children[2 * current + go_right]
+            nodes[active] = current
+            unfinished = ~self.is_leaf[current]
+            active = active[unfinished]
+            current = current[unfinished]
+            row_offsets = row_offsets[unfinished]
+
+        return nodes.reshape(n_rows, self.n_estimators)
+
+    def predict_trees(self, X):
+        """Per-tree predictions, shape (n_rows, n_trees)"""
+        return self.value[self.apply(X)]
+
+    def predict(self, X):
+        """Forest prediction: the mean of the per-tree predictions"""
+        return self.predict_trees(X).mean(axis=1)
+
+    def predict_quantiles(self, X, quantiles):
+        """Forest prediction and quantiles of the per-tree predictions, from one walk of the trees
+
+        Returns the (n_rows,) mean and an (n_rows, len(quantiles)) array.
+        """
+        trees = self.predict_trees(X)
+        return trees.mean(axis=1), tree_quantiles(trees, quantiles)
+
+def tree_quantiles(trees, quantiles):
+    """Quantiles across trees of a (n_rows, n_trees) prediction matrix, shape (n_rows, len(quantiles))
+
+    One sort per row, then linear interpolation between order statistics
+    (the same values as ``np.quantile``'s default method).
+    """
+    trees = np.sort(trees, axis=1)
+    positions = np.asarray(quantiles, dtype=np.float64) * (trees.shape[1] - 1)
+    below = np.floor(positions).astype(np.intp)
+    above = np.minimum(below + 1, trees.shape[1] - 1)
+    weight = positions - below
+    return trees[:, below] * (1 - weight) + trees[:, above] * weight
@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+import app.config as config
+from app.utils.cache import LRUCache
+from app.utils.fleet import FleetData, load_fleet
+from app.utils.parallel import FleetExecutor, get_executor
+from app.utils.profiling import profiled
+
+FEATURE_KINDS = ('mean', 'std', 'slope', 'ewm', 'delta', 'rate')
+
+# Feature fleets keyed by (dataset version, window, ewm_span)
+_feature_cache = LRUCache('features', max_bytes=config.FEATURE_CACHE_MAX_BYTES)
+
+def engine_row_starts(fleet):
+    """First row position of each row's engine, aligned with fleet.data"""
+    return _row_starts(fleet._starts, fleet._stops)
+
+def _row_starts(starts, stops):
+    return np.repeat(starts, stops - starts)
+
+def _cumulative(values):
+    """Cumulative sum along rows with a leading zero, so sum(values[:, a:b]) = c[:, b] - c[:, a]"""
+    cumulative = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,), dtype=np.float64)
+    np.cumsum(values, axis=-1, out=cumulative[..., 1:])
+    return cumulative
+
+def _grouped_ewm(values, starts, stops, span):
+    """Exponentially weighted mean (pandas ``adjust=True``) restarting at every engine
+
+    Steps through cycle offsets rather than engines: step t updates every
+    engine that has a t-th row at once, so the Python loop length is the
+    longest engine history, independent of fleet size.
+    """
+    decay = 1 - 2 / (span + 1)
+    lengths = stops - starts
+    offsets = np.arange(values.shape[-1]) - _row_starts(starts, stops)
+    engine_of_row = np.repeat(np.arange(len(lengths)), lengths)
+    order = np.argsort(offsets, kind='stable')
+    boundaries = np.cumsum(np.bincount(offsets))
+
+    numerator = np.zeros(values.shape[:-1] + (len(lengths),))
+    denominator = np.zeros(len(lengths))
+    result = np.empty_like(values)
+    start = 0
+    for stop in boundaries:
+        rows = order[start:stop]
+        engines = engine_of_row[rows]
+        numerator[..., engines] = values[..., rows] + decay * numerator[..., engines]
+        denominator[engines] = 1 + decay * denominator[engines]
+        result[..., rows] = numerator[..., engines] / denominator[engines]
+        start = stop
+    return result
+
+def _feature_block(raw, cycles, engine_starts, engine_stops, window, ewm_span, kinds):
+    """Feature matrices (sensors x rows) by kind for sensor-major readings of whole engines"""
+    n_rows = raw.shape[-1]
+    starts = _row_starts(engine_starts, engine_stops)
+    positions = np.arange(n_rows)
+    lower = np.maximum(positions - window + 1, starts)
+    count = (positions - lower + 1).astype(np.float64)
+
+    # Each engine is centered on its first reading so the sums stay small
+    first = raw[:, starts]
+    values = raw - first
+    cycles_centered = cycles - cycles[starts]
+
+    def window_sum(cumulative):
+        return cumulative[..., positions + 1] - cumulative[..., lower]
+
+    features = {}
+    cumulative_y = _cumulative(values)
+    sum_y = window_sum(cumulative_y)
+    mean = sum_y / count
+
+    if 'mean' in kinds:
+        features['mean'] = mean + first
+    if 'std' in kinds:
+        sum_yy = window_sum(_cumulative(values ** 2))
+        variance = np.maximum(sum_yy / count - mean ** 2, 0) * (count / np.maximum(count - 1, 1))
+        features['std'] = np.sqrt(variance)
+    if 'slope' in kinds:
+        sum_x = window_sum(_cumulative(cycles_centered))
+        sum_xx = window_sum(_cumulative(cycles_centered ** 2))
+        sum_xy = window_sum(_cumulative(values * cycles_centered))
+        denominator = count * sum_xx - sum_x ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (count * sum_xy - sum_x * sum_y) / denominator
+        features['slope'] = np.where(denominator > 0, slope, 0.0)
+    if 'ewm' in kinds:
+        features['ewm'] = _grouped_ewm(values, engine_starts, engine_stops, ewm_span) + first
+    if 'delta' in kinds or 'rate' in kinds:
+        # Baseline: mean of the first `window` cycles of each engine
+        first_stop = np.minimum(engine_starts + window, engine_stops)
+        baseline_sum = cumulative_y[:, first_stop] - cumulative_y[:, engine_starts]
+        baseline = baseline_sum / (first_stop - engine_starts)
+        delta = values - np.repeat(baseline, engine_stops - engine_starts, axis=1)
+        if 'delta' in kinds:
+            features['delta'] = delta
+        if 'rate' in kinds:
+            features['rate'] = delta / cycles
+    return features
+
+def _feature_shard(shard, window, ewm_span, kinds):
+    """Executor job: features of a shard whose last column is the cycle"""
+    raw = shard.values[:, :-1].T
+    cycles = shard.values[:, -1]
+    features = _feature_block(raw, cycles, shard.starts, shard.stops, window, ewm_span, kinds)
+    return np.concatenate(list(features.values())).T
+
+def compute_features(fleet, sensor_cols=None, window=None, ewm_span=None, kinds=FEATURE_KINDS, executor=None):
+    """Per-engine degradation features over the (unit_number, cycle)-sorted fleet
+
+    For every sensor computes trailing-window mean, std and least-squares
+    slope against cycle, an exponentially weighted mean, the deviation from
+    the engine's baseline (mean of its first ``window`` cycles) and that
+    deviation per cycle. Windows never cross engine boundaries. Everything is
+    computed with cumulative sums over the whole fleet, so there is no Python
+    loop over engines. With an ``executor`` (``FleetExecutor``) the fleet is
+    sharded by engine across its process pool instead. Returns a frame
+    aligned with ``fleet.data``.
+    """
+    window = window or config.FEATURE_WINDOW
+    ewm_span = ewm_span or config.FEATURE_EWM_SPAN
+    if sensor_cols is None:
+        sensor_cols = [col for col in fleet.data.columns if col.startswith('sensor') and col.count('_') == 1]
+    kinds = [kind for kind in FEATURE_KINDS if kind in kinds]
+
+    if executor is not None:
+        matrix = executor.map(
+            _feature_shard, fleet, list(sensor_cols) + ['cycle'], len(kinds) * len(sensor_cols),
+            args=(window, ewm_span, kinds), out_dtype=np.float32
+        )
+        features = dict(zip(kinds, np.split(matrix.T, len(kinds))))
+    else:
+        # Sensor-major layout keeps the cumulative sums contiguous
+        raw = fleet.data[sensor_cols].to_numpy(dtype=np.float64).T
+        cycles = fleet.data['cycle'].to_numpy(dtype=np.float64)
+        features = _feature_block(raw, cycles, fleet._starts, fleet._stops, window, ewm_span, kinds)
+
+    columns = {}
+    for kind, matrix in features.items():
+        matrix = matrix.astype(np.float32)
+        for i, sensor in enumerate(sensor_cols):
+            columns[f'{sensor}_{kind}'] = matrix[i]
+    return pd.DataFrame(columns, index=fleet.data.index)
+
+def _engine_std(shard):
+    """Executor job: sample std of every column within each engine of a shard"""
+    counts = shard.stops - shard.starts
+    values = shard.values - np.repeat(shard.values[shard.starts], counts, axis=0)
+    sums = np.add.reduceat(values, shard.starts, axis=0)
+    squares = np.add.reduceat(values ** 2, shard.starts, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (squares - sums ** 2 / counts[:, None]) / (counts[:, None] - 1)
+    return np.sqrt(np.maximum(variance, 0))
+
+def engine_sensor_std(fleet, sensor_cols=None, executor=None):
+    """Standard deviation of each sensor within each engine, indexed by unit_number"""
+    if sensor_cols is None:
+        sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
+    executor = executor or FleetExecutor(max_workers=1)
+    std = executor.map(_engine_std, fleet, sensor_cols, len(sensor_cols), per='engine')
+    return pd.DataFrame(std, index=pd.Index(fleet.engines, name='unit_number'), columns=sensor_cols)
+
+def add_features(fleet, **params):
+    """Return a new FleetData with the feature columns appended"""
+    features = compute_features(fleet, **params)
+    return FleetData(pd.concat([fleet.data, features], axis=1))
+
+@profiled()
+def load_feature_fleet(window=None, ewm_span=None, dataset=None):
+    """Fleet with feature columns, computed once per dataset version"""
+    fleet = load_fleet(dataset)
+    window = window or config.FEATURE_WINDOW
+    ewm_span = ewm_span or config.FEATURE_EWM_SPAN
+    return _feature_cache.get_or_create(
+        (fleet.version, window, ewm_span),
+        lambda: add_features(fleet, window=window, ewm_span=ewm_span, executor=get_executor())
+    )
+
+def load_engine_sensor_std(fleet):
+    """Per-engine sensor standard deviations, computed once per dataset version"""
+    return _feature_cache.get_or_create(
+        ('sensor_std', fleet.version),
+        lambda: engine_sensor_std(fleet, executor=get_executor())
+    )
@@ -0,0 +1,289 @@
+import numpy as np
+import pandas as pd
+import app.config as config
+from app.utils.cache import LRUCache
+from app.utils.data_processing import load_data
+from app.utils.datasets import DatasetCatalog, available_datasets
+from app.utils.fleet_store import fingerprint_data
+from app.utils.profiling import profiled, span
+from app.utils.status_cube import StatusCube, condition_labels, operator_labels
+
+# Dimensions the fleet's status counts are broken down by
+BREAKDOWN_DIMENSIONS = ('operator', 'condition')
+
+class FleetData:
+    """Fleet DataFrame sorted by (unit_number, cycle) with per-engine offsets
+
+    The frame is sorted once on construction so every engine occupies a
+    contiguous block of rows. Engine slices and (engine, cycle) lookups then
+    resolve through an offset table instead of scanning the whole fleet.
+    """
+
+    def __init__(self, data):
+        units = data['unit_number'].to_numpy()
+        cycles = data['cycle'].to_numpy()
+        if not _is_sorted(units, cycles):
+            order = np.lexsort((cycles, units))
+            data = data.take(order)
+        self.data = data.reset_index(drop=True)
+
+        self._units = self.data['unit_number'].to_numpy()
+        self._cycles = self.data['cycle'].to_numpy()
+
+        # Offset table: engine i occupies rows starts[i]:stops[i]
+        boundaries = np.flatnonzero(np.diff(self._units)) + 1
+        self._starts = np.concatenate(([0], boundaries))
+        self._stops = np.concatenate((boundaries, [len(self.data)]))
+        self.engines = self._units[self._starts].tolist() if len(self.data) else []
+        self._positions = {engine: i for i, engine in enumerate(self.engines)}
+        self._summary = None
+        self._version = None
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, engine):
+        return engine in self._positions
+
+    def engine_bounds(self, engine):
+        """Return the (start, stop) row range of an engine"""
+        i = self._positions[engine]
+        return int(self._starts[i]), int(self._stops[i])
+
+    def engine(self, engine):
+        """Return all cycles of one engine without scanning the fleet"""
+        start, stop = self.engine_bounds(engine)
+        return self.data.iloc[start:stop]
+
+    def engines_data(self, engines):
+        """Return a dict of engine -> engine data for several engines"""
+        return {engine: self.engine(engine) for engine in engines}
+
+    def row_position(self, engine, cycle):
+        """Return the row position of an (engine, cycle) pair, or None if absent"""
+        if engine not in self._positions:
+            return None
+        start, stop = self.engine_bounds(engine)
+        position = start + int(np.searchsorted(self._cycles[start:stop], cycle))
+        if position < stop and self._cycles[position] == cycle:
+            return position
+        return None
+
+    def row(self, engine, cycle):
+        """Return the single-row frame for an (engine, cycle) pair (empty if absent)"""
+        position = self.row_position(engine, cycle)
+        if position is None:
+            return self.data.iloc[0:0]
+        return self.data.iloc[position:position + 1]
+
+    def max_cycle(self, engine):
+        """Return the last recorded cycle of an engine"""
+        _, stop = self.engine_bounds(engine)
+        return int(self._cycles[stop - 1])
+
+    @property
+    def nbytes(self):
+        """Memory held by the fleet's columns"""
+        return int(self.data.memory_usage(index=True).sum())
+
+    def _insertion_points(self, rows):
+        """Rows not yet stored (sorted, first of any repeats) and the positions they slot in at"""
+        rows = rows.sort_values(['unit_number', 'cycle'], kind='stable')
+        keys = _sort_keys(self._units, self._cycles)
+        new_keys = _sort_keys(rows['unit_number'].to_numpy(), rows['cycle'].to_numpy())
+        positions = np.searchsorted(keys, new_keys)
+        duplicate = (positions < len(keys)) & (keys[np.minimum(positions, len(keys) - 1)] == new_keys)
+        duplicate[1:] |= new_keys[1:] == new_keys[:-1]
+        return rows[~duplicate], positions[~duplicate]
+
+    def new_records(self, rows):
+        """The records ``append`` would insert: those whose (unit_number, cycle) is not stored yet
+
+        Repeats within ``rows`` are kept once, and the result is sorted by
+        (unit_number, cycle).
+        """
+        return self._insertion_points(rows)[0]
+
+    def append(self, rows):
+        """Return a new FleetData with extra cycle records merged in place
+
+        Rows are slotted into their (unit_number, cycle) position by binary
+        search over the existing sort keys, so the fleet is not re-sorted.
+        Only ``new_records(rows)`` are inserted: records whose (unit_number,
+        cycle) already exists, or repeats an earlier record of the batch, are
+        ignored, and columns missing from the records (e.g. RUL for in-service
+        engines) are left empty. A summary already built for this fleet moves
+        to the new fleet and is refreshed for the engines that received rows
+        only; this fleet rebuilds its own if it is asked for again.
+
+        Each append still copies the fleet's rows once into the new frame and
+        rebuilds the offset table, so it costs O(fleet rows) plus O(batch
+        rows x log fleet rows), but nothing is re-sorted or re-summarized.
+        """
+        rows, positions = self._insertion_points(rows)
+        if rows.empty:
+            return self
+
+        # Final slot of each new row: its insertion point shifted by earlier inserts
+        merged = len(self.data) + len(rows)
+        is_new = np.zeros(merged, dtype=bool)
+        is_new[positions + np.arange(len(rows))] = True
+        order = np.empty(merged, dtype=np.intp)
+        order[~is_new] = np.arange(len(self.data))
+        order[is_new] = len(self.data) + np.arange(len(rows))
+
+        combined = pd.concat([self.data, rows.reindex(columns=self.data.columns)], ignore_index=True)
+        fleet = FleetData(combined.take(order))
+        if self._summary is not None:
+            # Moved rather than copied: the refresh only touches the new engines' rows
+            fleet._summary, self._summary = self._summary, None
+            fleet._summary.refresh(fleet, sorted(set(rows['unit_number'].tolist())))
+        return fleet
+
+    @property
+    def version(self):
+        """Content fingerprint identifying this dataset version"""
+        if self._version is None:
+            self._version = fingerprint_data(self.data)
+        return self._version
+
+    @property
+    def summary(self):
+        """Per-engine summary, built on first access and kept with the fleet"""
+        if self._summary is None:
+            with span('fleet_summary'):
+                self._summary = FleetSummary(self)
+        return self._summary
+
+def classify_status(rul):
+    """Bin RUL values into the Critical/Warning/Moderate/Good/Excellent statuses"""
+    return pd.cut(rul, bins=config.STATUS_BINS, labels=config.STATUS_LABELS)
+
+def breakdown_labels(fleet, engines):
+    """Operator and operating condition of each engine, taken from its latest cycle"""
+    positions = np.array([fleet._positions[engine] for engine in engines], dtype=np.intp)
+    latest = fleet.data.iloc[fleet._stops[positions] - 1]
+    return {'operator': operator_labels(latest), 'condition': condition_labels(latest)}
+
+def summarize_engines(fleet, engines=None, predicted_rul=None):
+    """Build one summary row per engine from its offset range
+
+    Each row holds the engine's max cycle, min RUL, latest sensor snapshot and
+    health status. Only the requested engines are touched. With
+    ``predicted_rul`` (a Series of RUL estimates indexed by engine) a
+    predicted_RUL column is added and the status is binned on it instead.
+    """
+    if engines is None:
+        engines = fleet.engines
+    positions = np.array([fleet._positions[engine] for engine in engines], dtype=np.intp)
+    starts = fleet._starts[positions]
+    stops = fleet._stops[positions]
+
+    # Latest snapshot is the last row of each engine block
+    sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
+    summary = fleet.data.iloc[stops - 1][sensor_cols].set_axis(pd.Index(engines, name='unit_number'))
+    summary.insert(0, 'max_cycle', fleet._cycles[stops - 1])
+
+    if 'RUL' in fleet.data.columns and len(engines):
+        # Reduce over interleaved (start, stop) offsets; a trailing sentinel
+        # keeps every stop a valid index and the odd slots are discarded
+        rul = np.append(fleet.data['RUL'].to_numpy(), 0)
+        bounds = np.column_stack((starts, stops)).ravel()
+        summary.insert(1, 'min_RUL', np.minimum.reduceat(rul, bounds)[::2])
+    else:
+        summary.insert(1, 'min_RUL', np.nan)
+
+    rul_column = 'min_RUL'
+    if predicted_rul is not None:
+        rul_column = 'predicted_RUL'
+        summary.insert(2, rul_column, predicted_rul.reindex(summary.index).to_numpy(dtype=np.float64))
+
+    summary['Status'] = classify_status(summary[rul_column])
+    return summary
+
+class FleetSummary:
+    """Per-engine summary table and the fleet metrics derived from it
+
+    Built once per fleet so Dashboard reruns only read precomputed values.
+    Status counts are kept in a StatusCube broken down by operator and
+    operating condition, and the lifecycle/critical totals as running sums;
+    ``refresh`` recomputes the rows of engines that received new data and
+    moves only their counts. Health (status, critical count) comes from the
+    recorded min RUL, or from model estimates when built with
+    ``predicted_rul``; ``rul_column`` names the column in use.
+    """
+
+    def __init__(self, fleet, predicted_rul=None):
+        self.rul_column = 'min_RUL' if predicted_rul is None else 'predicted_RUL'
+        self.engines = summarize_engines(fleet, predicted_rul=predicted_rul)
+        self.cube = StatusCube(BREAKDOWN_DIMENSIONS)
+        self.cube.update(self.engines.index, self.engines['Status'], **breakdown_labels(fleet, self.engines.index))
+        self._lifecycle_total = float(self.engines['max_cycle'].sum())
+        self.critical_engines = int((self.engines[self.rul_column] < config.CRITICAL_RUL).sum())
+        self._update_metrics()
+
+    def refresh(self, fleet, engines, predicted_rul=None):
+        """Recompute the summary rows of the given engines only
+
+        A summary built from predictions needs the new ``predicted_rul`` of
+        those engines.
+        """
+        if self.rul_column == 'predicted_RUL' and predicted_rul is None:
+            raise ValueError("A predicted-RUL summary is refreshed with the engines' new predicted_rul")
+        rows = summarize_engines(fleet, engines, predicted_rul=predicted_rul)
+        existing = rows.index.intersection(self.engines.index)
+        previous = self.engines.loc[existing]
+        rul = self.rul_column
+        self._lifecycle_total += float(rows['max_cycle'].sum() - previous['max_cycle'].sum())
+        self.critical_engines += int(
+            (rows[rul] < config.CRITICAL_RUL).sum() - (previous[rul] < config.CRITICAL_RUL).sum()
+        )
+
+        self.engines.loc[existing] = rows.loc[existing]
+        new = rows.index.difference(self.engines.index)
+        if len(new):
+            self.engines = pd.concat([self.engines, rows.loc[new]]).sort_index()
+        self.cube.update(rows.index, rows['Status'], **breakdown_labels(fleet, rows.index))
+        self._update_metrics()
+
+    def _update_metrics(self):
+        self.total_engines = len(self.engines)
+        self.avg_lifecycle = round(self._lifecycle_total / self.total_engines, 1) if self.total_engines else 0.0
+        self.status_counts = self.cube.histogram()
+
+def _sort_keys(units, cycles):
+    """Single int64 key ordering rows by (unit_number, cycle)"""
+    return units.astype(np.int64) << 32 | cycles.astype(np.int64)
+
+def _is_sorted(units, cycles):
+    """Check whether rows are already ordered by (unit_number, cycle)"""
+    if len(units) < 2:
+        return True
+    unit_step = np.diff(units)
+    cycle_step = np.diff(cycles)
+    return bool(np.all((unit_step > 0) | ((unit_step == 0) & (cycle_step > 0))))
+
+# Per-process catalog of fleets, one per loaded subset
+catalog = DatasetCatalog(lambda dataset, split: FleetData(load_data(dataset=dataset, split=split)))
+
+@profiled()
+def load_fleet(dataset=None, split='train'):
+    """Load a subset once and index it by engine"""
+    return catalog.get(dataset, split)
+
+# Cross-subset status cubes keyed by the subsets' versions
+_cube_cache = LRUCache('status_cubes', max_entries=config.STATUS_CUBE_CACHE_ENTRIES)
+
+@profiled()
+def load_status_cube(datasets=None):
+    """Status counts across subsets, with a leading 'dataset' dimension
+
+    Stacked from each subset's summary cube, once per combination of
+    dataset versions. Defaults to every subset available on disk.
+    """
+    datasets = list(datasets or available_datasets() or [config.DEFAULT_DATASET])
+    fleets = {dataset: load_fleet(dataset) for dataset in datasets}
+    key = tuple((dataset, fleet.version) for dataset, fleet in fleets.items())
+    return _cube_cache.get_or_create(
+        key, lambda: StatusCube.stack({dataset: fleet.summary.cube for dataset, fleet in fleets.items()}, 'dataset')
+    )
@@ -0,0 +1,87 @@
+import argparse
+import hashlib
+import os
+import time
+import numpy as np
+import pandas as pd
+import app.config as config
+
+# Compact on-disk schema: counters fit in int16, sensor readings in float32
+INDEX_DTYPE = np.int16
+SENSOR_DTYPE = np.float32
+INDEX_COLUMNS = ['unit_number', 'cycle', 'max_cycle', 'RUL']
+SENSOR_PREFIXES = ('sensor', 'op_setting')
+
+def fleet_dtypes(columns):
+    """Map each known fleet column to its compact dtype"""
+    dtypes = {}
+    for col in columns:
+        if col in INDEX_COLUMNS:
+            dtypes[col] = INDEX_DTYPE
+        elif col.startswith(SENSOR_PREFIXES):
+            dtypes[col] = SENSOR_DTYPE
+    return dtypes
+
+def to_compact_dtypes(data):
+    """Cast a fleet DataFrame to the compact schema"""
+    return data.astype(fleet_dtypes(data.columns))
+
+def fingerprint_data(data):
+    """Content hash of a fleet DataFrame"""
+    row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update(','.join(map(str, data.columns)).encode())
+    return digest.hexdigest()
+
+def read_fleet_csv(csv_path, columns=None):
+    """Read a fleet CSV with explicit compact dtypes instead of inferring them"""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    return pd.read_csv(csv_path, usecols=columns, dtype=fleet_dtypes(header))
+
+def write_fleet(data, store_path):
+    """Write a fleet DataFrame to a columnar store (Parquet or Feather by extension)"""
+    directory = os.path.dirname(store_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    data = to_compact_dtypes(data).reset_index(drop=True)
+    if store_path.endswith('.feather'):
+        data.to_feather(store_path)
+    else:
+        data.to_parquet(store_path, index=False)
+    return store_path
+
+def read_fleet(store_path, columns=None):
+    """Read only the requested columns from a columnar fleet store
+
+    ``store_path`` may also be a directory of Parquet part files.
+    """
+    if columns is not None:
+        columns = list(columns)
+    if store_path.endswith('.feather'):
+        return pd.read_feather(store_path, columns=columns)
+    return pd.read_parquet(store_path, columns=columns)
+
+def append_fleet_part(data, store_dir):
+    """Append a batch of records to a Parquet dataset directory as a new part file"""
+    os.makedirs(store_dir, exist_ok=True)
+    part_path = os.path.join(store_dir, f"part-{time.time_ns()}.parquet")
+    to_compact_dtypes(data).reset_index(drop=True).to_parquet(part_path, index=False)
+    return part_path
+
+def ingest_csv(csv_path, store_path=None):
+    """Convert a C-MAPSS CSV into the columnar fleet store"""
+    store_path = store_path or config.FLEET_STORE_PATH
+    return write_fleet(read_fleet_csv(csv_path), store_path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a fleet CSV into the columnar fleet store")
+    parser.add_argument('csv_path', nargs='?', default=config.DATA_PATH, help="Source CSV file")
+    parser.add_argument('--output', default=config.FLEET_STORE_PATH, help="Target .parquet or .feather file")
+    args = parser.parse_args(argv)
+
+    store_path = ingest_csv(args.csv_path, args.output)
+    print(f"Wrote {store_path}")
+
+if __name__ == '__main__':
+    main()
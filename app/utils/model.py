@@ -1,17 +1,33 @@
+import warnings
 import pandas as pd
 import numpy as np
-import streamlit as st
 from sklearn.ensemble import RandomForestRegressor
-from app.utils.data_processing import preprocess_data
+from app.utils.cache import LRUCache, frame_fingerprint
+from app.utils.data_processing import preprocess_data, scale_features, scale_in_place
+from app.utils.fast_forest import CompactForest, tree_quantiles
+from app.utils.features import load_feature_fleet
+from app.utils.fleet import FleetSummary, load_fleet
+from app.utils.model_registry import latest_version, load_model_artifact
+from app.utils.parallel import get_executor
+from app.utils.profiling import profiled
+import app.config as config
 
-@st.cache_resource
-def train_model(data):
-    """Train a machine learning model for RUL prediction"""
+# Trained and loaded models, keyed by ('trained', data version) or ('artifact', model version)
+_model_cache = LRUCache('models', max_entries=config.MODEL_CACHE_MAX_ENTRIES)
+
+# Predicted-RUL fleet summaries keyed by (model version, dataset version)
+_health_cache = LRUCache('fleet_health', max_entries=config.FLEET_HEALTH_CACHE_MAX_ENTRIES)
+
+def fit_model(data, n_estimators=50, **params):
+    """Fit the RUL model and its scaler on a training DataFrame
+
+    Extra keyword arguments are passed to ``RandomForestRegressor``.
+    """
     # Preprocess data
     X_scaled, y, scaler, sensor_cols = preprocess_data(data)
     
     # Train model
-    model = RandomForestRegressor(n_estimators=50, random_state=42, n_jobs=-1)
+    model = RandomForestRegressor(n_estimators=n_estimators, random_state=42, n_jobs=-1, **params)
     model.fit(X_scaled, y)
     
     # Get feature importance
@@ -20,20 +36,218 @@ def train_model(data):
         'Importance': model.feature_importances_
     }).sort_values('Importance', ascending=False)
     
+    return model, scaler, sensor_cols, importance
+
+@profiled('train_model')
+def _train(data):
+    model, scaler, _, importance = fit_model(data)
+    return model, scaler, importance, CompactForest.from_sklearn(model)
+
+def _trained_model(data, data_version=None):
+    """(key, (model, scaler, importance, forest)) trained once per dataset version
+
+    Without an explicit ``data_version`` the key is a sampled fingerprint of
+    ``data``, so a lookup never hashes the whole frame.
+    """
+    key = ('trained', data_version or frame_fingerprint(data))
+    return key, _model_cache.get_or_create(key, lambda: _train(data))
+
+def train_model(data, data_version=None):
+    """Train a machine learning model for RUL prediction"""
+    model, scaler, importance, _ = _trained_model(data, data_version)[1]
     return model, scaler, importance
 
-def predict_rul(model, scaler, engine_data, cycle, sensor_cols):
+@profiled('load_model')
+def _load_artifact(version):
+    artifact = load_model_artifact(version)
+    if 'forest' not in artifact:
+        artifact['forest'] = CompactForest.from_sklearn(artifact['model'])
+    return artifact
+
+def load_model(version):
+    """Load a persisted model artifact once per process"""
+    return _model_cache.get_or_create(('artifact', version), lambda: _load_artifact(version))
+
+def artifact_version(dataset=None):
+    """Latest registered model version trained on a C-MAPSS subset, or None"""
+    return latest_version(dataset=dataset or config.DEFAULT_DATASET)
+
+@profiled('get_model')
+def get_versioned_model(data, data_version=None, dataset=None):
+    """Return (model version, (model, scaler, importance, forest)) as chosen by ``get_model``
+
+    The version is ('artifact', registry version) or ('trained', data
+    version), a stable key for results derived from the model.
+    """
+    version = artifact_version(dataset)
+    if version is not None:
+        artifact = load_model(version)
+        if set(artifact['sensor_cols']).issubset(data.columns):
+            data_hash = artifact['metadata'].get('data_hash')
+            if data_version is not None and data_hash != data_version:
+                warnings.warn(
+                    f"Model {version} was trained on data {str(data_hash)[:12]}, "
+                    f"not the loaded data {data_version[:12]}; retrain it with train.py",
+                    stacklevel=3
+                )
+            return ('artifact', version), (artifact['model'], artifact['scaler'], artifact['importance'], artifact['forest'])
+    
+    return _trained_model(data, data_version)
+
+def get_model(data, data_version=None, dataset=None):
+    """Return (model, scaler, importance, forest), preferring the persisted artifact
+
+    Only an artifact trained on the same ``dataset`` subset is used; without
+    one, or when the artifact's sensors are missing from ``data``, a model is
+    trained in-process, keyed by ``data_version`` (e.g. ``FleetData.version``).
+    An artifact whose recorded data hash differs from ``data_version`` is
+    still used, with a warning that it was trained on other data.
+    """
+    return get_versioned_model(data, data_version, dataset)[1]
+
+def load_model_fleet(dataset=None):
+    """Return a subset's fleet with the columns the registered model was trained on
+
+    Models trained with the rolling feature stage get the feature fleet
+    (computed once per dataset version); otherwise the raw fleet is used.
+    """
+    version = artifact_version(dataset)
+    if version is not None:
+        feature_params = load_model(version)['metadata'].get('features')
+        if feature_params:
+            return load_feature_fleet(dataset=dataset, **feature_params)
+    return load_fleet(dataset)
+
+def interval_quantiles(interval=None):
+    """Lower and upper quantiles of a central prediction interval with the given coverage
+
+    Raises ValueError unless the coverage is strictly between 0 and 1.
+    """
+    interval = config.PREDICTION_INTERVAL if interval is None else interval
+    if not 0 < interval < 1:
+        raise ValueError(f"Prediction interval coverage must be between 0 and 1, got {interval}")
+    tail = (1 - interval) / 2
+    return (tail, 1 - tail)
+
+def tree_predictions(model, X, forest=None):
+    """Per-tree predictions, shape (n_rows, n_trees)
+
+    Small batches walk the compact ``forest`` once for all trees; larger
+    ones (or without a forest) ask each sklearn tree in turn.
+    """
+    if forest is not None and len(X) <= config.FAST_FOREST_MAX_ROWS:
+        return forest.predict_trees(X)
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    return np.column_stack([estimator.predict(X, check_input=False) for estimator in model.estimators_])
+
+@profiled()
+def predict_rul_batch(model, scaler, data, sensor_cols, pairs=None, forest=None, interval=None):
+    """Predict RUL for many (engine, cycle) rows with a single scale + predict call
+
+    ``pairs`` selects rows by (unit_number, cycle), either as an iterable of
+    tuples or a DataFrame with those columns; by default every row of ``data``
+    is scored. When a compact ``forest`` is given it scores small batches,
+    where sklearn's per-call overhead dominates. With an ``interval``
+    coverage (e.g. 0.8) the per-tree predictions are kept and RUL_lower /
+    RUL_upper give that central interval across trees. Returns a frame with
+    unit_number, cycle, predicted_RUL, the interval columns when requested
+    and the actual RUL when it is available.
+    """
+    if pairs is not None:
+        pairs = pd.DataFrame(pairs, columns=['unit_number', 'cycle'])
+        data = pairs.merge(data, on=['unit_number', 'cycle'], how='inner')
+    
+    result = data[['unit_number', 'cycle']].reset_index(drop=True)
+    if data.empty:
+        result['predicted_RUL'] = pd.Series(dtype=float)
+        if interval is not None:
+            interval_quantiles(interval)  # Same validation as a non-empty batch
+            result['RUL_lower'] = pd.Series(dtype=float)
+            result['RUL_upper'] = pd.Series(dtype=float)
+    else:
+        features_scaled = scale_features(data, sensor_cols, scaler)
+        if interval is not None:
+            # One pass over the tree outputs gives the point estimate and the interval
+            trees = tree_predictions(model, features_scaled, forest=forest)
+            bounds = tree_quantiles(trees, interval_quantiles(interval))
+            result['predicted_RUL'] = trees.mean(axis=1)
+            result['RUL_lower'] = bounds[:, 0]
+            result['RUL_upper'] = bounds[:, 1]
+        elif forest is not None and len(data) <= config.FAST_FOREST_MAX_ROWS:
+            result['predicted_RUL'] = forest.predict(features_scaled)
+        else:
+            result['predicted_RUL'] = model.predict(features_scaled)
+    
+    if 'RUL' in data.columns:
+        result['RUL'] = data['RUL'].to_numpy()
+    
+    return result
+
+def _score_shard(shard, scaler, estimator):
+    """Executor job: predicted RUL of every row of a shard
+
+    The job owns its float32 input rows, so they are scaled in place.
+    """
+    return estimator.predict(scale_in_place(shard.values, scaler))[:, None]
+
+@profiled()
+def predict_rul_fleet(model, scaler, fleet, sensor_cols, forest=None, executor=None):
+    """Predict RUL for every row of a FleetData, sharded by engine across a process pool
+
+    Rows are copied into float32 shards, scaled in place inside the
+    workers and scored with the compact ``forest`` when given (its arrays are
+    cheaper to ship to workers than the sklearn model). Small fleets are
+    scored in-process. Returns the same frame as ``predict_rul_batch``.
+    """
+    executor = executor or get_executor()
+    estimator = forest if forest is not None else model
+    predictions = executor.map(
+        _score_shard, fleet, sensor_cols, 1, args=(scaler, estimator), dtype=np.float32
+    )
+    
+    result = fleet.data[['unit_number', 'cycle']].copy()
+    result['predicted_RUL'] = predictions[:, 0]
+    if 'RUL' in fleet.data.columns:
+        result['RUL'] = fleet.data['RUL'].to_numpy()
+    
+    return result
+
+def predict_latest_rul(model, scaler, fleet, sensor_cols, forest=None):
+    """Predicted RUL at every engine's latest cycle, from one batched predict"""
+    latest = fleet.data.iloc[fleet._stops - 1]
+    predictions = predict_rul_batch(model, scaler, latest, sensor_cols, forest=forest)
+    return pd.Series(
+        predictions['predicted_RUL'].to_numpy(),
+        index=pd.Index(fleet.engines, name='unit_number'),
+        name='predicted_RUL'
+    )
+
+@profiled()
+def load_fleet_health(dataset=None):
+    """Fleet summary whose health comes from predicted rather than recorded RUL
+
+    Every engine's latest cycle is scored in a single batch, once per model
+    and dataset version.
+    """
+    fleet = load_model_fleet(dataset)
+    model_version, (model, scaler, _, forest) = get_versioned_model(fleet.data, fleet.version, dataset=dataset)
+    sensor_cols = [col for col in fleet.data.columns if 'sensor' in col]
+    
+    def build():
+        predicted_rul = predict_latest_rul(model, scaler, fleet, sensor_cols, forest=forest)
+        return FleetSummary(fleet, predicted_rul=predicted_rul)
+    
+    return _health_cache.get_or_create((model_version, fleet.version), build)
+
+def predict_rul(model, scaler, engine_data, cycle, sensor_cols, forest=None):
     """Predict RUL for a specific engine at a specific cycle"""
-    # Get data for that cycle
+    if not set(sensor_cols).issubset(engine_data.columns):
+        return None
+    
     cycle_data = engine_data[engine_data['cycle'] == cycle]
+    predictions = predict_rul_batch(model, scaler, cycle_data, sensor_cols, forest=forest)
     
-    if not cycle_data.empty and set(sensor_cols).issubset(cycle_data.columns):
-        features = cycle_data[sensor_cols].values
-        
-        # Scale and predict
-        features_scaled = scaler.transform(features)
-        prediction = model.predict(features_scaled)[0]
-        
-        return prediction
+    if not predictions.empty:
+        return predictions['predicted_RUL'].iloc[0]
     
-    return None
\ No newline at end of file
+    return None
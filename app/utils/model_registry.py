@@ -0,0 +1,117 @@
+import json
+import os
+import time
+import joblib
+import sklearn
+import app.config as config
+from app.utils.fast_forest import CompactForest
+
+ARTIFACT_FILE = 'model.joblib'
+METADATA_FILE = 'metadata.json'
+LATEST_FILE = 'LATEST'
+
+def save_model_artifact(model, scaler, sensor_cols, importance, data_hash, params=None, metrics=None,
+                        feature_params=None, dataset=None, models_dir=None):
+    """Persist a trained model with its scaler, feature list and importance table
+
+    ``feature_params`` records the rolling feature stage settings the model
+    was trained with (None for raw sensors only) and ``dataset`` the C-MAPSS
+    subset. The compact forest export is stored alongside the sklearn model.
+    Artifacts are written uncompressed so they can be memory-mapped on load,
+    and the registry's LATEST pointer (plus the subset's own pointer when
+    ``dataset`` is given) is switched atomically once the files are
+    complete. Returns the new version string.
+    """
+    models_dir = models_dir or config.MODELS_DIR
+    version = f"{time.strftime('%Y%m%d-%H%M%S')}-{data_hash[:12]}"
+    version_dir = os.path.join(models_dir, version)
+    os.makedirs(version_dir, exist_ok=True)
+
+    artifact = {
+        'model': model,
+        'scaler': scaler,
+        'sensor_cols': list(sensor_cols),
+        'importance': importance,
+        'forest': CompactForest.from_sklearn(model),
+    }
+    joblib.dump(artifact, os.path.join(version_dir, ARTIFACT_FILE), compress=0)
+
+    metadata = {
+        'version': version,
+        'data_hash': data_hash,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sensor_cols': list(sensor_cols),
+        'params': params or {},
+        'metrics': metrics or {},
+        'features': feature_params,
+        'dataset': dataset,
+        'sklearn_version': sklearn.__version__,
+    }
+    with open(os.path.join(version_dir, METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    pointers = [LATEST_FILE] + ([latest_file(dataset)] if dataset else [])
+    for pointer in pointers:
+        latest_tmp = os.path.join(models_dir, pointer + '.tmp')
+        with open(latest_tmp, 'w') as f:
+            f.write(version)
+        os.replace(latest_tmp, os.path.join(models_dir, pointer))
+
+    return version
+
+def latest_file(dataset=None):
+    """Name of the LATEST pointer file, per C-MAPSS subset when one is given"""
+    return f"{LATEST_FILE}-{dataset}" if dataset else LATEST_FILE
+
+def list_versions(models_dir=None):
+    """List the stored model versions, oldest first"""
+    models_dir = models_dir or config.MODELS_DIR
+    if not os.path.isdir(models_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(models_dir)
+        if os.path.isfile(os.path.join(models_dir, name, ARTIFACT_FILE))
+    )
+
+def latest_version(models_dir=None, dataset=None):
+    """Return the version the LATEST pointer refers to, or None
+
+    With a ``dataset`` only a model trained on that subset is returned: its
+    own pointer, or the global one when that model's metadata names the
+    subset (registries written before per-subset pointers existed).
+    """
+    models_dir = models_dir or config.MODELS_DIR
+    versions = list_versions(models_dir)
+    for pointer in ([latest_file(dataset)] if dataset else []) + [LATEST_FILE]:
+        try:
+            with open(os.path.join(models_dir, pointer)) as f:
+                version = f.read().strip()
+        except OSError:
+            continue
+        if version not in versions:
+            continue
+        if pointer == LATEST_FILE and dataset and load_metadata(version, models_dir).get('dataset') != dataset:
+            return None
+        return version
+    return None
+
+def load_metadata(version, models_dir=None):
+    """Read a stored version's metadata without loading the model"""
+    models_dir = models_dir or config.MODELS_DIR
+    with open(os.path.join(models_dir, version, METADATA_FILE)) as f:
+        return json.load(f)
+
+def load_model_artifact(version=None, models_dir=None, mmap_mode='r'):
+    """Load a model artifact (the latest one by default)
+
+    NumPy arrays inside the artifact are memory-mapped read-only, so several
+    worker processes loading the same version share the pages.
+    """
+    models_dir = models_dir or config.MODELS_DIR
+    version = version or latest_version(models_dir)
+    if version is None:
+        raise FileNotFoundError(f"No model artifact found in {models_dir}")
+
+    artifact = joblib.load(os.path.join(models_dir, version, ARTIFACT_FILE), mmap_mode=mmap_mode)
+    artifact['metadata'] = load_metadata(version, models_dir)
+    return artifact
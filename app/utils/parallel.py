@@ -0,0 +1,177 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import app.config as config
+
+class SharedArray:
+    """NumPy array backed by a named shared-memory block
+
+    Pool workers attach to the block by name, so arrays cross the process
+    boundary without being pickled. The creating process owns the block and
+    must ``unlink`` it; attached processes only ``close`` their mapping.
+    """
+
+    def __init__(self, shape, dtype, name=None):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.spec = (self.shm.name, tuple(shape), dtype.str)
+
+    @classmethod
+    def attach(cls, spec):
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    def close(self):
+        # Views into the buffer must be gone before the mapping can be closed
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.close()
+        self.shm.unlink()
+
+class EngineShard:
+    """Rows of a contiguous run of engines, as seen by a job
+
+    ``values`` holds the requested columns (rows x columns) and engine ``i``
+    of the shard occupies rows ``starts[i]:stops[i]`` of it.
+    """
+
+    def __init__(self, values, starts, stops):
+        self.values = values
+        self.starts = starts
+        self.stops = stops
+
+    def __len__(self):
+        return len(self.values)
+
+def shard_engines(starts, stops, n_shards):
+    """Split engines into at most ``n_shards`` contiguous runs of similar row counts"""
+    if len(starts) == 0:
+        return []
+    targets = np.arange(1, n_shards) * stops[-1] / n_shards
+    cuts = np.searchsorted(stops, targets, side='left') + 1
+    bounds = np.unique(np.concatenate(([0], cuts, [len(starts)])))
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+def _run_shard(func, args, values, out, starts, stops):
+    """Run a job on one shard and store its result in the shard's slice of ``out``"""
+    shard = EngineShard(values, starts, stops)
+    out[...] = func(shard, *args)
+
+def _run_shared_shard(task):
+    """Pool task: attach to the shared input/output blocks and run one shard"""
+    func, args, values_spec, out_spec, row_range, out_range, starts, stops = task
+    values, out = SharedArray.attach(values_spec), SharedArray.attach(out_spec)
+    try:
+        _run_shard(
+            func, args,
+            values.array[row_range[0]:row_range[1]],
+            out.array[out_range[0]:out_range[1]],
+            starts, stops
+        )
+    finally:
+        values.close()
+        out.close()
+    return out_range
+
+class FleetExecutor:
+    """Runs per-engine jobs over a fleet, sharded by ``unit_number`` across a process pool
+
+    The requested columns are copied once into shared memory and every worker
+    reads its shard of engines from there; results are written into a shared
+    output array at the shard's rows (or engines), so neither inputs nor
+    outputs are pickled and the result order never depends on scheduling.
+    A job is a module-level function ``func(shard, *args)`` returning an
+    array with one row per shard row (``per='row'``) or per shard engine
+    (``per='engine'``). Fleets under ``min_rows`` rows, or a single worker,
+    run in-process over the same shards.
+    """
+
+    def __init__(self, max_workers=None, min_rows=None, shards_per_worker=2):
+        self.max_workers = max_workers or config.PARALLEL_WORKERS or os.cpu_count() or 1
+        self.min_rows = config.PARALLEL_MIN_ROWS if min_rows is None else min_rows
+        self.shards_per_worker = shards_per_worker
+        self._pool = None
+
+    def workers_for(self, n_rows):
+        """Worker processes used for a fleet of ``n_rows`` rows (1 means in-process)"""
+        return 1 if n_rows < self.min_rows else self.max_workers
+
+    @property
+    def pool(self):
+        # Created on first use and reused; forkserver avoids forking the
+        # (multithreaded) Streamlit server process
+        if self._pool is None:
+            context = multiprocessing.get_context(config.PARALLEL_START_METHOD)
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return self._pool
+
+    def map(self, func, fleet, columns, width, args=(), per='row', dtype=np.float64, out_dtype=np.float64):
+        """Run ``func`` over the engines of ``fleet`` and return the stacked (n, width) result"""
+        starts, stops = fleet._starts, fleet._stops
+        n_out = len(fleet) if per == 'row' else len(starts)
+        workers = self.workers_for(len(fleet))
+        bounds = shard_engines(starts, stops, workers * self.shards_per_worker)
+
+        if workers == 1 or len(bounds) <= 1:
+            values = _column_block(fleet, columns, np.empty((len(fleet), len(columns)), dtype=dtype))
+            out = np.empty((n_out, width), dtype=out_dtype)
+            for row_range, out_range, shard_starts, shard_stops in _shard_tasks(bounds, starts, stops, per):
+                _run_shard(
+                    func, args,
+                    values[row_range[0]:row_range[1]], out[out_range[0]:out_range[1]],
+                    shard_starts, shard_stops
+                )
+            return out
+
+        values = SharedArray((len(fleet), len(columns)), dtype)
+        out = SharedArray((n_out, width), out_dtype)
+        try:
+            _column_block(fleet, columns, values.array)
+            tasks = [
+                (func, args, values.spec, out.spec, row_range, out_range, shard_starts, shard_stops)
+                for row_range, out_range, shard_starts, shard_stops in _shard_tasks(bounds, starts, stops, per)
+            ]
+            list(self.pool.map(_run_shared_shard, tasks))
+            return out.array.copy()
+        finally:
+            values.unlink()
+            out.unlink()
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+def _column_block(fleet, columns, out):
+    """Fill a (rows x columns) array from the fleet one column at a time"""
+    for i, col in enumerate(columns):
+        out[:, i] = fleet.data[col].to_numpy()
+    return out
+
+def _shard_tasks(bounds, starts, stops, per):
+    """Row range, output range and shard-relative engine offsets of every shard"""
+    for lo, hi in bounds:
+        row_lo, row_hi = int(starts[lo]), int(stops[hi - 1])
+        out_range = (row_lo, row_hi) if per == 'row' else (lo, hi)
+        yield (row_lo, row_hi), out_range, starts[lo:hi] - row_lo, stops[lo:hi] - row_lo
+
+_default_executor = None
+
+def get_executor():
+    """Process-wide executor shared by fleet-wide feature and scoring jobs"""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = FleetExecutor()
+    return _default_executor
@@ -0,0 +1,148 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+import pandas as pd
+
+# Active profiler of the current thread; Streamlit runs each session's
+# script in its own thread, so spans from concurrent sessions don't mix
+_local = threading.local()
+
+def rss_bytes():
+    """Resident memory of this process in bytes, or None where it can't be read"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+class Profiler:
+    """Timed spans of one run of a page, e.g. a single Streamlit rerun
+
+    Each span records its wall time and the change in resident memory
+    while it ran. Spans nest: a span's ``path`` joins the names of the spans
+    it was opened in.
+    """
+
+    def __init__(self, label=''):
+        self.label = label
+        self.started_at = time.time()
+        self.spans = []
+        self._stack = []
+        self._start = time.perf_counter()
+        self.elapsed_ms = None
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block under ``name``"""
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        start_rss = rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            end_rss = rss_bytes()
+            self._stack.pop()
+            self.spans.append({
+                'name': name,
+                'path': path,
+                'depth': len(self._stack),
+                'ms': elapsed * 1000,
+                'mem_delta_mb': (end_rss - start_rss) / 2**20 if start_rss is not None and end_rss is not None else None,
+            })
+
+    def stop(self):
+        """Freeze the run's total time"""
+        if self.elapsed_ms is None:
+            self.elapsed_ms = (time.perf_counter() - self._start) * 1000
+        return self
+
+    @property
+    def total_ms(self):
+        return self.elapsed_ms if self.elapsed_ms is not None else (time.perf_counter() - self._start) * 1000
+
+    def summary(self):
+        """One row per span path: calls, total/mean/max milliseconds and memory delta"""
+        columns = ['path', 'calls', 'total_ms', 'mean_ms', 'max_ms', 'mem_delta_mb']
+        if not self.spans:
+            return pd.DataFrame(columns=columns)
+        spans = pd.DataFrame(self.spans)
+        summary = spans.groupby('path', sort=False).agg(
+            calls=('ms', 'size'),
+            total_ms=('ms', 'sum'),
+            mean_ms=('ms', 'mean'),
+            max_ms=('ms', 'max'),
+            mem_delta_mb=('mem_delta_mb', 'sum'),
+        ).reset_index()
+        return summary.sort_values('total_ms', ascending=False, ignore_index=True)[columns]
+
+    def to_dict(self):
+        return {
+            'label': self.label,
+            'started_at': self.started_at,
+            'total_ms': self.total_ms,
+            'spans': self.spans,
+        }
+
+def start_run(label=''):
+    """Start profiling the current thread's run, replacing any active profiler"""
+    _local.profiler = Profiler(label)
+    return _local.profiler
+
+def stop_run():
+    """Stop profiling the current thread and return its profiler (None if inactive)"""
+    profiler = current()
+    _local.profiler = None
+    return profiler.stop() if profiler is not None else None
+
+def current():
+    """The current thread's active profiler, if any"""
+    return getattr(_local, 'profiler', None)
+
+@contextmanager
+def span(name):
+    """Time a block in the active profiler; a no-op when profiling is off"""
+    profiler = current()
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name):
+        yield
+
+def profiled(name=None):
+    """Decorator timing every call of a function as a span"""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def dump_runs(profilers, path):
+    """Append runs to a JSON-lines file for offline analysis"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a') as f:
+        for profiler in profilers:
+            f.write(json.dumps(profiler.to_dict()) + '\n')
+    return path
+
+def load_runs(path):
+    """Read dumped runs back as one row per span, tagged with the run they belong to"""
+    rows = []
+    with open(path) as f:
+        for run_id, line in enumerate(f):
+            run = json.loads(line)
+            for record in run['spans']:
+                rows.append(dict(record, run=run_id, label=run['label'], run_total_ms=run['total_ms']))
+    return pd.DataFrame(rows)
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import time
+from collections import deque
+import numpy as np
+import pandas as pd
+import app.config as config
+from app.utils.model import interval_quantiles, predict_rul_batch
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Largest unit_number / cycle accepted, so both fit fixed-width integer columns
+MAX_SNAPSHOT_KEY = int(np.iinfo(np.int32).max)
+HTTP_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+    500: 'Internal Server Error'
+}
+
+class ServiceMetrics:
+    """Request, batch and latency counters for the scoring service"""
+
+    def __init__(self, window=10_000):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.latencies_ms = deque(maxlen=window)
+        self.batch_sizes = deque(maxlen=window)
+
+    def snapshot(self, queue_depth=0):
+        """Current metrics as a JSON-serializable dict"""
+        uptime = time.monotonic() - self.started
+        latencies = np.asarray(self.latencies_ms, dtype=float)
+        percentiles = np.percentile(latencies, [50, 95, 99]) if latencies.size else [0.0, 0.0, 0.0]
+        return {
+            'uptime_s': round(uptime, 1),
+            'requests': self.requests,
+            'rows': self.rows,
+            'batches': self.batches,
+            'errors': self.errors,
+            'queue_depth': queue_depth,
+            'rows_per_s': round(self.rows / uptime, 1) if uptime else 0.0,
+            'mean_batch_rows': round(float(np.mean(self.batch_sizes)), 1) if self.batch_sizes else 0.0,
+            'latency_ms': dict(zip(['p50', 'p95', 'p99'], (round(float(p), 2) for p in percentiles))),
+        }
+
+class MicroBatcher:
+    """Coalesce concurrent scoring requests into one predict call
+
+    Requests wait on a queue; the worker takes whatever is queued, keeps
+    collecting for at most ``max_wait_ms`` or until ``max_batch`` rows, then
+    scores everything in a single ``predict_rul_batch`` call on a worker
+    thread so the event loop keeps accepting requests meanwhile. Each
+    request resolves to an (n, 3) array of predicted RUL and the lower and
+    upper ends of its ``interval`` (coverage) across the forest's trees.
+    """
+
+    def __init__(self, model, scaler, sensor_cols, forest=None, max_batch=None, max_wait_ms=None, metrics=None,
+                 interval=None):
+        self.model = model
+        self.scaler = scaler
+        self.sensor_cols = list(sensor_cols)
+        self.forest = forest
+        self.max_batch = max_batch or config.SERVE_MAX_BATCH
+        self.max_wait = (config.SERVE_MAX_WAIT_MS if max_wait_ms is None else max_wait_ms) / 1000
+        self.metrics = metrics or ServiceMetrics()
+        self.interval = config.PREDICTION_INTERVAL if interval is None else interval
+        interval_quantiles(self.interval)
+        self.queue = asyncio.Queue()
+        self._worker = None
+
+    def start(self):
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, units, cycles, readings):
+        """Score engine snapshots (see ``parse_snapshots``); resolves once their batch is done"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(((units, cycles, readings), future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        pending = [await self.queue.get()]
+        rows = len(pending[0][0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self.queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(self.queue.get(), timeout)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            pending.append(item)
+            rows += len(item[0][0])
+        return pending, rows
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending, rows = await self._collect()
+            # Any failure fails this batch's requests only, never the worker
+            try:
+                # One frame for the whole batch rather than one per request
+                units, cycles, readings = (np.concatenate(parts) for parts in zip(*(item for item, _, _ in pending)))
+                batch = pd.DataFrame(readings, columns=self.sensor_cols)
+                batch.insert(0, 'unit_number', units)
+                batch.insert(1, 'cycle', cycles)
+                predictions = await loop.run_in_executor(
+                    None, predict_rul_batch, self.model, self.scaler, batch, self.sensor_cols, None, self.forest,
+                    self.interval
+                )
+            except Exception as e:
+                # Without the worker's frames, so callers clearing the traceback cannot close the worker
+                e = e.with_traceback(None)
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            values = predictions[['predicted_RUL', 'RUL_lower', 'RUL_upper']].to_numpy()
+            self.metrics.batches += 1
+            self.metrics.batch_sizes.append(rows)
+            done = time.perf_counter()
+            start = 0
+            for (units, _, _), future, submitted in pending:
+                stop = start + len(units)
+                if not future.done():
+                    future.set_result(values[start:stop])
+                self.metrics.latencies_ms.append((done - submitted) * 1000)
+                start = stop
+
+def parse_snapshots(payload, sensor_cols):
+    """Turn a JSON payload (one snapshot, a list, or {"engines": [...]}) into arrays
+
+    Returns int64 unit numbers and cycles (0 when not given) and a float32
+    matrix of the ``sensor_cols`` readings, one row per snapshot. Built with
+    plain Python and NumPy because a DataFrame per request costs more than
+    scoring the row. Raises ValueError naming the missing, non-numeric or
+    non-finite fields, and for out-of-range unit numbers or cycles.
+    """
+    if isinstance(payload, dict):
+        payload = payload.get('engines', [payload])
+    if not isinstance(payload, list) or not payload:
+        raise ValueError("Expected a snapshot object, a list of snapshots or {\"engines\": [...]}")
+
+    try:
+        units = [int(snapshot['unit_number']) for snapshot in payload]
+        cycles = [int(snapshot.get('cycle', 0)) for snapshot in payload]
+        # Readings too large for float32 become inf and are rejected below
+        with np.errstate(over='ignore'):
+            readings = np.array([[snapshot[col] for col in sensor_cols] for snapshot in payload], dtype=np.float32)
+    except OverflowError:
+        raise ValueError(f"unit_number and cycle must be between 0 and {MAX_SNAPSHOT_KEY}") from None
+    except (KeyError, TypeError, AttributeError, ValueError):
+        fields = ['unit_number', 'cycle'] + sensor_cols
+        missing = sorted({
+            col for snapshot in payload for col in fields
+            if col != 'cycle' and (not isinstance(snapshot, dict) or col not in snapshot)
+        }, key=fields.index)
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}") from None
+        invalid = sorted({
+            col for snapshot in payload for col in fields
+            if col in snapshot and not isinstance(snapshot[col], (int, float))
+        }, key=fields.index)
+        raise ValueError(f"Non-numeric fields: {', '.join(invalid)}") from None
+    # null readings become NaN, and huge ones overflow float32 to inf
+    finite = np.isfinite(readings).all(axis=0)
+    if not finite.all():
+        invalid = [col for col, ok in zip(sensor_cols, finite) if not ok]
+        raise ValueError(f"Non-finite readings: {', '.join(invalid)}")
+    # Checked on the Python ints, before NumPy could overflow on them
+    for name, values in (('unit_number', units), ('cycle', cycles)):
+        if min(values) < 0 or max(values) > MAX_SNAPSHOT_KEY:
+            raise ValueError(f"{name} must be between 0 and {MAX_SNAPSHOT_KEY}")
+    return np.asarray(units, dtype=np.int64), np.asarray(cycles, dtype=np.int64), readings
+
+class ScoringService:
+    """Minimal HTTP/1.1 JSON front end over a MicroBatcher
+
+    Routes: ``POST /predict`` scores engine snapshots, ``GET /metrics``
+    reports queue and latency statistics, ``GET /health`` returns the model
+    version and the fields every snapshot must carry. Connections are kept
+    alive so clients can pipeline requests. Malformed requests get a 400
+    and unexpected failures a 500; both count as errors in the metrics.
+    """
+
+    def __init__(self, batcher, version=None):
+        self.batcher = batcher
+        self.version = version
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=None):
+        self.batcher.start()
+        self.server = await asyncio.start_server(self._handle, host, config.SERVE_PORT if port is None else port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.batcher.stop()
+
+    async def predict(self, body):
+        units, cycles, readings = parse_snapshots(json.loads(body or b'null'), self.batcher.sensor_cols)
+        self.batcher.metrics.requests += 1
+        self.batcher.metrics.rows += len(units)
+        predictions = await self.batcher.submit(units, cycles, readings)
+        return {
+            'version': self.version,
+            'interval': self.batcher.interval,
+            'predictions': [
+                {'unit_number': unit, 'predicted_RUL': round(rul, 2), 'RUL_lower': round(lower, 2), 'RUL_upper': round(upper, 2)}
+                for unit, (rul, lower, upper) in zip(units.tolist(), predictions.tolist())
+            ],
+        }
+
+    async def route(self, method, path, body):
+        if path == '/predict':
+            if method != 'POST':
+                return 405, {'error': "Use POST"}
+            try:
+                return 200, await self.predict(body)
+            except ValueError as e:
+                return 400, {'error': str(e)}
+        if path == '/metrics' and method == 'GET':
+            return 200, self.batcher.metrics.snapshot(self.batcher.queue.qsize())
+        if path == '/health' and method == 'GET':
+            return 200, {'status': 'ok', 'version': self.version, 'sensor_cols': self.batcher.sensor_cols}
+        return 404, {'error': f"No route for {method} {path}"}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    # The body cannot be delimited, so answer and close
+                    status, payload = 400, {'error': "Malformed request line or Content-Length"}
+                    keep_alive = False
+                else:
+                    if length > MAX_BODY_BYTES:
+                        status, payload = 413, {'error': "Request body too large"}
+                        keep_alive = False
+                    else:
+                        body = await reader.readexactly(length) if length else b''
+                        try:
+                            status, payload = await self.route(method, path.split('?', 1)[0], body)
+                        except Exception as e:
+                            status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+                        keep_alive = headers.get('connection', '').lower() != 'close'
+                if status >= 400:
+                    self.batcher.metrics.errors += 1
+
+                content = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
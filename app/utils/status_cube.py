@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import app.config as config
+
+class StatusCube:
+    """Engine counts per health status, pre-aggregated over breakdown dimensions
+
+    Counts live in a dense array with one axis per dimension (operator,
+    operating condition, dataset, ...) plus a status axis, and each engine's
+    current cell is remembered. ``update`` moves only the given engines
+    between cells, so histograms and breakdowns for any filter are sums over
+    this small array instead of scans of the engine table. Engines without a
+    status (RUL outside the bins) are tracked but not counted.
+    """
+
+    def __init__(self, dimensions, statuses=None):
+        self.dimensions = list(dimensions)
+        self.statuses = list(statuses or config.STATUS_LABELS)
+        self.labels = {name: [] for name in self.dimensions}
+        self._codes = {name: {} for name in self.dimensions}
+        self.counts = np.zeros((0,) * len(self.dimensions) + (len(self.statuses),), dtype=np.int64)
+        self._engines = pd.Index([])
+        self._cells = np.empty((0, len(self.dimensions) + 1), dtype=np.intp)
+
+    def __len__(self):
+        return len(self._engines)
+
+    @property
+    def total(self):
+        """Engines counted in some status"""
+        return int(self.counts.sum())
+
+    def _encode(self, axis, values):
+        """Codes of one dimension's labels, growing its axis for unseen labels"""
+        name = self.dimensions[axis]
+        codes = self._codes[name]
+        inverse, uniques = pd.factorize(np.asarray(values, dtype=object))
+        for label in uniques:
+            if label not in codes:
+                codes[label] = len(codes)
+                self.labels[name].append(label)
+        grow = len(codes) - self.counts.shape[axis]
+        if grow:
+            padding = [(0, 0)] * self.counts.ndim
+            padding[axis] = (0, grow)
+            self.counts = np.pad(self.counts, padding)
+        mapping = np.array([codes[label] for label in uniques], dtype=np.intp)
+        return mapping[inverse]
+
+    def _add(self, cells, sign):
+        counted = cells[cells[:, -1] >= 0]
+        if len(counted):
+            flat = np.ravel_multi_index(counted.T, self.counts.shape)
+            delta = np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+            self.counts += sign * delta
+
+    def update(self, engines, statuses, **labels):
+        """Set the status and dimension labels of some engines
+
+        ``statuses`` holds status labels (NaN for none) and every dimension
+        takes one label per engine, or a single label for all of them.
+        Engines seen before are moved out of their previous cell.
+        """
+        engines = pd.Index(engines)
+        status_codes = pd.Categorical(statuses, categories=self.statuses).codes
+        cells = np.empty((len(engines), len(self.dimensions) + 1), dtype=np.intp)
+        for axis, name in enumerate(self.dimensions):
+            values = labels[name]
+            if np.ndim(values) == 0:
+                values = np.full(len(engines), values, dtype=object)
+            cells[:, axis] = self._encode(axis, values)
+        cells[:, -1] = status_codes
+
+        positions = self._engines.get_indexer(engines)
+        known = positions >= 0
+        self._add(self._cells[positions[known]], -1)
+        self._cells[positions[known]] = cells[known]
+        if not known.all():
+            self._engines = self._engines.append(engines[~known])
+            self._cells = np.concatenate((self._cells, cells[~known]))
+        self._add(cells, 1)
+
+    def _select(self, filters):
+        """Counts restricted to the labels in ``filters`` (a label or list per dimension)"""
+        counts = self.counts
+        for name, wanted in filters.items():
+            if wanted is None:
+                continue
+            if np.ndim(wanted) == 0:
+                wanted = [wanted]
+            axis = self.dimensions.index(name)
+            codes = [self._codes[name][label] for label in wanted if label in self._codes[name]]
+            counts = counts.take(codes, axis=axis)
+        return counts
+
+    def histogram(self, **filters):
+        """Engine count per status over the cells matching the filters, as a Status/Count frame"""
+        counts = self._select(filters)
+        totals = counts.reshape(-1, len(self.statuses)).sum(axis=0)
+        return pd.DataFrame({'Status': self.statuses, 'Count': totals})
+
+    def breakdown(self, dimension, **filters):
+        """Engine counts per label of one dimension (rows) and status (columns)"""
+        counts = self._select(filters)
+        axis = self.dimensions.index(dimension)
+        other = tuple(i for i in range(len(self.dimensions)) if i != axis)
+        totals = counts.sum(axis=other)
+        labels = self.labels[dimension]
+        wanted = filters.get(dimension)
+        if wanted is not None:
+            wanted = [wanted] if np.ndim(wanted) == 0 else wanted
+            labels = [label for label in wanted if label in self._codes[dimension]]
+        return pd.DataFrame(totals, index=pd.Index(labels, name=dimension), columns=self.statuses)
+
+    def engine_labels(self):
+        """Every tracked engine's dimension labels and status, one row per engine"""
+        columns = {}
+        for axis, name in enumerate(self.dimensions):
+            columns[name] = np.array(self.labels[name], dtype=object)[self._cells[:, axis]]
+        statuses = np.array(self.statuses + [np.nan], dtype=object)
+        columns['Status'] = statuses[self._cells[:, -1]]
+        return pd.DataFrame(columns, index=self._engines)
+
+    @classmethod
+    def stack(cls, cubes, dimension):
+        """Combine cubes with the same dimensions under a new leading dimension
+
+        ``cubes`` maps each label of the new dimension to a cube; engines are
+        keyed by (label, engine).
+        """
+        cubes = dict(cubes)
+        dimensions = next(iter(cubes.values())).dimensions if cubes else []
+        stacked = cls([dimension] + dimensions)
+        for label, cube in cubes.items():
+            engines = cube.engine_labels()
+            stacked.update(
+                [(label, engine) for engine in engines.index],
+                engines['Status'],
+                **{dimension: label},
+                **{name: engines[name].to_numpy() for name in dimensions}
+            )
+        return stacked
+
+def condition_labels(data):
+    """Readable operating condition of each row (rounded op_setting values)
+
+    Data without operating settings is a single condition 'All'.
+    """
+    settings = [col for col in config.CONDITION_ROUNDING if col in data.columns]
+    if not settings:
+        return np.full(len(data), 'All', dtype=object)
+    # Adding 0.0 turns rounded -0.0 into 0.0 so both print the same
+    rounded = np.column_stack([
+        data[col].to_numpy(dtype=np.float64).round(config.CONDITION_ROUNDING[col]) + 0.0 for col in settings
+    ])
+    # Format each distinct condition once rather than every row
+    conditions, inverse = np.unique(rounded, axis=0, return_inverse=True)
+    names = np.array([' / '.join(f"{value:g}" for value in values) for values in conditions], dtype=object)
+    return names[inverse.ravel()]
+
+def operator_labels(data):
+    """Operator of each row, or the default operator when the data has none"""
+    if config.OPERATOR_COLUMN not in data.columns:
+        return np.full(len(data), config.DEFAULT_OPERATOR, dtype=object)
+    return data[config.OPERATOR_COLUMN].astype(str).to_numpy(dtype=object)
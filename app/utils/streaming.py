@@ -0,0 +1,212 @@
+import argparse
+import io
+import json
+import queue
+import socket
+import sys
+import time
+import pandas as pd
+import app.config as config
+from app.utils.data_processing import load_data
+from app.utils.features import compute_features
+from app.utils.fleet import FleetData
+from app.utils.fleet_store import append_fleet_part, to_compact_dtypes
+from app.utils.model import predict_rul_batch
+from app.utils.model_registry import latest_version, load_model_artifact
+
+def tail_file(path, poll_interval=1.0, stop_event=None):
+    """Follow a growing CSV file and yield each batch of newly appended rows
+
+    The first line is the header; later reads only parse complete lines
+    written since the previous poll.
+    """
+    with open(path) as f:
+        header = f.readline()
+        buffer = ''
+        while stop_event is None or not stop_event.is_set():
+            chunk = f.read()
+            if not chunk:
+                time.sleep(poll_interval)
+                continue
+            buffer += chunk
+            complete, _, buffer = buffer.rpartition('\n')
+            if complete:
+                yield pd.read_csv(io.StringIO(header + complete + '\n'))
+
+def socket_records(host='127.0.0.1', port=None, max_batch=1000, timeout=1.0, stop_event=None):
+    """Serve local TCP clients one after another and yield batches of newline-delimited JSON records
+
+    Every complete line received is yielded as soon as it is read (in
+    batches of at most ``max_batch`` records), so a slow feed is ingested
+    as it arrives. When a client disconnects the next one is accepted.
+    Lines that are not JSON objects are skipped with a message on stderr.
+    ``timeout`` bounds how long a wait blocks before ``stop_event`` is
+    checked again.
+    """
+    port = config.STREAM_PORT if port is None else port
+    with socket.create_server((host, port)) as server:
+        server.settimeout(timeout)
+        while stop_event is None or not stop_event.is_set():
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                continue
+            with connection:
+                connection.settimeout(timeout)
+                buffer = b''
+                while stop_event is None or not stop_event.is_set():
+                    try:
+                        chunk = connection.recv(65536)
+                    except socket.timeout:
+                        continue
+                    if not chunk:
+                        break
+                    complete, _, buffer = (buffer + chunk).rpartition(b'\n')
+                    yield from _record_batches(complete, max_batch)
+                yield from _record_batches(buffer, max_batch)
+
+def _record_batches(data, max_batch):
+    """DataFrames of at most ``max_batch`` records parsed from newline-delimited JSON, skipping bad lines"""
+    records = []
+    for line in data.decode('utf-8', errors='replace').splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            print(f"Skipping malformed record: {line[:200]!r}", file=sys.stderr)
+            continue
+        records.append(record)
+    for start in range(0, len(records), max_batch):
+        yield pd.DataFrame(records[start:start + max_batch])
+
+def queue_records(record_queue, max_batch=1000, timeout=1.0):
+    """Drain an in-process queue of records (dicts) into batches; stops on a None sentinel"""
+    while True:
+        try:
+            record = record_queue.get(timeout=timeout)
+        except queue.Empty:
+            continue
+        if record is None:
+            return
+        batch = [record]
+        while len(batch) < max_batch:
+            try:
+                record = record_queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is None:
+                yield pd.DataFrame(batch)
+                return
+            batch.append(record)
+        yield pd.DataFrame(batch)
+
+class StreamingFleet:
+    """Fleet state updated incrementally as cycle records arrive
+
+    Each ingested batch is merged into the indexed fleet, only the engines
+    that received data get their summary rows, features and RUL scores
+    recomputed, labelled records are folded into the sensor correlation
+    statistics, and the batch can be persisted as a new part of a Parquet
+    dataset directory.
+    """
+
+    def __init__(self, fleet, model=None, scaler=None, sensor_cols=None, forest=None,
+                 feature_params=None, store_dir=None, correlations=None):
+        self.fleet = fleet
+        # Build the summary up front so appends refresh it incrementally
+        fleet.summary
+        self.model = model
+        self.scaler = scaler
+        self.sensor_cols = sensor_cols
+        self.forest = forest
+        self.feature_params = feature_params
+        self.store_dir = store_dir
+        self.correlations = correlations
+        self.scores = pd.DataFrame(columns=['cycle', 'predicted_RUL']).rename_axis('unit_number')
+
+    def ingest(self, records):
+        """Merge a batch of cycle records and return the engines it touched
+
+        Records the fleet already holds (or repeats within the batch) are
+        dropped first, so the correlations and the store only see new rows.
+        """
+        records = to_compact_dtypes(pd.DataFrame(records))
+        if records.empty:
+            return []
+        records = self.fleet.new_records(records)
+        if records.empty:
+            return []
+        engines = sorted(records['unit_number'].unique().tolist())
+
+        self.fleet = self.fleet.append(records)
+        if self.correlations is not None:
+            self.correlations.update(records)
+
+        if self.store_dir:
+            append_fleet_part(records, self.store_dir)
+        if self.model is not None:
+            self.rescore(engines)
+        return engines
+
+    def latest_rows(self, engines):
+        """Latest cycle of each engine, with features computed over its own history"""
+        touched = FleetData(pd.concat([self.fleet.engine(engine) for engine in engines]))
+        rows = touched.data
+        if self.feature_params:
+            rows = pd.concat([rows, compute_features(touched, **self.feature_params)], axis=1)
+        last = touched._stops - 1
+        return rows.iloc[last]
+
+    def rescore(self, engines):
+        """Re-predict RUL at the latest cycle of the given engines in one batch"""
+        rows = self.latest_rows(engines)
+        predictions = predict_rul_batch(self.model, self.scaler, rows, self.sensor_cols, forest=self.forest)
+        predictions = predictions.set_index('unit_number')[['cycle', 'predicted_RUL']]
+        self.scores = pd.concat([self.scores.drop(predictions.index, errors='ignore'), predictions]).sort_index()
+        return predictions
+
+    def run(self, source, on_update=None):
+        """Consume a record source until it is exhausted"""
+        for batch in source:
+            engines = self.ingest(batch)
+            if on_update is not None and engines:
+                on_update(self, engines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream cycle records into the fleet and re-score touched engines")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--tail', help="CSV file to follow")
+    source.add_argument('--listen', type=int, metavar='PORT', help="Accept newline-delimited JSON on a local TCP port")
+    parser.add_argument('--dataset', choices=list(config.DATASETS), default=config.DEFAULT_DATASET,
+                        help="C-MAPSS subset the records belong to")
+    parser.add_argument('--store-dir', default=None, help="Append each batch to this Parquet dataset directory")
+    args = parser.parse_args(argv)
+
+    fleet = FleetData(load_data(dataset=args.dataset))
+    kwargs = {}
+    # Only a model trained on this subset scores its records
+    version = latest_version(dataset=args.dataset)
+    if version is not None:
+        artifact = load_model_artifact(version)
+        kwargs = {
+            'model': artifact['model'],
+            'scaler': artifact['scaler'],
+            'sensor_cols': artifact['sensor_cols'],
+            'forest': artifact.get('forest'),
+            'feature_params': artifact['metadata'].get('features'),
+        }
+    streaming_fleet = StreamingFleet(fleet, store_dir=args.store_dir, **kwargs)
+
+    def report(state, engines):
+        print(f"{time.strftime('%H:%M:%S')} updated engines {engines}")
+        if state.model is not None:
+            print(state.scores.loc[engines].to_string())
+
+    records = tail_file(args.tail) if args.tail else socket_records(port=args.listen)
+    streaming_fleet.run(records, on_update=report)
+
+if __name__ == '__main__':
+    main()
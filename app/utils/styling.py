@@ -1,7 +1,52 @@
-import streamlit as st
+import argparse
 import base64
+import glob
+import hashlib
+import io
+import mimetypes
 import os
+import tempfile
+import streamlit as st
 import app.config as config
+from app.utils.cache import LRUCache
+
+# Built style blobs, keyed by the source files' paths and modification times,
+# so they are encoded once per process rather than on every rerun
+_asset_cache = LRUCache('assets', max_entries=4)
+
+# Dark background image layer with darken blend mode
+BACKGROUND_CSS = '''
+.stApp::before {
+    content: "";
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%%;
+    height: 100%%;
+    background-image: url("%s");
+    background-size: cover;
+    background-position: center;
+    background-repeat: no-repeat;
+    background-attachment: fixed;
+    filter: brightness(0.4) contrast(1.2);
+    mix-blend-mode: darken;
+    z-index: -1;
+}
+
+.stApp {
+    background-color: rgba(0, 0, 0, 0.85);  /* Much darker base layer */
+}
+'''
+
+# Used when the background image can't be loaded
+FALLBACK_BACKGROUND_CSS = '''
+.stApp {
+    background: linear-gradient(to bottom, #0a0a14, #1f1f36);
+}
+'''
+
+# Plane animation
+PLANE_HTML = '<div class="plane">✈️</div>'
 
 def get_base64_of_bin_file(bin_file):
     """Get base64 encoding of binary file"""
@@ -9,77 +54,125 @@ def get_base64_of_bin_file(bin_file):
         data = f.read()
     return base64.b64encode(data).decode()
 
-def set_background():
-    """Set the background image with darken blend mode"""
+def _source_key(path):
+    """Identify a source file's current contents by path, mtime and size"""
     try:
-        bin_str = get_base64_of_bin_file(config.BACKGROUND_IMAGE)
-        page_bg_img = '''
-        <style>
-        .stApp::before {
-            content: "";
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background-image: url("data:image/png;base64,%s");
-            background-size: cover;
-            background-position: center;
-            background-repeat: no-repeat;
-            background-attachment: fixed;
-            filter: brightness(0.4) contrast(1.2);
-            mix-blend-mode: darken;
-            z-index: -1;
-        }
-        
-        .stApp {
-            background-color: rgba(0, 0, 0, 0.85);
-        }
-        </style>
-        ''' % bin_str
-        st.markdown(page_bg_img, unsafe_allow_html=True)
-    except Exception as e:
-        st.error(f"Error setting background: {e}")
-        # Fallback to gradient background
-        st.markdown("""
-        <style>
-        .stApp {
-            background: linear-gradient(to bottom, #0a0a14, #1f1f36);
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+def _read_text(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return ''
+
+def prepare_background(image_path, max_width=None, quality=None):
+    """Read the background image, downsized and re-encoded as JPEG when Pillow is installed
+
+    Images wider than ``max_width`` are scaled down; the re-encoded image is
+    only used when it is smaller than the original. Returns (bytes, MIME type).
+    """
+    with open(image_path, 'rb') as f:
+        original = f.read()
+    mime = mimetypes.guess_type(image_path)[0] or 'application/octet-stream'
+    try:
+        from PIL import Image
+    except ImportError:
+        return original, mime
+
+    max_width = max_width or config.BACKGROUND_MAX_WIDTH
+    quality = quality or config.BACKGROUND_JPEG_QUALITY
+    with Image.open(io.BytesIO(original)) as image:
+        image = image.convert('RGB')
+        if image.width > max_width:
+            height = round(image.height * max_width / image.width)
+            image = image.resize((max_width, height), Image.LANCZOS)
+        encoded = io.BytesIO()
+        image.save(encoded, format='JPEG', quality=quality, optimize=True, progressive=True)
+
+    if encoded.tell() >= len(original):
+        return original, mime
+    return encoded.getvalue(), 'image/jpeg'
+
+def _publish(static_dir, prefix, extension, content):
+    """Write content under a content-hashed name, replacing older versions"""
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    name = f"{prefix}-{digest}{extension}"
+    path = os.path.join(static_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        for old in glob.glob(os.path.join(static_dir, f"{prefix}-*{extension}")):
+            os.remove(old)
+        with open(path, 'wb') as f:
+            f.write(content)
+    return name
+
+def build_style(stylesheet=None, image_path=None, static_dir=None):
+    """Build the HTML that styles the app: the stylesheet plus the background layer
+
+    With a ``static_dir`` (served by Streamlit under ``app/static/``) the
+    processed image and the CSS are written there under content-hashed names
+    and the returned blob is a one-line ``@import``, which browsers fetch and
+    cache once. Without one, the CSS is inlined with the image as a data URI.
+    """
+    stylesheet = stylesheet or config.STYLESHEET
+    image_path = image_path or config.BACKGROUND_IMAGE
+    css = _read_text(stylesheet)
+
+    try:
+        image, mime = prepare_background(image_path)
+    except Exception:
+        css += FALLBACK_BACKGROUND_CSS
+    else:
+        if static_dir:
+            url = _publish(static_dir, 'background', mimetypes.guess_extension(mime) or '', image)
+        else:
+            url = f"data:{mime};base64,{base64.b64encode(image).decode()}"
+        css += BACKGROUND_CSS % url
+
+    if static_dir:
+        name = _publish(static_dir, 'app', '.css', css.encode())
+        return f'<style>@import url("app/static/{name}");</style>'
+    return f"<style>{css}</style>"
+
+def style_blob():
+    """The app's style HTML, built once per process and per change of its sources"""
+    static_dir = config.STATIC_DIR if st.get_option('server.enableStaticServing') else None
+    key = (_source_key(config.STYLESHEET), _source_key(config.BACKGROUND_IMAGE), static_dir)
+    return _asset_cache.get_or_create(key, lambda: build_style(static_dir=static_dir))
 
 def apply_styling():
     """Apply all styling to the application"""
-    # Set background
-    set_background()
-    
-    # Apply CSS styles
+    st.markdown(style_blob() + PLANE_HTML, unsafe_allow_html=True)
+
+def payload_sizes(stylesheet=None, image_path=None):
+    """Bytes of style HTML sent per rerun: raw data URI, processed data URI and static serving"""
+    stylesheet = stylesheet or config.STYLESHEET
+    image_path = image_path or config.BACKGROUND_IMAGE
+    css = _read_text(stylesheet)
     try:
-        with open(os.path.join('app/utils/styles.css'), 'r') as f:
-            css = f.read()
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-    except Exception as e:
-        st.error(f"Error loading CSS: {e}")
-        # Fallback basic styling
-        st.markdown("""
-        <style>
-        .main {
-            background-color: rgba(10, 10, 18, 0.95);
-            border-radius: 10px;
-            padding: 20px;
-        }
-        .container {
-            background-color: rgba(15, 15, 25, 0.97);
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        .header {
-            color: #ffffff;
-            font-size: 24px;
-            font-weight: 700;
-            margin-bottom: 15px;
-        }
-        </style>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        original = BACKGROUND_CSS % f"data:image/png;base64,{get_base64_of_bin_file(image_path)}"
+    except OSError:
+        original = FALLBACK_BACKGROUND_CSS
+    with tempfile.TemporaryDirectory() as static_dir:
+        static = build_style(stylesheet, image_path, static_dir)
+    return {
+        'original': len(f"<style>{css}{original}</style>".encode()),
+        'inline': len(build_style(stylesheet, image_path).encode()),
+        'static': len(static.encode()),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the per-rerun size of the app's style payload")
+    parser.add_argument('--image', default=config.BACKGROUND_IMAGE, help="Background image")
+    parser.add_argument('--stylesheet', default=config.STYLESHEET, help="CSS file")
+    args = parser.parse_args(argv)
+
+    for mode, size in payload_sizes(args.stylesheet, args.image).items():
+        print(f"{mode:<10}{size:>12,} bytes per rerun")
+
+if __name__ == '__main__':
+    main()
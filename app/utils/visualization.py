@@ -1,71 +1,149 @@
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import app.config as config
+from app.utils.cache import LRUCache
+from app.utils.decimation import decimate_indices
+from app.utils.profiling import span
 
-def update_chart_style(fig):
-    """Apply a high contrast style to Plotly charts"""
-    fig.update_layout(
-        plot_bgcolor='rgba(5, 5, 15, 0.95)',  # Almost solid dark background
-        paper_bgcolor='rgba(5, 5, 15, 0)',
-        font=dict(
-            color='#ffffff',
-            size=14
-        ),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(180, 180, 230, 0.3)',  # Brighter grid lines
-            gridwidth=1,
-            zeroline=False,
-            color='#ffffff',
-            title_font=dict(size=14, color='#ffffff')
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(180, 180, 230, 0.3)',  # Brighter grid lines
-            gridwidth=1,
-            zeroline=False,
-            color='#ffffff',
-            title_font=dict(size=14, color='#ffffff')
-        ),
-        margin=dict(l=20, r=20, t=40, b=20),
-        title=dict(
-            font=dict(
-                size=18, 
-                color='#ffffff'
-            )
+# Line colors cycled across engines and sensors
+SERIES_COLORS = ['accent', 'accent2', 'Critical', 'Good', 'Warning', 'Moderate']
+
+# Trace attributes holding per-point data, which dominate a figure's size
+TRACE_ARRAYS = ('x', 'y', 'z', 'text', 'customdata')
+
+def figure_nbytes(fig):
+    """Approximate size of a figure from its trace data arrays, without serializing it"""
+    total = 0
+    for trace in fig.data:
+        for name in TRACE_ARRAYS:
+            values = getattr(trace, name, None)
+            if isinstance(values, np.ndarray):
+                total += values.nbytes
+            elif isinstance(values, (tuple, list)):
+                total += 8 * len(values)
+    return total
+
+# Most recently used figures, shared by all sessions of the process, bounded
+# by count; sizes are an estimate from the trace arrays, for reporting
+_figure_cache = LRUCache('figures', max_entries=config.FIGURE_CACHE_SIZE, sizeof=figure_nbytes)
+
+THEME_TEMPLATE = 'maintenance'
+
+# Top-level layout values px sets explicitly on its figures, so the template
+# alone would not win; update_chart_style repeats them on the figure
+THEME_LAYOUT = dict(
+    plot_bgcolor='rgba(5, 5, 15, 0.95)',  # Almost solid dark background
+    paper_bgcolor='rgba(5, 5, 15, 0)',
+    font=dict(
+        color='#ffffff',
+        size=14
+    ),
+    margin=dict(l=20, r=20, t=40, b=20)
+)
+
+# Axis styling shared by both axes
+THEME_AXIS = dict(
+    showgrid=True,
+    gridcolor='rgba(180, 180, 230, 0.3)',  # Brighter grid lines
+    gridwidth=1,
+    zeroline=False,
+    color='#ffffff',
+    title_font=dict(size=14, color='#ffffff')
+)
+
+def register_theme():
+    """Register the dark high-contrast theme as a Plotly template"""
+    pio.templates[THEME_TEMPLATE] = go.layout.Template(
+        layout=dict(
+            THEME_LAYOUT,
+            colorway=px.colors.qualitative.Plotly,
+            xaxis=THEME_AXIS,
+            yaxis=THEME_AXIS,
+            title=dict(
+                font=dict(
+                    size=18,
+                    color='#ffffff'
+                )
+            ),
+            # Border for better definition; unnamed template shapes are drawn on every figure
+            shapes=[
+                dict(
+                    type="rect",
+                    xref="paper",
+                    yref="paper",
+                    x0=0,
+                    y0=0,
+                    x1=1,
+                    y1=1,
+                    line=dict(
+                        color="rgba(140, 131, 255, 0.6)",
+                        width=1,
+                    ),
+                    fillcolor="rgba(0, 0, 0, 0)"
+                )
+            ]
         )
     )
-    
-    # Make sure the chart has a border for better definition
-    fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper",
-                yref="paper",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=1,
-                line=dict(
-                    color="rgba(140, 131, 255, 0.6)",
-                    width=1,
-                ),
-                fillcolor="rgba(0, 0, 0, 0)"
-            )
-        ]
-    )
-    
+
+register_theme()
+
+def update_chart_style(fig):
+    """Apply a high contrast style to Plotly charts"""
+    fig.update_layout(template=THEME_TEMPLATE, **THEME_LAYOUT)
     return fig
 
+def cached_figure(key, build):
+    """Return the figure stored under ``key``, building it with ``build()`` on a miss
+
+    Keys identify a chart's content, e.g. (chart type, engine, sensors, data
+    version), so reruns with the same selection reuse the figure instead of
+    rebuilding it. Cached figures are shared between sessions and must not be
+    modified after they are returned.
+    """
+    with span(f"figure:{key[0]}"):
+        return _figure_cache.get_or_create(key, build)
+
+def decimate(x, y, budget=None, method=None):
+    """Downsample one trace to at most ``budget`` points, returning (x, y) arrays"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    budget = budget or config.CHART_POINT_BUDGET
+    if len(y) <= budget:
+        return x, y
+    keep = decimate_indices(x, y, budget, method or config.CHART_DECIMATION)
+    return x[keep], y[keep]
+
+def decimate_rows(data, x, y, budget=None, method=None):
+    """Rows of ``data`` kept when decimating its ``y`` column against ``x``, for traces that must share samples"""
+    budget = budget or config.CHART_POINT_BUDGET
+    if len(data) <= budget:
+        return data
+    keep = decimate_indices(data[x].to_numpy(), data[y].to_numpy(), budget, method or config.CHART_DECIMATION)
+    return data.iloc[keep]
+
+def line_trace(x, y, webgl=False, **kwargs):
+    """Decimated line trace, as Scattergl when the figure is large"""
+    x, y = decimate(x, y)
+    trace_type = go.Scattergl if webgl else go.Scatter
+    return trace_type(x=x, y=y, mode='lines', **kwargs)
+
+def use_webgl(*lengths):
+    """Whether a figure with traces of these lengths should render with WebGL"""
+    return sum(min(n, config.CHART_POINT_BUDGET) for n in lengths) > config.WEBGL_POINT_THRESHOLD
+
 def create_themed_line_chart(data, x, y, title):
     """Create a themed line chart with good visibility"""
+    data = decimate_rows(data, x, y)
     fig = px.line(
         data,
         x=x,
         y=y,
         title=title,
-        markers=True
+        markers=True,
+        template=THEME_TEMPLATE,
+        render_mode='webgl' if use_webgl(len(data)) else 'svg'
     )
     # Thicker lines and larger markers
     fig.update_traces(line=dict(color=config.CHART_COLORS['accent'], width=4))
@@ -101,10 +179,273 @@ def create_health_distribution_chart(status_counts, status_order):
         },
         category_orders={'Status': status_order},
         orientation='h',
-        title="Engine Health Distribution"
+        title="Engine Health Distribution",
+        template=THEME_TEMPLATE
     )
     
     # Apply the enhanced styling
     fig = update_chart_style(fig)
     
-    return fig
\ No newline at end of file
+    return fig
+
+def create_status_breakdown_chart(breakdown, dimension):
+    """Create a stacked bar chart of engine statuses per label of a breakdown dimension"""
+    long = breakdown.rename_axis(dimension).reset_index().melt(
+        id_vars=dimension, var_name='Status', value_name='Count'
+    )
+    long[dimension] = long[dimension].astype(str)
+    fig = px.bar(
+        long,
+        y=dimension,
+        x='Count',
+        color='Status',
+        color_discrete_map={status: config.CHART_COLORS[status] for status in breakdown.columns},
+        category_orders={'Status': list(breakdown.columns)},
+        orientation='h',
+        title=f"Engine Health by {dimension.title()}",
+        template=THEME_TEMPLATE
+    )
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    fig.update_layout(barmode='stack')
+    
+    return fig
+
+def create_multi_line_chart(series, title):
+    """Overlay several (name, x, y) line series, decimated and color-cycled"""
+    series = list(series)
+    webgl = use_webgl(*(len(y) for _, _, y in series))
+    fig = go.Figure()
+    
+    for i, (name, x, y) in enumerate(series):
+        color = config.CHART_COLORS[SERIES_COLORS[i % len(SERIES_COLORS)]]
+        fig.add_trace(line_trace(x, y, webgl=webgl, name=name, line=dict(color=color, width=3)))
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    fig.update_layout(
+        title=title,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color="#ffffff")
+        )
+    )
+    
+    return fig
+
+def create_sensor_comparison_chart(data_frames, sensor_name):
+    """Compare one sensor across several engines"""
+    return create_multi_line_chart(
+        ((f'Engine {engine}', df['cycle'], df[sensor_name]) for engine, df in data_frames.items()),
+        f"{sensor_name} Values Across Selected Engines"
+    )
+
+def create_engine_sensors_chart(engine_data, sensors, engine):
+    """Plot several sensors of a single engine"""
+    return create_multi_line_chart(
+        ((sensor, engine_data['cycle'], engine_data[sensor]) for sensor in sensors),
+        f"Sensor Readings for Engine #{engine}"
+    )
+
+def create_rul_trajectory_chart(predictions, engine):
+    """Create a line chart of predicted vs actual RUL over an engine's cycles"""
+    fig = go.Figure()
+    has_actual = 'RUL' in predictions.columns
+    webgl = use_webgl(*[len(predictions)] * (2 if has_actual else 1))
+    
+    if 'RUL_lower' in predictions.columns:
+        # Prediction interval as a shaded band (upper edge, then lower edge filled up to it);
+        # both edges keep the same cycles, picked once from the prediction, so the fill lines up
+        edges = decimate_rows(predictions, 'cycle', 'predicted_RUL')
+        band = dict(line=dict(width=0), hoverinfo='skip', showlegend=False)
+        fig.add_trace(line_trace(edges['cycle'], edges['RUL_upper'], webgl=webgl, **band))
+        fig.add_trace(
+            line_trace(
+                edges['cycle'],
+                edges['RUL_lower'],
+                webgl=webgl,
+                fill='tonexty',
+                fillcolor='rgba(153, 102, 255, 0.25)',  # Accent purple, translucent
+                **{**band, 'showlegend': True, 'name': 'Prediction Interval'}
+            )
+        )
+    
+    if has_actual:
+        fig.add_trace(
+            line_trace(
+                predictions['cycle'],
+                predictions['RUL'],
+                webgl=webgl,
+                name='Actual RUL',
+                line=dict(color=config.CHART_COLORS['highlight'], width=3, dash='dot')
+            )
+        )
+    
+    fig.add_trace(
+        line_trace(
+            predictions['cycle'],
+            predictions['predicted_RUL'],
+            webgl=webgl,
+            name='Predicted RUL',
+            line=dict(color=config.CHART_COLORS['accent'], width=3)
+        )
+    )
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    fig.update_layout(
+        title=f"Predicted vs Actual RUL for Engine #{engine}",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color="#ffffff")
+        )
+    )
+    
+    return fig
+
+def create_correlation_chart(correlations):
+    """Create a bar chart of each sensor's absolute correlation with RUL"""
+    fig = px.bar(
+        x=correlations.index,
+        y=correlations.values,
+        title="Sensor Correlations with RUL",
+        labels={'x': 'Sensor', 'y': 'Absolute Correlation'},
+        color=correlations.values,
+        color_continuous_scale=[
+            [0, config.CHART_COLORS['Good']],
+            [0.5, config.CHART_COLORS['Warning']],
+            [1, config.CHART_COLORS['accent']]
+        ],
+        template=THEME_TEMPLATE
+    )
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    
+    return fig
+
+def create_feature_importance_chart(importance_df):
+    """Create a bar chart of the ten most important model features"""
+    fig = px.bar(
+        importance_df.head(10),
+        x='Importance',
+        y='Feature',
+        orientation='h',
+        title="Top 10 Most Important Sensors",
+        color='Importance',
+        color_continuous_scale=[
+            [0, config.CHART_COLORS['Good']],
+            [0.5, config.CHART_COLORS['Warning']],
+            [1, config.CHART_COLORS['accent']]
+        ],
+        template=THEME_TEMPLATE
+    )
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    
+    return fig
+
+def create_rul_gauge(prediction, actual_rul, interval=None):
+    """Create a gauge of the predicted RUL against the actual value
+
+    ``interval`` is an optional (lower, upper, coverage) prediction interval,
+    drawn as a band inside the gauge and stated in its title.
+    """
+    steps = [
+        {'range': [0, 30], 'color': 'rgba(255, 51, 51, 0.6)'},   # Bright red with opacity
+        {'range': [30, 70], 'color': 'rgba(255, 170, 0, 0.6)'},  # Bright orange with opacity
+        {'range': [70, 120], 'color': 'rgba(255, 255, 0, 0.6)'}, # Bright yellow with opacity
+        {'range': [120, 200], 'color': 'rgba(51, 255, 51, 0.6)'} # Bright green with opacity
+    ]
+    title = None
+    if interval is not None:
+        lower, upper, coverage = interval
+        steps.append({'range': [lower, upper], 'color': 'rgba(255, 255, 255, 0.45)', 'thickness': 0.35})
+        title = {
+            'text': f"{coverage:.0%} interval: {lower:.0f}–{upper:.0f} cycles",
+            'font': {'size': 14, 'color': '#ffffff'}
+        }
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=prediction,
+        title=title,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        delta={
+            'reference': actual_rul, 
+            'increasing': {'color': config.CHART_COLORS['Good']}, 
+            'decreasing': {'color': config.CHART_COLORS['Critical']},
+            'font': {'size': 16}
+        },
+        number={'font': {'size': 24, 'color': '#ffffff'}},
+        gauge={
+            'axis': {
+                'range': [0, 200], 
+                'tickwidth': 1, 
+                'tickcolor': "#ffffff",
+                'tickfont': {'color': '#ffffff'}
+            },
+            'bar': {'color': config.CHART_COLORS['accent']},
+            'bgcolor': "rgba(5, 5, 15, 0.5)",
+            'borderwidth': 2,
+            'bordercolor': "rgba(140, 140, 190, 0.6)",
+            'steps': steps,
+            'threshold': {
+                'line': {'color': config.CHART_COLORS['Critical'], 'width': 4},
+                'thickness': 0.75,
+                'value': 30
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        paper_bgcolor='rgba(5, 5, 15, 0)',
+        font=dict(color='#ffffff'),
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=300
+    )
+    
+    return fig
+
+def create_emissions_chart(emissions_data, co2_saved):
+    """Create a bar chart comparing CO₂ emissions with and without predictive maintenance"""
+    fig = px.bar(
+        emissions_data,
+        x='Scenario',
+        y='CO₂ Emissions (tonnes)',
+        color='Scenario',
+        color_discrete_map={
+            'Without Predictive Maintenance': config.CHART_COLORS['Critical'],
+            'With Predictive Maintenance': config.CHART_COLORS['Good']
+        },
+        title="CO₂ Emissions Comparison",
+        template=THEME_TEMPLATE
+    )
+    
+    fig.add_annotation(
+        x=1,
+        y=(emissions_data['CO₂ Emissions (tonnes)'][1] + 
+           (emissions_data['CO₂ Emissions (tonnes)'][0] - emissions_data['CO₂ Emissions (tonnes)'][1])/2),
+        text=f"Reduction: {co2_saved/1000:,.1f} tonnes",
+        showarrow=True,
+        arrowhead=1,
+        font=dict(size=16, color="#ffffff"),
+        bgcolor="rgba(5, 5, 15, 0.8)",
+        bordercolor="#ffffff",
+        borderwidth=1
+    )
+    
+    # Apply the styling
+    fig = update_chart_style(fig)
+    
+    return fig
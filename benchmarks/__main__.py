@@ -0,0 +1,36 @@
+import argparse
+import os
+import sys
+import time
+from benchmarks import bench_pipeline  # noqa: F401 (registers the benchmarks)
+from benchmarks.harness import SIZES, compare_results, load_results, run_benchmarks, save_results
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the data, training, inference and rendering paths")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=['small', 'medium'],
+                        help="Synthetic fleet sizes to run")
+    parser.add_argument('--filter', default=None, help="Only run benchmarks whose name matches this regex")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing loops per benchmark")
+    parser.add_argument('--output', default=None, help="Result JSON file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', default=None, help="Baseline result JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown ratio (current / baseline median) reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.filter, args.repeat)
+    output = args.output or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    print(f"Wrote {save_results(results, output)}")
+
+    if args.compare:
+        comparison = compare_results(results, load_results(args.compare), args.threshold)
+        print(comparison.to_string(index=False))
+        regressions = comparison[comparison['regression']]
+        if not regressions.empty:
+            print(f"{len(regressions)} benchmark(s) slower than {args.threshold}x the baseline")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
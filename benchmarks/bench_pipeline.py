@@ -0,0 +1,218 @@
+import atexit
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from app.utils.correlation import SensorCorrelations
+from app.utils.data_processing import create_synthetic_data, preprocess_data
+from app.utils.fast_forest import CompactForest
+from app.utils.features import compute_features, engine_sensor_std
+from app.utils.fleet import FleetData, FleetSummary, classify_status
+from app.utils.fleet_store import read_fleet, read_fleet_csv, to_compact_dtypes, write_fleet
+from app.utils.model import fit_model, predict_latest_rul, predict_rul, predict_rul_batch, predict_rul_fleet
+from app.utils.parallel import FleetExecutor
+from app.utils.status_cube import StatusCube
+from app.utils.visualization import (
+    add_threshold_line, create_health_distribution_chart, create_rul_trajectory_chart,
+    create_sensor_comparison_chart, create_themed_line_chart
+)
+from benchmarks.harness import benchmark
+import app.config as config
+
+_scratch_dir = tempfile.mkdtemp(prefix='rul-bench-')
+atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+
+# Always shards, whatever the fleet size; its workers start on first use
+_pool_executor = FleetExecutor(min_rows=0)
+atexit.register(_pool_executor.shutdown)
+
+# Setups: each builds a benchmark input once per fleet size
+
+def synthetic_data(engines):
+    return to_compact_dtypes(create_synthetic_data(engines=engines, seed=42))
+
+def fleet(engines):
+    return FleetData(synthetic_data(engines))
+
+def stored_fleet(engines):
+    data = synthetic_data(engines)
+    paths = {
+        'parquet': os.path.join(_scratch_dir, f'fleet_{engines}.parquet'),
+        'csv': os.path.join(_scratch_dir, f'fleet_{engines}.csv'),
+    }
+    write_fleet(data, paths['parquet'])
+    data.to_csv(paths['csv'], index=False)
+    return paths
+
+def trained(engines):
+    data = synthetic_data(engines)
+    model, scaler, sensor_cols, _ = fit_model(data)
+    return {
+        'fleet': FleetData(data),
+        'model': model,
+        'scaler': scaler,
+        'sensor_cols': sensor_cols,
+        'forest': CompactForest.from_sklearn(model),
+    }
+
+def engine_statuses(engines):
+    # Engine-level table for a multi-operator fleet: 1000 engine-units per
+    # benchmark engine, with 1% of them receiving new RUL estimates
+    rng = np.random.default_rng(42)
+    n = engines * 1000
+    table = pd.DataFrame({
+        'operator': rng.choice([f'OP{i:02d}' for i in range(20)], n),
+        'condition': rng.choice([f'C{i}' for i in range(6)], n),
+        'min_RUL': rng.uniform(1, 400, n),
+    })
+    table['Status'] = classify_status(table['min_RUL'])
+    cube = StatusCube(['operator', 'condition'])
+    cube.update(table.index, table['Status'], operator=table['operator'].to_numpy(), condition=table['condition'].to_numpy())
+    changed = rng.choice(n, n // 100, replace=False)
+    return {
+        'table': table,
+        'cube': cube,
+        'changed': changed,
+        'new_rul': rng.uniform(1, 400, len(changed)),
+        'operator': table['operator'].to_numpy()[changed],
+        'condition': table['condition'].to_numpy()[changed],
+    }
+
+# Data loading: the two sources load_data dispatches to
+
+@benchmark(setup=stored_fleet)
+def load_data_parquet(paths):
+    read_fleet(paths['parquet'])
+
+@benchmark(setup=stored_fleet)
+def load_data_csv(paths):
+    read_fleet_csv(paths['csv'])
+
+# Training
+
+@benchmark(setup=synthetic_data)
+def preprocess(data):
+    preprocess_data(data)
+
+@benchmark(setup=synthetic_data, sizes=('small', 'medium'))
+def train_model(data):
+    # What train_model runs on a cache miss
+    fit_model(data)
+
+# Inference
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_single(state):
+    engine_data = state['fleet'].engine(1)
+    predict_rul(state['model'], state['scaler'], engine_data, 50, state['sensor_cols'], forest=state['forest'])
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_fleet_batch(state):
+    predict_rul_batch(state['model'], state['scaler'], state['fleet'].data, state['sensor_cols'], forest=state['forest'])
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_fleet_interval(state):
+    predict_rul_batch(
+        state['model'], state['scaler'], state['fleet'].data, state['sensor_cols'],
+        forest=state['forest'], interval=config.PREDICTION_INTERVAL
+    )
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_engine_batch(state):
+    # One engine's trajectory, as the Prediction tab scores it
+    predict_rul_batch(state['model'], state['scaler'], state['fleet'].engine(1), state['sensor_cols'], forest=state['forest'])
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_engine_interval(state):
+    predict_rul_batch(
+        state['model'], state['scaler'], state['fleet'].engine(1), state['sensor_cols'],
+        forest=state['forest'], interval=config.PREDICTION_INTERVAL
+    )
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def predict_rul_fleet_sharded(state):
+    predict_rul_fleet(
+        state['model'], state['scaler'], state['fleet'], state['sensor_cols'],
+        forest=state['forest'], executor=_pool_executor
+    )
+
+# Per-engine feature jobs, in-process and sharded across the process pool
+
+@benchmark(setup=fleet)
+def rolling_features(fleet):
+    compute_features(fleet)
+
+@benchmark(setup=fleet)
+def rolling_features_sharded(fleet):
+    compute_features(fleet, executor=_pool_executor)
+
+@benchmark(setup=fleet)
+def engine_sensor_ranking(fleet):
+    engine_sensor_std(fleet)
+
+# Dashboard and Analysis aggregations
+
+@benchmark(setup=synthetic_data)
+def dashboard_summary(data):
+    FleetData(data).summary
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def fleet_health_predicted(state):
+    predicted_rul = predict_latest_rul(state['model'], state['scaler'], state['fleet'], state['sensor_cols'], state['forest'])
+    FleetSummary(state['fleet'], predicted_rul=predicted_rul)
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def fleet_health_per_engine(state):
+    # One inference call per engine, the alternative to the batched pass
+    fleet = state['fleet']
+    for engine in fleet.engines:
+        predict_rul(state['model'], state['scaler'], fleet.engine(engine), fleet.max_cycle(engine), state['sensor_cols'], state['forest'])
+
+@benchmark(setup=synthetic_data)
+def correlation_ranking(data):
+    SensorCorrelations(data).ranking()
+
+@benchmark(setup=synthetic_data)
+def pandas_corr_ranking(data):
+    # The full-matrix computation the Analysis tab used before the correlation engine
+    sensor_cols = [col for col in data.columns if 'sensor' in col]
+    data[sensor_cols + ['RUL']].corr()['RUL'].drop('RUL').abs().sort_values(ascending=False)
+
+@benchmark(setup=engine_statuses)
+def status_histogram_scan(state):
+    # Re-binning and grouping the whole engine table, as on every rerun before the cube
+    table = state['table']
+    status = classify_status(table['min_RUL'])
+    table.groupby(['operator', status], observed=False).size()
+    status.value_counts().reindex(config.STATUS_LABELS, fill_value=0)
+
+@benchmark(setup=engine_statuses)
+def status_cube_update(state):
+    state['cube'].update(
+        state['changed'], classify_status(state['new_rul']),
+        operator=state['operator'], condition=state['condition']
+    )
+    state['cube'].breakdown('operator')
+    state['cube'].histogram(condition='C0')
+
+# Figure building
+
+@benchmark(setup=fleet)
+def figure_rul_trend(fleet):
+    add_threshold_line(create_themed_line_chart(fleet.engine(1), 'cycle', 'RUL', "RUL"), 30)
+
+@benchmark(setup=fleet)
+def figure_sensor_comparison(fleet):
+    create_sensor_comparison_chart(fleet.engines_data(fleet.engines[:3]), 'sensor_1')
+
+@benchmark(setup=fleet)
+def figure_health_distribution(fleet):
+    create_health_distribution_chart(fleet.summary.status_counts, config.STATUS_LABELS)
+
+@benchmark(setup=trained, sizes=('small', 'medium'))
+def figure_rul_trajectory(state):
+    trajectory = predict_rul_batch(
+        state['model'], state['scaler'], state['fleet'].engine(1), state['sensor_cols'], forest=state['forest']
+    )
+    create_rul_trajectory_chart(trajectory, 1)
@@ -0,0 +1,114 @@
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+import numpy as np
+import pandas as pd
+import sklearn
+
+# Synthetic fleet sizes, in engines (about 200 cycles each)
+SIZES = {'small': 10, 'medium': 100, 'large': 500}
+
+# Registered benchmarks, in definition order
+BENCHMARKS = []
+
+def benchmark(setup, sizes=tuple(SIZES)):
+    """Register a benchmark: ``setup(engines)`` builds its input once per size, the function is timed"""
+    def register(func):
+        BENCHMARKS.append({'name': func.__name__, 'func': func, 'setup': setup, 'sizes': tuple(sizes)})
+        return func
+    return register
+
+def time_call(func, arg, repeat=5, min_time=0.1, max_time=10.0):
+    """Time ``func(arg)`` like timeit: loops of ``number`` calls, best of ``repeat`` loops
+
+    Calls are batched so one loop takes at least ``min_time``, and fewer
+    loops run when the benchmark is slow, keeping each under ``max_time``.
+    Returns per-call statistics in seconds.
+    """
+    start = time.perf_counter()
+    func(arg)
+    first = time.perf_counter() - start
+
+    number = max(1, int(min_time / first)) if first > 0 else 1000
+    repeat = max(1, min(repeat, int(max_time / (first * number)) if first > 0 else repeat))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        timings.append((time.perf_counter() - start) / number)
+
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'stdev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'number': number,
+        'repeat': repeat,
+    }
+
+def run_benchmarks(sizes=None, pattern=None, repeat=5, log=print):
+    """Run the registered benchmarks and return one result dict per (benchmark, size)"""
+    sizes = sizes or list(SIZES)
+    results = []
+    inputs = {}
+    for bench in BENCHMARKS:
+        if pattern and not re.search(pattern, bench['name']):
+            continue
+        for size in sizes:
+            if size not in bench['sizes']:
+                continue
+            key = (bench['setup'], size)
+            if key not in inputs:
+                inputs[key] = bench['setup'](SIZES[size])
+            stats = time_call(bench['func'], inputs[key], repeat=repeat)
+            results.append({'benchmark': bench['name'], 'size': size, 'engines': SIZES[size], **stats})
+            if log:
+                log(f"{bench['name']:<32} {size:<8} {stats['median'] * 1000:>10.2f} ms")
+    return results
+
+def environment():
+    """Versions and machine details stored with every result file"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def save_results(results, path):
+    """Write results and the environment to a JSON file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    return path
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+def compare_results(current, baseline, threshold=1.25):
+    """Median-time ratios against a baseline; rows above ``threshold`` are regressions"""
+    current = pd.DataFrame(current).set_index(['benchmark', 'size'])['median']
+    baseline = pd.DataFrame(baseline).set_index(['benchmark', 'size'])['median']
+    comparison = pd.DataFrame({'baseline': baseline, 'current': current}).dropna()
+    comparison['ratio'] = comparison['current'] / comparison['baseline']
+    comparison['regression'] = comparison['ratio'] > threshold
+    return comparison.reset_index()
@@ -0,0 +1,44 @@
+import argparse
+import asyncio
+from app.utils.model_registry import load_model_artifact
+from app.utils.serving import MicroBatcher, ScoringService
+import app.config as config
+
+async def serve(artifact, host, port, max_batch, max_wait_ms, interval=None):
+    """Run the scoring service until interrupted"""
+    batcher = MicroBatcher(
+        artifact['model'], artifact['scaler'], artifact['sensor_cols'],
+        forest=artifact.get('forest'), max_batch=max_batch, max_wait_ms=max_wait_ms, interval=interval
+    )
+    service = ScoringService(batcher, version=artifact['metadata']['version'])
+    port = await service.start(host, port)
+    print(f"Serving model {service.version} on http://{host}:{port} (POST /predict, GET /metrics, GET /health)")
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.stop()
+
+def main(argv=None):
+    """Serve the registered RUL model over HTTP/JSON"""
+    parser = argparse.ArgumentParser(description="Asynchronous HTTP scoring service for the RUL model")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind")
+    parser.add_argument('--port', type=int, default=config.SERVE_PORT, help="Port to listen on")
+    parser.add_argument('--max-batch', type=int, default=config.SERVE_MAX_BATCH, help="Largest micro-batch (rows)")
+    parser.add_argument('--max-wait-ms', type=float, default=config.SERVE_MAX_WAIT_MS,
+                        help="How long a batch waits for more requests")
+    parser.add_argument('--interval', type=float, default=config.PREDICTION_INTERVAL,
+                        help="Coverage of the returned RUL_lower/RUL_upper prediction interval")
+    parser.add_argument('--models-dir', default=config.MODELS_DIR, help="Model registry directory")
+    parser.add_argument('--version', default=None, help="Model version to serve (default: LATEST)")
+    args = parser.parse_args(argv)
+    if not 0 < args.interval < 1:
+        parser.error("--interval must be between 0 and 1")
+
+    artifact = load_model_artifact(args.version, models_dir=args.models_dir)
+    try:
+        asyncio.run(serve(artifact, args.host, args.port, args.max_batch, args.max_wait_ms, args.interval))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,6 @@ setup(
         "numpy>=1.26.2",
         "plotly>=5.18.0",
         "scikit-learn>=1.3.2",
+        "pyarrow>=14.0.1",
     ],
 )
\ No newline at end of file
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from benchmarks.harness import (
+    BENCHMARKS, benchmark, compare_results, load_results, run_benchmarks, save_results, time_call
+)
+
+class TestBenchmarkHarness(unittest.TestCase):
+    
+    def setUp(self):
+        # A trivial benchmark registered under a name no real benchmark uses
+        if not any(bench['name'] == 'harness_sum' for bench in BENCHMARKS):
+            @benchmark(setup=lambda engines: list(range(engines)), sizes=('small',))
+            def harness_sum(values):
+                sum(values)
+    
+    def test_time_call(self):
+        stats = time_call(sum, range(100), repeat=3, min_time=0.001)
+        self.assertLessEqual(stats['min'], stats['median'])
+        self.assertGreaterEqual(stats['number'], 1)
+        self.assertEqual(stats['repeat'], 3)
+    
+    def test_run_save_and_compare(self):
+        results = run_benchmarks(['small', 'medium'], pattern='^harness_sum$', repeat=2, log=None)
+        self.assertEqual([(r['benchmark'], r['size']) for r in results], [('harness_sum', 'small')])
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = save_results(results, os.path.join(tmp_dir, 'results', 'run.json'))
+            baseline = load_results(path)
+        self.assertEqual(baseline[0]['median'], results[0]['median'])
+        
+        # A run twice as slow as the baseline is flagged
+        slower = [dict(results[0], median=results[0]['median'] * 2)]
+        comparison = compare_results(slower, baseline, threshold=1.25)
+        self.assertTrue(comparison['regression'].iloc[0])
+        self.assertAlmostEqual(comparison['ratio'].iloc[0], 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import unittest
+import numpy as np
+from app.utils.cache import LRUCache, cache_stats, estimate_nbytes, frame_fingerprint
+from app.utils.data_processing import create_synthetic_data
+
+class TestLRUCache(unittest.TestCase):
+    
+    def setUp(self):
+        # Entries are 1 KB arrays so byte limits are easy to reason about
+        self.cache = LRUCache('test', max_bytes=3 * 1024)
+        self.entry = lambda: np.zeros(128)
+    
+    def test_hits_misses_and_byte_eviction(self):
+        for key in 'abc':
+            self.cache.get_or_create(key, self.entry)
+        self.assertEqual(self.cache.nbytes, 3 * 1024)
+        
+        # Touch 'a' so 'b' is the least recently used when 'd' arrives
+        self.cache.get_or_create('a', self.entry)
+        self.cache.get_or_create('d', self.entry)
+        self.assertEqual([key for key, _ in self.cache.items()], ['c', 'a', 'd'])
+        
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (1, 4, 1))
+        self.assertEqual(stats['nbytes'], 3 * 1024)
+        self.assertIn('test', cache_stats()['cache'].tolist())
+    
+    def test_entry_limit_and_pop(self):
+        cache = LRUCache('test_entries', max_entries=2)
+        for key in range(3):
+            cache.put(key, self.entry())
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(0, cache)
+        
+        self.assertIsNotNone(cache.pop(1))
+        self.assertEqual(cache.nbytes, 1024)
+        self.assertIsNone(cache.get(1))
+    
+    def test_concurrent_misses_build_once(self):
+        builds = []
+        release = threading.Event()
+        def build():
+            builds.append(1)
+            release.wait(1)
+            return self.entry()
+        
+        threads = [threading.Thread(target=self.cache.get_or_create, args=('shared', build)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(builds), 1)
+    
+    def test_fingerprint_and_size(self):
+        data = create_synthetic_data(engines=5, seed=42)
+        self.assertEqual(frame_fingerprint(data), frame_fingerprint(data.copy()))
+        self.assertNotEqual(frame_fingerprint(data), frame_fingerprint(data.iloc[:-1]))
+        
+        self.assertEqual(estimate_nbytes((np.zeros(10), [np.zeros(5)])), 120)
+        self.assertGreater(estimate_nbytes(data), 0)
+
+if __name__ == '__main__':
+    unittest.main()
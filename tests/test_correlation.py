@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+from app.utils.correlation import SensorCorrelations
+from app.utils.status_cube import condition_labels
+from app.utils.data_processing import create_synthetic_data
+
+class TestSensorCorrelations(unittest.TestCase):
+    
+    def setUp(self):
+        self.test_data = create_synthetic_data(engines=10, seed=42)
+        self.sensor_cols = [col for col in self.test_data.columns if col.startswith('sensor')]
+        self.correlations = SensorCorrelations(self.test_data)
+    
+    def expected(self, data):
+        return data[self.sensor_cols + ['RUL']].astype(float).corr()['RUL'].drop('RUL')
+    
+    def test_overall_matches_pandas(self):
+        np.testing.assert_allclose(self.correlations.overall(), self.expected(self.test_data), atol=1e-12)
+        ranking = self.correlations.ranking()
+        self.assertTrue(ranking.is_monotonic_decreasing)
+        self.assertEqual(set(ranking.index), set(self.sensor_cols))
+    
+    def test_by_engine_matches_pandas(self):
+        by_engine = self.correlations.by_engine()
+        self.assertEqual(list(by_engine.index), list(range(1, 11)))
+        engine_data = self.test_data[self.test_data['unit_number'] == 4]
+        np.testing.assert_allclose(by_engine.loc[4], self.expected(engine_data), atol=1e-12)
+    
+    def test_incremental_update_matches_full_scan(self):
+        early = self.test_data[self.test_data['cycle'] <= 60]
+        late = self.test_data[self.test_data['cycle'] > 60]
+        correlations = SensorCorrelations(early)
+        correlations.update(late)
+        np.testing.assert_allclose(correlations.overall(), self.correlations.overall(), atol=1e-12)
+        np.testing.assert_allclose(correlations.by_engine(), self.correlations.by_engine(), atol=1e-12)
+        
+        # Records without a known RUL leave the statistics unchanged
+        unlabelled = late.assign(RUL=np.nan)
+        correlations.update(unlabelled)
+        np.testing.assert_allclose(correlations.overall(), self.correlations.overall(), atol=1e-12)
+    
+    def test_by_condition(self):
+        data = self.test_data.copy()
+        data['op_setting_1'] = np.where(data['unit_number'] % 2 == 0, 10.0, 0.0)
+        data['op_setting_2'] = 0.25
+        data['op_setting_3'] = 100.0
+        np.testing.assert_array_equal(np.unique(condition_labels(data)), ['0 / 0.25 / 100', '10 / 0.25 / 100'])
+        
+        by_condition = SensorCorrelations(data).by_condition()
+        condition_data = data[data['op_setting_1'] == 10.0]
+        np.testing.assert_allclose(by_condition.loc['10 / 0.25 / 100'], self.expected(condition_data), atol=1e-12)
+    
+    def test_update_by_condition(self):
+        data = self.test_data.copy()
+        data['op_setting_1'] = np.where(data['unit_number'] % 2 == 0, 10.0, 0.0)
+        data['op_setting_2'] = 0.25
+        data['op_setting_3'] = 100.0
+        # The first batch only sees one condition, so the second must not reuse its labels
+        early = data[data['op_setting_1'] == 0.0]
+        late = data[data['op_setting_1'] == 10.0]
+        
+        correlations = SensorCorrelations(early)
+        correlations.update(late)
+        expected = SensorCorrelations(data).by_condition()
+        by_condition = correlations.by_condition()
+        self.assertEqual(list(by_condition.index), list(expected.index))
+        np.testing.assert_allclose(by_condition, expected, atol=1e-12)
+
+if __name__ == '__main__':
+    unittest.main()
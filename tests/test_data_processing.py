@@ -1,13 +1,16 @@
 import unittest
 import pandas as pd
 import numpy as np
-from app.utils.data_processing import create_synthetic_data, preprocess_data
+from app.utils.data_processing import (
+    create_synthetic_data, feature_matrix, load_data, preprocess_data, scale_features
+)
+from app.utils.fleet_store import to_compact_dtypes
 
 class TestDataProcessing(unittest.TestCase):
     
     def setUp(self):
         # Create a small synthetic dataset for testing
-        self.test_data = create_synthetic_data()
+        self.test_data = create_synthetic_data(seed=42)
     
     def test_synthetic_data_creation(self):
         # Test that synthetic data has expected columns
@@ -19,6 +22,28 @@ class TestDataProcessing(unittest.TestCase):
         # Test that data has rows
         self.assertGreater(len(self.test_data), 0)
     
+    def test_synthetic_data_schema(self):
+        # Test that the generator honours the requested fleet shape
+        data = create_synthetic_data(engines=5, min_cycles=10, max_cycles=20, n_sensors=4, seed=0)
+        
+        expected_columns = ['unit_number', 'cycle', 'max_cycle', 'RUL'] + [f'sensor_{i}' for i in range(1, 5)]
+        self.assertEqual(list(data.columns), expected_columns)
+        self.assertEqual(data['unit_number'].nunique(), 5)
+        
+        # Cycles restart at 1 for every engine and RUL counts down to 0
+        for _, engine_data in data.groupby('unit_number'):
+            max_cycle = engine_data['max_cycle'].iloc[0]
+            self.assertGreaterEqual(max_cycle, 10)
+            self.assertLess(max_cycle, 20)
+            np.testing.assert_array_equal(engine_data['cycle'], np.arange(1, max_cycle + 1))
+            np.testing.assert_array_equal(engine_data['RUL'], max_cycle - engine_data['cycle'])
+    
+    def test_synthetic_data_seed(self):
+        # Test that a seed makes the generator reproducible
+        first = create_synthetic_data(engines=3, seed=42)
+        second = create_synthetic_data(engines=3, seed=42)
+        pd.testing.assert_frame_equal(first, second)
+    
     def test_preprocess_data(self):
         # Test preprocessing function
         X_scaled, y, scaler, sensor_cols = preprocess_data(self.test_data)
@@ -34,6 +59,27 @@ class TestDataProcessing(unittest.TestCase):
         # Check that scaling worked (should have mean ~0 and std ~1)
         self.assertAlmostEqual(np.mean(X_scaled), 0, delta=0.1)
         self.assertAlmostEqual(np.std(X_scaled), 1, delta=0.1)
+    
+    def test_float32_feature_path(self):
+        data = to_compact_dtypes(self.test_data)
+        X_scaled, _, scaler, sensor_cols = preprocess_data(data)
+        
+        # One C-contiguous float32 matrix, scaled in place
+        self.assertEqual(X_scaled.dtype, np.float32)
+        self.assertTrue(X_scaled.flags['C_CONTIGUOUS'])
+        raw = data[sensor_cols].to_numpy(dtype=np.float64)
+        np.testing.assert_allclose(scaler.mean_, raw.mean(axis=0), rtol=1e-6)
+        np.testing.assert_allclose(scaler.scale_, raw.std(axis=0), rtol=1e-6)
+        
+        # Scoring-time scaling is bit-identical to StandardScaler.transform
+        expected = scaler.transform(feature_matrix(data, sensor_cols))
+        np.testing.assert_array_equal(scale_features(data, sensor_cols, scaler), expected)
+        np.testing.assert_array_equal(X_scaled, expected)
+    
+    def test_load_data_errors(self):
+        # Only a missing file falls back to synthetic data; bad arguments still raise
+        with self.assertRaises(KeyError):
+            load_data(dataset='FD999')
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import app.config as config
+from app.utils.data_processing import create_synthetic_data
+from app.utils.datasets import DatasetCatalog, available_datasets, read_dataset
+from app.utils.fleet import FleetData
+
+class TestDatasets(unittest.TestCase):
+    
+    def setUp(self):
+        # Scratch data directory laid out like data/raw and data/processed
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = self.tmp_dir.name
+        self.paths = mock.patch.multiple(
+            config,
+            RAW_DATA_PATH=os.path.join(root, 'raw', '{split}_{dataset}.txt'),
+            RAW_RUL_PATH=os.path.join(root, 'raw', 'RUL_{dataset}.txt'),
+            CSV_DATA_PATH=os.path.join(root, 'raw', 'fixed_{split}_{dataset}.csv'),
+            FLEET_STORE_TEMPLATE=os.path.join(root, 'processed', '{split}_{dataset}.parquet'),
+        )
+        self.paths.start()
+        os.makedirs(os.path.join(root, 'raw'))
+        
+        # Two engines in the raw C-MAPSS layout: 26 whitespace-separated columns
+        rng = np.random.default_rng(42)
+        self.lengths = {1: 5, 2: 3}
+        rows = []
+        for unit, length in self.lengths.items():
+            for cycle in range(1, length + 1):
+                rows.append([unit, cycle] + list(rng.random(24).round(4)))
+        self.write_raw('train_FD002.txt', rows)
+        self.write_raw('test_FD002.txt', rows)
+        self.write_raw('RUL_FD002.txt', [[40], [7]])
+    
+    def tearDown(self):
+        self.paths.stop()
+        self.tmp_dir.cleanup()
+    
+    def write_raw(self, name, rows):
+        with open(os.path.join(self.tmp_dir.name, 'raw', name), 'w') as f:
+            for row in rows:
+                f.write(' '.join(str(value) for value in row) + ' \n')
+    
+    def test_read_raw_train_and_test(self):
+        train = read_dataset('FD002', 'train')
+        self.assertEqual(len(train), 8)
+        self.assertEqual(train['sensor_21'].dtype, np.float32)
+        self.assertEqual(train.groupby('unit_number')['RUL'].min().tolist(), [0, 0])
+        self.assertEqual(train.loc[train['unit_number'] == 1, 'RUL'].tolist(), [4, 3, 2, 1, 0])
+        
+        # Test trajectories end early: their last RUL comes from the RUL file
+        test = read_dataset('FD002', 'test')
+        self.assertEqual(test.groupby('unit_number')['RUL'].min().tolist(), [40, 7])
+    
+    def test_available_datasets(self):
+        self.assertEqual(available_datasets(), ['FD002'])
+        with self.assertRaises(FileNotFoundError):
+            read_dataset('FD003')
+        with self.assertRaises(KeyError):
+            read_dataset('FD009')
+    
+    def test_catalog_loads_lazily_and_evicts(self):
+        loads = []
+        def loader(dataset, split):
+            loads.append((dataset, split))
+            return FleetData(create_synthetic_data(engines=5, min_cycles=100, max_cycles=101, seed=len(loads)))
+        
+        # Equally sized fleets and a budget for one at a time
+        one_fleet = loader('FD001', 'train').nbytes
+        loads.clear()
+        catalog = DatasetCatalog(loader, max_bytes=int(one_fleet * 1.5))
+        self.assertEqual(catalog.loaded(), {})
+        
+        first = catalog.get('FD001')
+        self.assertIs(catalog.get('FD001'), first)
+        self.assertEqual(loads, [('FD001', 'train')])
+        
+        catalog.get('FD002')
+        self.assertEqual(list(catalog.loaded()), [('FD002', 'train')])
+        self.assertLessEqual(catalog.nbytes, catalog.max_bytes)
+        
+        # An evicted subset is reloaded on its next access
+        catalog.get('FD001')
+        self.assertEqual(len(loads), 3)
+
+if __name__ == '__main__':
+    unittest.main()
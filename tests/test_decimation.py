@@ -0,0 +1,35 @@
+import unittest
+import numpy as np
+from app.utils.decimation import decimate_indices, lttb_indices, minmax_indices
+
+class TestDecimation(unittest.TestCase):
+    
+    def setUp(self):
+        # A noisy random walk with one sharp spike
+        rng = np.random.default_rng(42)
+        self.x = np.arange(10_000, dtype=float)
+        self.y = np.cumsum(rng.normal(size=10_000))
+        self.y[4321] += 500
+    
+    def test_lttb_keeps_budget_ends_and_spike(self):
+        kept = lttb_indices(self.x, self.y, 200)
+        self.assertEqual(len(kept), 200)
+        self.assertEqual((kept[0], kept[-1]), (0, 9_999))
+        self.assertTrue(np.all(np.diff(kept) > 0))
+        self.assertIn(4321, kept)
+    
+    def test_minmax_keeps_extremes(self):
+        kept = minmax_indices(self.y, 200)
+        self.assertLessEqual(len(kept), 200)
+        self.assertTrue(np.all(np.diff(kept) > 0))
+        self.assertEqual(self.y[kept].max(), self.y.max())
+        self.assertEqual(self.y[kept].min(), self.y.min())
+    
+    def test_short_traces_are_untouched(self):
+        np.testing.assert_array_equal(lttb_indices(self.x[:50], self.y[:50], 200), np.arange(50))
+        np.testing.assert_array_equal(minmax_indices(self.y[:50], 200), np.arange(50))
+        with self.assertRaises(ValueError):
+            decimate_indices(self.x, self.y, 200, method='every_kth')
+
+if __name__ == '__main__':
+    unittest.main()
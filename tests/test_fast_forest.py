@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data, scale_features
+from app.utils.fast_forest import CompactForest, tree_quantiles
+from app.utils.model import fit_model
+
+class TestCompactForest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        # Train a small forest once for all parity checks
+        cls.test_data = create_synthetic_data(engines=10, seed=42)
+        cls.model, cls.scaler, cls.sensor_cols, _ = fit_model(cls.test_data, n_estimators=10)
+        cls.X_scaled = scale_features(cls.test_data, cls.sensor_cols, cls.scaler)
+        cls.forest = CompactForest.from_sklearn(cls.model)
+    
+    def test_batch_parity(self):
+        np.testing.assert_allclose(self.forest.predict(self.X_scaled), self.model.predict(self.X_scaled), rtol=1e-12)
+    
+    def test_single_row_parity(self):
+        for i in (0, 100, len(self.X_scaled) - 1):
+            row = self.X_scaled[i]
+            self.assertAlmostEqual(self.forest.predict(row)[0], self.model.predict(row.reshape(1, -1))[0])
+    
+    def test_apply_matches_sklearn_leaves(self):
+        leaves = self.forest.apply(self.X_scaled[:50])
+        self.assertEqual(leaves.shape, (50, self.forest.n_estimators))
+        
+        # Global leaf ids map back to each tree's own node ids
+        expected = self.model.apply(self.X_scaled[:50]) + self.forest.roots
+        np.testing.assert_array_equal(leaves, expected)
+    
+    def test_quantiles_match_sklearn_trees(self):
+        X = self.X_scaled[:200]
+        trees = np.column_stack([estimator.predict(X) for estimator in self.model.estimators_])
+        mean, quantiles = self.forest.predict_quantiles(X, [0.1, 0.5, 0.9])
+        
+        np.testing.assert_allclose(mean, self.model.predict(X), rtol=1e-12)
+        np.testing.assert_allclose(quantiles, np.quantile(trees, [0.1, 0.5, 0.9], axis=1).T, rtol=1e-12)
+        np.testing.assert_allclose(tree_quantiles(trees, [0, 1]), np.column_stack((trees.min(axis=1), trees.max(axis=1))))
+    
+    def test_feature_count_is_checked(self):
+        with self.assertRaises(ValueError):
+            self.forest.predict(np.zeros((1, len(self.sensor_cols) + 1)))
+
+if __name__ == '__main__':
+    unittest.main()
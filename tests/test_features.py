@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data, preprocess_data
+from app.utils.features import add_features, compute_features
+from app.utils.fleet import FleetData
+
+class TestFeatures(unittest.TestCase):
+    
+    def setUp(self):
+        # Create a small synthetic fleet indexed by engine
+        self.test_data = create_synthetic_data(engines=4, min_cycles=20, max_cycles=40, n_sensors=3, seed=42)
+        self.fleet = FleetData(self.test_data)
+        self.window = 5
+        self.features = compute_features(self.fleet, window=self.window, ewm_span=8)
+    
+    def test_feature_columns(self):
+        self.assertEqual(len(self.features), len(self.test_data))
+        self.assertEqual(len(self.features.columns), 3 * 6)
+        self.assertIn('sensor_2_slope', self.features.columns)
+        self.assertTrue(np.isfinite(self.features.to_numpy()).all())
+    
+    def test_rolling_statistics_match_pandas(self):
+        grouped = self.test_data.groupby('unit_number')['sensor_2']
+        expected_mean = grouped.rolling(self.window, min_periods=1).mean().to_numpy()
+        expected_std = grouped.rolling(self.window, min_periods=1).std().fillna(0).to_numpy()
+        expected_ewm = grouped.transform(lambda s: s.ewm(span=8).mean()).to_numpy()
+        
+        np.testing.assert_allclose(self.features['sensor_2_mean'], expected_mean, rtol=1e-5)
+        np.testing.assert_allclose(self.features['sensor_2_std'], expected_std, rtol=1e-4, atol=1e-3)
+        np.testing.assert_allclose(self.features['sensor_2_ewm'], expected_ewm, rtol=1e-5)
+    
+    def test_slope_and_baseline(self):
+        engine_data = self.fleet.engine(2)
+        engine_features = self.features.loc[engine_data.index]
+        
+        # Slope of the last window matches a least-squares fit
+        tail = engine_data.tail(self.window)
+        expected_slope = np.polyfit(tail['cycle'], tail['sensor_1'], 1)[0]
+        self.assertAlmostEqual(engine_features['sensor_1_slope'].iloc[-1], expected_slope, places=2)
+        
+        # Delta is measured from the mean of the engine's first window
+        baseline = engine_data['sensor_1'].iloc[:self.window].mean()
+        expected_delta = engine_data['sensor_1'].iloc[-1] - baseline
+        self.assertAlmostEqual(engine_features['sensor_1_delta'].iloc[-1], expected_delta, places=2)
+    
+    def test_windows_do_not_cross_engines(self):
+        # The first row of every engine only sees itself
+        first_rows = self.fleet.data.groupby('unit_number').head(1).index
+        np.testing.assert_allclose(
+            self.features.loc[first_rows, 'sensor_3_mean'],
+            self.fleet.data.loc[first_rows, 'sensor_3'],
+            rtol=1e-6
+        )
+        np.testing.assert_array_equal(self.features.loc[first_rows, 'sensor_3_std'], 0)
+    
+    def test_add_features_feeds_preprocessing(self):
+        feature_fleet = add_features(self.fleet, window=self.window)
+        X_scaled, y, scaler, sensor_cols = preprocess_data(feature_fleet.data)
+        
+        self.assertEqual(len(sensor_cols), 3 + 3 * 6)
+        self.assertEqual(X_scaled.shape, (len(self.test_data), len(sensor_cols)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import pandas as pd
+import numpy as np
+from app.utils.data_processing import create_synthetic_data
+from app.utils.fleet import FleetData, FleetSummary
+
+class TestFleetData(unittest.TestCase):
+    
+    def setUp(self):
+        # Shuffle a small synthetic fleet so the index has to sort it
+        self.test_data = create_synthetic_data(engines=10, seed=42)
+        shuffled = self.test_data.sample(frac=1, random_state=0)
+        self.fleet = FleetData(shuffled)
+    
+    def test_engines_are_sorted(self):
+        self.assertEqual(self.fleet.engines, list(range(1, 11)))
+        self.assertEqual(len(self.fleet), len(self.test_data))
+    
+    def test_engine_slice_matches_boolean_mask(self):
+        for engine in (1, 5, 10):
+            expected = self.test_data[self.test_data['unit_number'] == engine].reset_index(drop=True)
+            engine_data = self.fleet.engine(engine).reset_index(drop=True)
+            pd.testing.assert_frame_equal(engine_data, expected)
+            self.assertEqual(self.fleet.max_cycle(engine), expected['cycle'].max())
+    
+    def test_row_lookup(self):
+        row = self.fleet.row(3, 7)
+        self.assertEqual(len(row), 1)
+        self.assertEqual(row['unit_number'].iloc[0], 3)
+        self.assertEqual(row['cycle'].iloc[0], 7)
+        
+        # Missing cycles and engines give an empty frame
+        self.assertTrue(self.fleet.row(3, 10_000).empty)
+        self.assertTrue(self.fleet.row(99, 1).empty)
+        self.assertIsNone(self.fleet.row_position(99, 1))
+    
+    def test_engines_data(self):
+        data_frames = self.fleet.engines_data([2, 4])
+        self.assertEqual(list(data_frames), [2, 4])
+        self.assertTrue(np.all(data_frames[4]['unit_number'] == 4))
+    
+    def test_summary_matches_groupby(self):
+        summary = self.fleet.summary
+        
+        expected_min_rul = self.test_data.groupby('unit_number')['RUL'].min()
+        expected_max_cycle = self.test_data.groupby('unit_number')['cycle'].max()
+        np.testing.assert_array_equal(summary.engines['min_RUL'], expected_min_rul)
+        np.testing.assert_array_equal(summary.engines['max_cycle'], expected_max_cycle)
+        
+        self.assertEqual(summary.total_engines, 10)
+        self.assertEqual(summary.avg_lifecycle, round(expected_max_cycle.mean(), 1))
+        self.assertEqual(summary.critical_engines, int((expected_min_rul < 30).sum()))
+        self.assertEqual(list(summary.status_counts['Status']), ['Critical', 'Warning', 'Moderate', 'Good', 'Excellent'])
+        
+        # Latest sensor snapshot comes from each engine's last cycle
+        last_rows = self.test_data.groupby('unit_number').tail(1).set_index('unit_number')
+        np.testing.assert_array_equal(summary.engines['sensor_1'], last_rows['sensor_1'])
+    
+    def test_summary_refresh(self):
+        summary = FleetSummary(self.fleet)
+        
+        # Shift one engine's RUL and refresh only that engine
+        data = self.fleet.data.copy()
+        data.loc[data['unit_number'] == 4, 'RUL'] += 100
+        summary.refresh(FleetData(data), [4])
+        
+        self.assertEqual(summary.engines.at[4, 'min_RUL'], 100)
+        self.assertEqual(summary.engines.at[4, 'Status'], 'Moderate')
+        self.assertEqual(summary.engines.at[5, 'min_RUL'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data
+from app.utils.fleet_store import ingest_csv, read_fleet, read_fleet_csv, write_fleet
+
+class TestFleetStore(unittest.TestCase):
+    
+    def setUp(self):
+        # Create a small synthetic dataset and a scratch directory
+        self.test_data = create_synthetic_data(engines=5, seed=42)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp_dir.name, 'train.csv')
+        self.test_data.to_csv(self.csv_path, index=False)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_read_fleet_csv_uses_compact_dtypes(self):
+        data = read_fleet_csv(self.csv_path)
+        
+        self.assertEqual(data['unit_number'].dtype, np.int16)
+        self.assertEqual(data['cycle'].dtype, np.int16)
+        self.assertEqual(data['RUL'].dtype, np.int16)
+        self.assertEqual(data['sensor_1'].dtype, np.float32)
+    
+    def test_ingest_round_trip(self):
+        for extension in ('parquet', 'feather'):
+            store_path = os.path.join(self.tmp_dir.name, 'processed', f'train.{extension}')
+            ingest_csv(self.csv_path, store_path)
+            
+            data = read_fleet(store_path)
+            self.assertEqual(list(data.columns), list(self.test_data.columns))
+            self.assertEqual(len(data), len(self.test_data))
+            np.testing.assert_allclose(data['sensor_1'], self.test_data['sensor_1'], rtol=1e-6)
+    
+    def test_read_fleet_column_projection(self):
+        store_path = write_fleet(self.test_data, os.path.join(self.tmp_dir.name, 'train.parquet'))
+        
+        data = read_fleet(store_path, columns=['unit_number', 'RUL'])
+        self.assertEqual(list(data.columns), ['unit_number', 'RUL'])
+
+if __name__ == '__main__':
+    unittest.main()
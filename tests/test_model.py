@@ -1,14 +1,20 @@
+import tempfile
 import unittest
+import warnings
+from unittest import mock
 import pandas as pd
 import numpy as np
-from app.utils.data_processing import create_synthetic_data
-from app.utils.model import train_model, predict_rul
+import app.config as config
+from app.utils.data_processing import create_synthetic_data, scale_features
+from app.utils.fleet import FleetData, FleetSummary
+from app.utils.model import get_model, get_versioned_model, train_model, predict_latest_rul, predict_rul, predict_rul_batch
+from app.utils.model_registry import save_model_artifact
 
 class TestModel(unittest.TestCase):
     
     def setUp(self):
         # Create a small synthetic dataset for testing
-        self.test_data = create_synthetic_data()
+        self.test_data = create_synthetic_data(seed=42)
         
         # Train the model on test data
         self.model, self.scaler, self.importance = train_model(self.test_data)
@@ -45,6 +51,106 @@ class TestModel(unittest.TestCase):
         # Check prediction is within reasonable range of actual
         actual_rul = engine_data[engine_data['cycle'] == cycle]['RUL'].iloc[0]
         self.assertLess(abs(prediction - actual_rul), 50)  # Should be within 50 cycles
+    
+    def test_predict_rul_batch(self):
+        # Score every row and compare with per-row predictions
+        engine_data = self.test_data[self.test_data['unit_number'] == 1]
+        predictions = predict_rul_batch(self.model, self.scaler, engine_data, self.sensor_cols)
+        
+        self.assertEqual(list(predictions.columns), ['unit_number', 'cycle', 'predicted_RUL', 'RUL'])
+        self.assertEqual(len(predictions), len(engine_data))
+        
+        for cycle in engine_data['cycle'].iloc[:3]:
+            single = predict_rul(self.model, self.scaler, engine_data, cycle, self.sensor_cols)
+            batch = predictions.loc[predictions['cycle'] == cycle, 'predicted_RUL'].iloc[0]
+            self.assertAlmostEqual(single, batch)
+    
+    def test_predict_rul_batch_pairs(self):
+        # Select (engine, cycle) pairs in the requested order, skipping unknown pairs
+        pairs = [(2, 5), (1, 3), (1, 10_000)]
+        predictions = predict_rul_batch(self.model, self.scaler, self.test_data, self.sensor_cols, pairs=pairs)
+        
+        self.assertEqual(list(zip(predictions['unit_number'], predictions['cycle'])), [(2, 5), (1, 3)])
+    
+    def test_predict_rul_batch_interval(self):
+        engine_data = self.test_data[self.test_data['unit_number'] == 1]
+        plain = predict_rul_batch(self.model, self.scaler, engine_data, self.sensor_cols)
+        predictions = predict_rul_batch(self.model, self.scaler, engine_data, self.sensor_cols, interval=0.8)
+        
+        self.assertEqual(list(predictions.columns), ['unit_number', 'cycle', 'predicted_RUL', 'RUL_lower', 'RUL_upper', 'RUL'])
+        np.testing.assert_allclose(predictions['predicted_RUL'], plain['predicted_RUL'])
+        self.assertTrue((predictions['RUL_lower'] <= predictions['RUL_upper']).all())
+        
+        # Bounds are the 10th/90th percentiles across the trees
+        X = scale_features(engine_data, self.sensor_cols, self.scaler)
+        trees = np.column_stack([estimator.predict(X) for estimator in self.model.estimators_])
+        np.testing.assert_allclose(predictions['RUL_lower'], np.quantile(trees, 0.1, axis=1))
+        np.testing.assert_allclose(predictions['RUL_upper'], np.quantile(trees, 0.9, axis=1))
+        
+        # A wider interval contains the narrower one
+        wide = predict_rul_batch(self.model, self.scaler, engine_data, self.sensor_cols, interval=0.95)
+        self.assertTrue((wide['RUL_lower'] <= predictions['RUL_lower']).all())
+        self.assertTrue((wide['RUL_upper'] >= predictions['RUL_upper']).all())
+        
+        # An explicit coverage of 0 (or 1 and above) is an error, not the default
+        for interval in (0, 0.0, 1, 1.5):
+            with self.assertRaises(ValueError):
+                predict_rul_batch(self.model, self.scaler, engine_data, self.sensor_cols, interval=interval)
+    
+    def test_predicted_fleet_health(self):
+        fleet = FleetData(self.test_data)
+        predicted = predict_latest_rul(self.model, self.scaler, fleet, self.sensor_cols)
+        self.assertEqual(list(predicted.index), fleet.engines)
+        
+        # Matches scoring each engine's last cycle on its own
+        engine = fleet.engines[1]
+        expected = predict_rul(self.model, self.scaler, fleet.engine(engine), fleet.max_cycle(engine), self.sensor_cols)
+        self.assertAlmostEqual(predicted.loc[engine], expected)
+        
+        # Health metrics follow the predictions, not the recorded RUL
+        summary = FleetSummary(fleet, predicted_rul=predicted)
+        self.assertEqual(summary.rul_column, 'predicted_RUL')
+        self.assertEqual(summary.critical_engines, int((predicted < 30).sum()))
+        self.assertEqual(summary.status_counts['Count'].sum(), int((predicted > 0).sum()))
+        
+        # Refreshing needs the refreshed engines' new predictions
+        with self.assertRaises(ValueError):
+            summary.refresh(fleet, [engine])
+        summary.refresh(fleet, [engine], predicted_rul=pd.Series({engine: 10.0}))
+        self.assertEqual(summary.engines.at[engine, 'Status'], 'Critical')
+        self.assertEqual(summary.critical_engines, int((predicted.drop(engine) < 30).sum()) + 1)
+    
+    def test_get_model_checks_data_hash(self):
+        fleet = FleetData(self.test_data)
+        with tempfile.TemporaryDirectory() as models_dir, mock.patch.object(config, 'MODELS_DIR', models_dir):
+            save_model_artifact(
+                self.model, self.scaler, self.sensor_cols, self.importance,
+                data_hash=fleet.version, dataset=config.DEFAULT_DATASET
+            )
+            
+            # The artifact trained on this data loads silently
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                get_model(fleet.data, fleet.version)
+            
+            # Other data is still scored, but the mismatch is reported
+            with self.assertWarnsRegex(UserWarning, 'trained on data'):
+                get_model(fleet.data, 'f' * 64)
+    
+    def test_model_version(self):
+        fleet = FleetData(self.test_data)
+        with tempfile.TemporaryDirectory() as models_dir, mock.patch.object(config, 'MODELS_DIR', models_dir):
+            # In-process models are identified by the data they were trained on
+            model_version, _ = get_versioned_model(fleet.data, fleet.version)
+            self.assertEqual(model_version, ('trained', fleet.version))
+            
+            # Registered models by their registry version
+            version = save_model_artifact(
+                self.model, self.scaler, self.sensor_cols, self.importance,
+                data_hash=fleet.version, dataset=config.DEFAULT_DATASET
+            )
+            model_version, _ = get_versioned_model(fleet.data, fleet.version)
+            self.assertEqual(model_version, ('artifact', version))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data, scale_features
+from app.utils.fleet_store import fingerprint_data
+from app.utils.model import fit_model
+from app.utils.model_registry import latest_version, list_versions, load_model_artifact, save_model_artifact
+
+class TestModelRegistry(unittest.TestCase):
+    
+    def setUp(self):
+        # Train a small model and use a scratch registry
+        self.test_data = create_synthetic_data(engines=10, seed=42)
+        self.model, self.scaler, self.sensor_cols, self.importance = fit_model(self.test_data, n_estimators=5)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.models_dir = self.tmp_dir.name
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_fingerprint_data(self):
+        # Same content gives the same hash, any change gives a different one
+        self.assertEqual(fingerprint_data(self.test_data), fingerprint_data(self.test_data.copy()))
+        
+        changed = self.test_data.copy()
+        changed.loc[0, 'sensor_1'] += 1
+        self.assertNotEqual(fingerprint_data(self.test_data), fingerprint_data(changed))
+    
+    def test_empty_registry(self):
+        self.assertEqual(list_versions(self.models_dir), [])
+        self.assertIsNone(latest_version(self.models_dir))
+        with self.assertRaises(FileNotFoundError):
+            load_model_artifact(models_dir=self.models_dir)
+    
+    def test_save_and_load_round_trip(self):
+        data_hash = fingerprint_data(self.test_data)
+        version = save_model_artifact(
+            self.model, self.scaler, self.sensor_cols, self.importance,
+            data_hash=data_hash, params={'n_estimators': 5}, models_dir=self.models_dir
+        )
+        
+        self.assertEqual(latest_version(self.models_dir), version)
+        artifact = load_model_artifact(models_dir=self.models_dir)
+        
+        self.assertEqual(artifact['sensor_cols'], self.sensor_cols)
+        self.assertEqual(artifact['metadata']['data_hash'], data_hash)
+        self.assertEqual(artifact['metadata']['params'], {'n_estimators': 5})
+        
+        # The loaded model predicts exactly like the trained one
+        X_scaled = scale_features(self.test_data, self.sensor_cols, self.scaler)
+        np.testing.assert_array_equal(
+            artifact['model'].predict(scale_features(self.test_data, self.sensor_cols, artifact['scaler'])),
+            self.model.predict(X_scaled)
+        )
+        np.testing.assert_allclose(artifact['forest'].predict(X_scaled), self.model.predict(X_scaled))
+    
+    def test_latest_version_per_dataset(self):
+        data_hash = fingerprint_data(self.test_data)
+        save = lambda dataset, data_hash: save_model_artifact(
+            self.model, self.scaler, self.sensor_cols, self.importance,
+            data_hash=data_hash, dataset=dataset, models_dir=self.models_dir
+        )
+        fd001 = save('FD001', data_hash)
+        fd002 = save('FD002', 'f' * 64)
+        
+        # The global pointer follows the newest model, each subset keeps its own
+        self.assertEqual(latest_version(self.models_dir), fd002)
+        self.assertEqual(latest_version(self.models_dir, dataset='FD001'), fd001)
+        self.assertEqual(latest_version(self.models_dir, dataset='FD002'), fd002)
+        self.assertIsNone(latest_version(self.models_dir, dataset='FD003'))
+        
+        # Without a subset pointer the global one only counts for its own subset
+        os.remove(os.path.join(self.models_dir, 'LATEST-FD001'))
+        os.remove(os.path.join(self.models_dir, 'LATEST-FD002'))
+        self.assertIsNone(latest_version(self.models_dir, dataset='FD001'))
+        self.assertEqual(latest_version(self.models_dir, dataset='FD002'), fd002)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data
+from app.utils.features import compute_features, engine_sensor_std
+from app.utils.fleet import FleetData
+from app.utils.model import fit_model, predict_rul_batch, predict_rul_fleet
+from app.utils.parallel import FleetExecutor, shard_engines
+
+class TestParallel(unittest.TestCase):
+    
+    def setUp(self):
+        # Engines of different lengths so shards are uneven
+        self.test_data = create_synthetic_data(engines=12, min_cycles=20, max_cycles=80, n_sensors=4, seed=3)
+        self.fleet = FleetData(self.test_data)
+        self.sensor_cols = [col for col in self.test_data.columns if 'sensor' in col]
+        # Five shards run in-process
+        self.local = FleetExecutor(max_workers=1, shards_per_worker=5)
+    
+    def test_shard_engines(self):
+        starts, stops = self.fleet._starts, self.fleet._stops
+        bounds = shard_engines(starts, stops, 4)
+        
+        # Contiguous, covering every engine once, with balanced row counts
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], len(starts))
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(bounds, bounds[1:])))
+        rows = [stops[hi - 1] - starts[lo] for lo, hi in bounds]
+        self.assertLess(max(rows), len(self.fleet) / 2)
+        
+        self.assertEqual(shard_engines(starts[:1], stops[:1], 4), [(0, 1)])
+        self.assertEqual(shard_engines(starts[:0], stops[:0], 4), [])
+    
+    def test_sharded_features_match_serial(self):
+        serial = compute_features(self.fleet, window=5)
+        sharded = compute_features(self.fleet, window=5, executor=self.local)
+        
+        self.assertEqual(list(serial.columns), list(sharded.columns))
+        np.testing.assert_allclose(sharded.to_numpy(), serial.to_numpy(), rtol=1e-5, atol=1e-4)
+    
+    def test_engine_sensor_std(self):
+        std = engine_sensor_std(self.fleet, self.sensor_cols)
+        expected = self.test_data.groupby('unit_number')[self.sensor_cols].std()
+        np.testing.assert_allclose(std.to_numpy(), expected.to_numpy(), rtol=1e-4)
+        self.assertEqual(std.index.tolist(), self.fleet.engines)
+    
+    def test_predict_rul_fleet_matches_batch(self):
+        model, scaler, sensor_cols, _ = fit_model(self.test_data, n_estimators=5)
+        expected = predict_rul_batch(model, scaler, self.fleet.data, sensor_cols)
+        predictions = predict_rul_fleet(model, scaler, self.fleet, sensor_cols, executor=self.local)
+        
+        np.testing.assert_array_equal(predictions['unit_number'], expected['unit_number'])
+        np.testing.assert_allclose(predictions['predicted_RUL'], expected['predicted_RUL'], rtol=1e-6)
+    
+    def test_process_pool(self):
+        serial_features = compute_features(self.fleet, window=5)
+        serial_std = engine_sensor_std(self.fleet, self.sensor_cols)
+        
+        with FleetExecutor(max_workers=2, min_rows=0) as executor:
+            features = compute_features(self.fleet, window=5, executor=executor)
+            std = engine_sensor_std(self.fleet, self.sensor_cols, executor=executor)
+        
+        np.testing.assert_allclose(features.to_numpy(), serial_features.to_numpy(), rtol=1e-5, atol=1e-4)
+        np.testing.assert_allclose(std.to_numpy(), serial_std.to_numpy())
+    
+    def test_process_pool_scoring(self):
+        model, scaler, sensor_cols, _ = fit_model(self.test_data, n_estimators=5)
+        serial = predict_rul_fleet(model, scaler, self.fleet, sensor_cols, executor=self.local)
+        
+        executor = FleetExecutor(max_workers=2, min_rows=0)
+        try:
+            predictions = predict_rul_fleet(model, scaler, self.fleet, sensor_cols, executor=executor)
+            # The shards really went through the shared-memory pool
+            self.assertIsNotNone(executor._pool)
+        finally:
+            executor.shutdown()
+        self.assertIsNone(executor._pool)
+        
+        np.testing.assert_array_equal(predictions['unit_number'], serial['unit_number'])
+        np.testing.assert_array_equal(predictions['cycle'], serial['cycle'])
+        np.testing.assert_allclose(predictions['predicted_RUL'], serial['predicted_RUL'], rtol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import threading
+import unittest
+from app.utils.profiling import current, dump_runs, load_runs, profiled, span, start_run, stop_run
+
+@profiled()
+def square(x):
+    return x * x
+
+class TestProfiling(unittest.TestCase):
+    
+    def setUp(self):
+        stop_run()
+    
+    def tearDown(self):
+        stop_run()
+    
+    def test_inactive_is_noop(self):
+        with span('unused'):
+            pass
+        self.assertEqual(square(3), 9)
+        self.assertIsNone(current())
+        self.assertIsNone(stop_run())
+    
+    def test_spans_nest_and_aggregate(self):
+        profiler = start_run('test')
+        with span('page'):
+            for i in range(3):
+                square(i)
+        stop_run()
+        
+        summary = profiler.summary().set_index('path')
+        self.assertEqual(summary.at['page/square', 'calls'], 3)
+        self.assertEqual(summary.at['page', 'calls'], 1)
+        self.assertGreaterEqual(summary.at['page', 'total_ms'], summary.at['page/square', 'total_ms'])
+        self.assertGreaterEqual(profiler.total_ms, summary.at['page', 'total_ms'])
+        self.assertIsNone(current())
+    
+    def test_threads_are_isolated(self):
+        profiler = start_run('main')
+        thread = threading.Thread(target=square, args=(2,))
+        thread.start()
+        thread.join()
+        stop_run()
+        self.assertEqual(profiler.spans, [])
+    
+    def test_dump_and_load(self):
+        runs = []
+        for label in ['first', 'second']:
+            start_run(label)
+            square(2)
+            runs.append(stop_run())
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = dump_runs(runs, os.path.join(tmp_dir, 'logs', 'profile.jsonl'))
+            spans = load_runs(path)
+        
+        self.assertEqual(spans['label'].tolist(), ['first', 'second'])
+        self.assertEqual(spans['name'].unique().tolist(), ['square'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data
+from app.utils.fast_forest import CompactForest
+from app.utils.model import fit_model, predict_rul_batch
+from app.utils.serving import MicroBatcher, ScoringService, parse_snapshots
+
+async def http_request(port, method, path, payload=None):
+    """Send one HTTP request and return (status, decoded JSON body)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content)
+
+async def raw_request(port, data):
+    """Send raw bytes and return the response status (None when the connection closes silently)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split()[1]) if response else None
+
+class TestScoringService(unittest.TestCase):
+    
+    def setUp(self):
+        self.test_data = create_synthetic_data(engines=10, seed=42)
+        self.model, self.scaler, self.sensor_cols, _ = fit_model(self.test_data, n_estimators=5)
+        self.forest = CompactForest.from_sklearn(self.model)
+        # Latest snapshot of every engine
+        self.snapshots = self.test_data.groupby('unit_number').tail(1)
+        self.records = self.snapshots[['unit_number', 'cycle'] + self.sensor_cols].to_dict('records')
+    
+    def run_service(self, scenario, **batcher_params):
+        async def main():
+            batcher = MicroBatcher(self.model, self.scaler, self.sensor_cols, forest=self.forest, **batcher_params)
+            service = ScoringService(batcher, version='test')
+            port = await service.start(port=0)
+            try:
+                return await scenario(port)
+            finally:
+                await service.stop()
+        return asyncio.run(main())
+    
+    def test_concurrent_requests_share_batches(self):
+        async def scenario(port):
+            responses = await asyncio.gather(*[
+                http_request(port, 'POST', '/predict', record) for record in self.records
+            ])
+            _, metrics = await http_request(port, 'GET', '/metrics')
+            return responses, metrics
+        
+        responses, metrics = self.run_service(scenario, max_wait_ms=50)
+        self.assertTrue(all(status == 200 for status, _ in responses))
+        
+        expected = predict_rul_batch(self.model, self.scaler, self.snapshots, self.sensor_cols)
+        served = [body['predictions'][0]['predicted_RUL'] for _, body in responses]
+        np.testing.assert_allclose(served, expected['predicted_RUL'], atol=0.01)
+        for _, body in responses:
+            prediction = body['predictions'][0]
+            self.assertLessEqual(prediction['RUL_lower'], prediction['RUL_upper'])
+        
+        self.assertEqual(metrics['requests'], len(self.records))
+        self.assertEqual(metrics['rows'], len(self.records))
+        self.assertLess(metrics['batches'], len(self.records))
+    
+    def test_bulk_request_and_errors(self):
+        async def scenario(port):
+            bulk = await http_request(port, 'POST', '/predict', {'engines': self.records})
+            missing = await http_request(port, 'POST', '/predict', {'unit_number': 1})
+            null = await http_request(port, 'POST', '/predict', {**self.records[0], 'sensor_2': None})
+            text = await http_request(port, 'POST', '/predict', {**self.records[0], 'sensor_3': {'value': 1}})
+            unknown = await http_request(port, 'GET', '/nowhere')
+            health = await http_request(port, 'GET', '/health')
+            return bulk, missing, null, text, unknown, health
+        
+        bulk, missing, null, text, unknown, health = self.run_service(scenario)
+        self.assertEqual(bulk[0], 200)
+        self.assertEqual([p['unit_number'] for p in bulk[1]['predictions']], list(range(1, 11)))
+        self.assertEqual(missing[0], 400)
+        self.assertIn('sensor_1', missing[1]['error'])
+        # A null reading is rejected rather than scored as NaN
+        self.assertEqual(null[0], 400)
+        self.assertEqual(null[1]['error'], "Non-finite readings: sensor_2")
+        self.assertEqual(text[0], 400)
+        self.assertEqual(text[1]['error'], "Non-numeric fields: sensor_3")
+        self.assertEqual(unknown[0], 404)
+        self.assertEqual(health[1]['sensor_cols'], self.sensor_cols)
+    
+    def test_malformed_requests(self):
+        async def scenario(port):
+            garbage = await raw_request(port, b"GARBAGE\r\n\r\n")
+            length = await raw_request(port, b"POST /predict HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+            _, metrics = await http_request(port, 'GET', '/metrics')
+            return garbage, length, metrics
+        
+        garbage, length, metrics = self.run_service(scenario)
+        self.assertEqual((garbage, length), (400, 400))
+        self.assertEqual(metrics['errors'], 2)
+    
+    def test_scoring_failure_is_500(self):
+        async def scenario(port):
+            failed = await http_request(port, 'POST', '/predict', self.records[0])
+            _, metrics = await http_request(port, 'GET', '/metrics')
+            return failed, metrics
+        
+        # A scaler that cannot transform makes every batch fail unexpectedly
+        self.scaler = None
+        (status, body), metrics = self.run_service(scenario)
+        self.assertEqual(status, 500)
+        self.assertIn('error', body)
+        self.assertEqual(metrics['errors'], 1)
+    
+    def test_parse_snapshots(self):
+        units, cycles, readings = parse_snapshots({'unit_number': 3, **{col: 1.0 for col in self.sensor_cols}}, self.sensor_cols)
+        self.assertEqual(units.tolist(), [3])
+        self.assertEqual(cycles.tolist(), [0])
+        self.assertEqual(readings.shape, (1, len(self.sensor_cols)))
+        with self.assertRaises(ValueError):
+            parse_snapshots([], self.sensor_cols)
+        with self.assertRaises(ValueError):
+            MicroBatcher(self.model, self.scaler, self.sensor_cols, interval=0)
+        
+        # Unit numbers and cycles outside the integer columns are rejected, not overflowed
+        snapshot = {'unit_number': 1, **{col: 1.0 for col in self.sensor_cols}}
+        for bad in ({'cycle': 10**400}, {'cycle': -1}, {'unit_number': 2**40}):
+            with self.assertRaisesRegex(ValueError, 'between'):
+                parse_snapshots({**snapshot, **bad}, self.sensor_cols)
+    
+    def test_failed_batch_keeps_worker(self):
+        async def main():
+            batcher = MicroBatcher(self.model, self.scaler, self.sensor_cols, max_wait_ms=0)
+            batcher.start()
+            try:
+                # Readings of the wrong width fail their batch...
+                with self.assertRaises(ValueError):
+                    await batcher.submit(np.array([1]), np.array([1]), np.zeros((1, 2), dtype=np.float32))
+                # ...and the next batch is still scored
+                return await batcher.submit(*parse_snapshots(self.records, self.sensor_cols))
+            finally:
+                await batcher.stop()
+        
+        self.assertEqual(asyncio.run(main()).shape, (len(self.records), 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+import app.config as config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_fresh(code):
+    """Run code in a fresh interpreter from the repository root and return its stdout"""
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+class TestStartup(unittest.TestCase):
+    
+    def test_light_pages_skip_sklearn(self):
+        loaded = run_fresh(
+            "import sys\n"
+            "import app.main, app.components.dashboard, app.components.analysis, app.components.sustainability\n"
+            "print('sklearn' in sys.modules, 'app.components.prediction' in sys.modules)"
+        )
+        self.assertEqual(loaded, ['False', 'False'])
+    
+    def test_prediction_page_loads_model(self):
+        loaded = run_fresh("import sys, app.components.prediction\nprint('sklearn' in sys.modules)")
+        self.assertEqual(loaded, ['True'])
+    
+    def test_dashboard_cold_start_budget(self):
+        elapsed = run_fresh(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import app.main, app.components.dashboard\n"
+            "print(time.perf_counter() - start)"
+        )
+        self.assertLess(float(elapsed[0]), config.COLD_START_BUDGET_S)
+
+if __name__ == '__main__':
+    unittest.main()
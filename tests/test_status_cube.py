@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.utils.data_processing import create_synthetic_data
+from app.utils.fleet import FleetData, FleetSummary, classify_status
+from app.utils.status_cube import StatusCube, condition_labels
+
+class TestStatusCube(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.table = pd.DataFrame({
+            'operator': rng.choice(['OP1', 'OP2', 'OP3'], 500),
+            'condition': rng.choice(['C1', 'C2'], 500),
+            'min_RUL': rng.uniform(-10, 300, 500),
+        })
+        self.table['Status'] = classify_status(self.table['min_RUL'])
+        self.cube = StatusCube(['operator', 'condition'])
+        self.cube.update(
+            self.table.index, self.table['Status'],
+            operator=self.table['operator'].to_numpy(), condition=self.table['condition'].to_numpy()
+        )
+    
+    def expected(self, table):
+        return table['Status'].value_counts().reindex(self.cube.statuses, fill_value=0).to_numpy()
+    
+    def test_histogram_matches_scan(self):
+        np.testing.assert_array_equal(self.cube.histogram()['Count'], self.expected(self.table))
+        # Engines without a status are tracked but not counted
+        self.assertEqual(len(self.cube), 500)
+        self.assertEqual(self.cube.total, int(self.table['Status'].notna().sum()))
+        
+        subset = self.table[(self.table['operator'] == 'OP2') & (self.table['condition'] == 'C1')]
+        np.testing.assert_array_equal(self.cube.histogram(operator='OP2', condition='C1')['Count'], self.expected(subset))
+        subset = self.table[self.table['operator'].isin(['OP1', 'OP3'])]
+        np.testing.assert_array_equal(self.cube.histogram(operator=['OP1', 'OP3'])['Count'], self.expected(subset))
+        self.assertEqual(self.cube.histogram(operator='missing')['Count'].sum(), 0)
+    
+    def test_breakdown(self):
+        breakdown = self.cube.breakdown('operator', condition='C2')
+        subset = self.table[self.table['condition'] == 'C2']
+        expected = pd.crosstab(subset['operator'], subset['Status']).reindex(columns=self.cube.statuses, fill_value=0)
+        pd.testing.assert_frame_equal(breakdown.sort_index(), expected, check_names=False, check_dtype=False)
+    
+    def test_incremental_update_matches_rebuild(self):
+        changed = np.arange(0, 500, 7)
+        self.table.loc[changed, 'min_RUL'] = np.linspace(5, 250, len(changed))
+        self.table.loc[changed, 'operator'] = 'OP4'
+        self.table['Status'] = classify_status(self.table['min_RUL'])
+        self.cube.update(
+            changed, self.table.loc[changed, 'Status'],
+            operator='OP4', condition=self.table.loc[changed, 'condition'].to_numpy()
+        )
+        
+        np.testing.assert_array_equal(self.cube.histogram()['Count'], self.expected(self.table))
+        np.testing.assert_array_equal(
+            self.cube.histogram(operator='OP4')['Count'], self.expected(self.table.loc[changed])
+        )
+    
+    def test_stack(self):
+        other = StatusCube(['operator', 'condition'])
+        other.update([1, 2], ['Critical', 'Good'], operator='OP1', condition='C3')
+        stacked = StatusCube.stack({'FD001': self.cube, 'FD002': other}, 'dataset')
+        
+        self.assertEqual(stacked.dimensions, ['dataset', 'operator', 'condition'])
+        self.assertEqual(len(stacked), 502)
+        np.testing.assert_array_equal(stacked.histogram(dataset='FD001')['Count'], self.cube.histogram()['Count'])
+        self.assertEqual(stacked.breakdown('dataset').loc['FD002'].tolist(), [1, 0, 0, 1, 0])
+
+class TestFleetSummaryCube(unittest.TestCase):
+    
+    def setUp(self):
+        data = create_synthetic_data(engines=10, seed=42)
+        data['op_setting_1'] = np.where(data['unit_number'] % 2 == 0, 10.0, -0.2)
+        # Lift each engine's RUL so it lands in a status bin
+        data['RUL'] += data['unit_number'] * 15
+        self.fleet = FleetData(data)
+    
+    def test_condition_labels(self):
+        frame = pd.DataFrame({'op_setting_1': [10.2, -0.2], 'op_setting_2': [0.8412, 0.0]})
+        self.assertEqual(condition_labels(frame).tolist(), ['10 / 0.84', '0 / 0'])
+        self.assertEqual(condition_labels(frame[[]]).tolist(), ['All', 'All'])
+    
+    def test_summary_counts_and_refresh(self):
+        summary = FleetSummary(self.fleet)
+        expected = summary.engines['Status'].value_counts().reindex(summary.cube.statuses, fill_value=0)
+        np.testing.assert_array_equal(summary.status_counts['Count'], expected)
+        breakdown = summary.cube.breakdown('condition')
+        self.assertEqual(breakdown.sum(axis=1).to_dict(), {'0': 5, '10': 5})
+        
+        # Moving one engine into another bin moves one count
+        data = self.fleet.data.copy()
+        data.loc[data['unit_number'] == 10, 'RUL'] -= 140
+        before = summary.status_counts.set_index('Status')['Count']
+        summary.refresh(FleetData(data), [10])
+        after = summary.status_counts.set_index('Status')['Count']
+        self.assertEqual((after - before).abs().sum(), 2)
+        self.assertEqual(summary.critical_engines, int((summary.engines['min_RUL'] < 30).sum()))
+        self.assertEqual(summary.avg_lifecycle, round(summary.engines['max_cycle'].mean(), 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import contextlib
+import io
+import json
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+import unittest
+import pandas as pd
+import numpy as np
+from app.utils.correlation import SensorCorrelations
+from app.utils.data_processing import create_synthetic_data
+from app.utils.fleet import FleetData
+from app.utils.fleet_store import append_fleet_part, read_fleet
+from app.utils.model import fit_model
+from app.utils.streaming import StreamingFleet, queue_records, socket_records
+
+class TestStreamingFleet(unittest.TestCase):
+    
+    def setUp(self):
+        # Hold back the last five cycles of every engine and stream them in
+        self.test_data = create_synthetic_data(engines=8, min_cycles=40, max_cycles=60, seed=42)
+        is_recent = self.test_data['cycle'] > self.test_data['max_cycle'] - 5
+        self.history = self.test_data[~is_recent]
+        self.recent = self.test_data[is_recent]
+    
+    def test_append_matches_full_fleet(self):
+        fleet = FleetData(self.history).append(self.recent.sample(frac=1, random_state=0))
+        expected = FleetData(self.test_data)
+        pd.testing.assert_frame_equal(fleet.data.reset_index(drop=True), expected.data.reset_index(drop=True))
+        self.assertEqual(fleet.engines, expected.engines)
+        
+        # Re-sending records that are already stored changes nothing
+        self.assertEqual(len(fleet.append(self.recent.head(3))), len(fleet))
+        
+        # Records repeated within one batch are inserted once
+        fleet = FleetData(self.history).append(pd.concat([self.recent, self.recent.head(3)]))
+        pd.testing.assert_frame_equal(fleet.data.reset_index(drop=True), expected.data.reset_index(drop=True))
+    
+    def test_append_leaves_summary_unchanged(self):
+        history = FleetData(self.history)
+        before = history.summary.engines.copy()
+        before_counts = history.summary.status_counts.copy()
+        
+        fleet = history.append(self.recent)
+        pd.testing.assert_frame_equal(fleet.summary.engines, FleetData(self.test_data).summary.engines)
+        pd.testing.assert_frame_equal(history.summary.engines, before)
+        pd.testing.assert_frame_equal(history.summary.status_counts, before_counts)
+    
+    def test_ingest_refreshes_touched_engines_only(self):
+        streaming = StreamingFleet(FleetData(self.history))
+        before = streaming.fleet.summary.engines.copy()
+        
+        engines = streaming.ingest(self.recent[self.recent['unit_number'].isin([2, 5])])
+        self.assertEqual(engines, [2, 5])
+        
+        summary = streaming.fleet.summary.engines
+        expected = FleetData(self.test_data).summary.engines
+        pd.testing.assert_frame_equal(summary.loc[[2, 5]], expected.loc[[2, 5]])
+        pd.testing.assert_frame_equal(summary.drop([2, 5]), before.drop([2, 5]))
+    
+    def test_ingest_rescores_touched_engines(self):
+        model, scaler, sensor_cols, _ = fit_model(self.history, n_estimators=5)
+        streaming = StreamingFleet(FleetData(self.history), model, scaler, sensor_cols)
+        
+        streaming.ingest(self.recent[self.recent['unit_number'] == 3])
+        self.assertEqual(list(streaming.scores.index), [3])
+        self.assertEqual(streaming.scores.at[3, 'cycle'], self.test_data.loc[self.test_data['unit_number'] == 3, 'cycle'].max())
+        
+        streaming.ingest(self.recent[self.recent['unit_number'] == 1])
+        self.assertEqual(list(streaming.scores.index), [1, 3])
+    
+    def test_ingest_updates_correlations(self):
+        streaming = StreamingFleet(FleetData(self.history), correlations=SensorCorrelations(self.history))
+        streaming.ingest(self.recent)
+        expected = SensorCorrelations(self.test_data).overall()
+        np.testing.assert_allclose(streaming.correlations.overall(), expected, atol=1e-12)
+        
+        # Re-sent records change neither the fleet nor the correlations
+        self.assertEqual(streaming.ingest(self.history.head(50)), [])
+        self.assertEqual(streaming.ingest(pd.concat([self.recent.head(5)] * 2)), [])
+        np.testing.assert_allclose(streaming.correlations.overall(), expected, atol=1e-12)
+    
+    def test_queue_records_batches_until_sentinel(self):
+        record_queue = queue.Queue()
+        for record in self.recent.head(7).to_dict('records'):
+            record_queue.put(record)
+        record_queue.put(None)
+        
+        batches = list(queue_records(record_queue, max_batch=3))
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+    
+    def test_socket_records_stream_live(self):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            port = probe.getsockname()[1]
+        records = [json.dumps(record) for record in self.recent.head(3).to_dict('records')]
+        batches = queue.Queue()
+        stop = threading.Event()
+        stderr = io.StringIO()
+        
+        def consume():
+            with contextlib.redirect_stderr(stderr):
+                for batch in socket_records(port=port, timeout=0.05, stop_event=stop):
+                    batches.put(batch)
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        try:
+            # The server starts listening once the consumer thread runs
+            for _ in range(100):
+                try:
+                    client = socket.create_connection(('127.0.0.1', port), timeout=5)
+                    break
+                except ConnectionRefusedError:
+                    time.sleep(0.05)
+            # A slow client's records arrive while it stays connected; bad lines are skipped
+            with client:
+                client.sendall(f"{records[0]}\nnot json\n{records[1]}\n".encode())
+                self.assertEqual(batches.get(timeout=5)['cycle'].tolist(), self.recent['cycle'].head(2).tolist())
+            # The next client is accepted after the first disconnects
+            with socket.create_connection(('127.0.0.1', port), timeout=5) as client:
+                client.sendall(records[2].encode())
+            self.assertEqual(len(batches.get(timeout=5)), 1)
+        finally:
+            stop.set()
+            consumer.join(timeout=5)
+        self.assertFalse(consumer.is_alive())
+        self.assertIn('not json', stderr.getvalue())
+    
+    def test_append_fleet_part_round_trip(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            append_fleet_part(self.history, store_dir)
+            append_fleet_part(self.recent, store_dir)
+            self.assertEqual(len(os.listdir(store_dir)), 2)
+            
+            stored = read_fleet(store_dir)
+            self.assertEqual(len(stored), len(self.test_data))
+            np.testing.assert_array_equal(np.sort(stored['sensor_1']), np.sort(self.test_data['sensor_1']))
+    
+    def test_ingest_stores_new_records_only(self):
+        with tempfile.TemporaryDirectory() as store_dir:
+            streaming = StreamingFleet(FleetData(self.history), store_dir=store_dir)
+            streaming.ingest(pd.concat([self.recent, self.recent.head(3)]))
+            streaming.ingest(self.recent)
+            self.assertEqual(len(read_fleet(store_dir)), len(self.recent))
+
+if __name__ == '__main__':
+    unittest.main()
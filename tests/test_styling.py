@@ -0,0 +1,70 @@
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+from app.utils.styling import build_style, payload_sizes, prepare_background
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestStyling(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+        # A noisy background wider than the configured maximum
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 255, size=(600, 2400, 3), dtype=np.uint8)
+        self.image_path = os.path.join(self.tmp_dir.name, 'background.png')
+        Image.fromarray(pixels).save(self.image_path)
+        
+        self.stylesheet = os.path.join(self.tmp_dir.name, 'styles.css')
+        with open(self.stylesheet, 'w') as f:
+            f.write(".main { color: #ffffff; }\n")
+    
+    def test_prepare_background(self):
+        data, mime = prepare_background(self.image_path, max_width=800)
+        self.assertEqual(mime, 'image/jpeg')
+        self.assertLess(len(data), os.path.getsize(self.image_path))
+        with Image.open(io.BytesIO(data)) as resized:
+            self.assertEqual(resized.size, (800, 200))
+    
+    def test_inline_style(self):
+        style = build_style(self.stylesheet, self.image_path)
+        self.assertIn('.main { color: #ffffff; }', style)
+        self.assertIn('data:image/jpeg;base64,', style)
+    
+    def test_static_style(self):
+        static_dir = os.path.join(self.tmp_dir.name, 'static')
+        style = build_style(self.stylesheet, self.image_path, static_dir)
+        
+        files = sorted(os.listdir(static_dir))
+        self.assertEqual(len(files), 2)
+        css_name = next(name for name in files if name.endswith('.css'))
+        self.assertEqual(style, f'<style>@import url("app/static/{css_name}");</style>')
+        with open(os.path.join(static_dir, css_name)) as f:
+            css = f.read()
+        self.assertIn(next(name for name in files if name.endswith('.jpg')), css)
+        
+        # A changed stylesheet replaces the published CSS
+        with open(self.stylesheet, 'a') as f:
+            f.write(".header { color: #000000; }\n")
+        self.assertNotEqual(build_style(self.stylesheet, self.image_path, static_dir), style)
+        self.assertEqual(len(os.listdir(static_dir)), 2)
+    
+    def test_missing_image_falls_back(self):
+        style = build_style(self.stylesheet, os.path.join(self.tmp_dir.name, 'missing.png'))
+        self.assertIn('linear-gradient', style)
+    
+    def test_payload_sizes(self):
+        sizes = payload_sizes(self.stylesheet, self.image_path)
+        self.assertLess(sizes['inline'], sizes['original'])
+        self.assertLess(sizes['static'], 100)
+
+if __name__ == '__main__':
+    unittest.main()
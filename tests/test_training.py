@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from app.utils.data_processing import create_synthetic_data
+from app.utils.training import best_params, cross_validate_grid, nasa_score, rmse
+
+class TestTraining(unittest.TestCase):
+    
+    def setUp(self):
+        # Create a small synthetic dataset for testing
+        self.test_data = create_synthetic_data(engines=6, min_cycles=20, max_cycles=40, seed=42)
+    
+    def test_metrics(self):
+        self.assertAlmostEqual(rmse([0, 0], [3, 4]), np.sqrt(12.5))
+        self.assertEqual(nasa_score([10, 20], [10, 20]), 0.0)
+        
+        # Late predictions (overestimating RUL) are penalised more than early ones
+        self.assertGreater(nasa_score([10], [20]), nasa_score([20], [10]))
+    
+    def test_cross_validate_grid(self):
+        param_grid = {'n_estimators': [2, 4], 'max_depth': [3]}
+        fold_results, summary = cross_validate_grid(self.test_data, param_grid, n_splits=3, max_workers=1)
+        
+        # One result per (candidate, fold) and one summary row per candidate
+        self.assertEqual(len(fold_results), 6)
+        self.assertEqual(len(summary), 2)
+        for column in ('rmse_mean', 'nasa_score_mean', 'fit_time_mean', 'predict_us_per_row_mean'):
+            self.assertIn(column, summary.columns)
+        
+        # Summary is ordered best first and best_params picks that candidate
+        self.assertTrue(summary['rmse_mean'].is_monotonic_increasing)
+        self.assertEqual(best_params(summary), summary['params'].iloc[0])
+    
+    def test_cross_validate_grid_process_pool(self):
+        # The pool path returns the same metrics as the in-process path
+        param_grid = {'n_estimators': [2], 'max_depth': [3]}
+        _, inline = cross_validate_grid(self.test_data, param_grid, n_splits=2, max_workers=1)
+        _, pooled = cross_validate_grid(self.test_data, param_grid, n_splits=2, max_workers=2)
+        self.assertAlmostEqual(inline['rmse_mean'].iloc[0], pooled['rmse_mean'].iloc[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,11 @@ import unittest
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from app.utils.visualization import update_chart_style, create_themed_line_chart, add_threshold_line
+import app.config as config
+from app.utils.visualization import (
+    update_chart_style, create_themed_line_chart, add_threshold_line, create_sensor_comparison_chart,
+    cached_figure, figure_nbytes, create_rul_trajectory_chart
+)
 
 class TestVisualization(unittest.TestCase):
     
@@ -25,6 +29,11 @@ class TestVisualization(unittest.TestCase):
         self.assertEqual(styled_fig.layout.paper_bgcolor, 'rgba(5, 5, 15, 0)')
         self.assertEqual(styled_fig.layout.plot_bgcolor, 'rgba(5, 5, 15, 0.95)')
         self.assertEqual(styled_fig.layout.font.color, '#ffffff')
+        
+        # Axis and border styling come from the registered theme template
+        template = styled_fig.layout.template.layout
+        self.assertEqual(template.xaxis.gridcolor, 'rgba(180, 180, 230, 0.3)')
+        self.assertEqual(len(template.shapes), 1)
     
     def test_create_themed_line_chart(self):
         # Create a themed line chart
@@ -52,6 +61,58 @@ class TestVisualization(unittest.TestCase):
         # Check that annotation was added
         self.assertGreater(len(fig_with_threshold.layout.annotations), 0)
         self.assertEqual(fig_with_threshold.layout.annotations[0].text, threshold_text)
+    
+    def test_long_traces_are_decimated(self):
+        long_data = pd.DataFrame({'cycle': np.arange(5000), 'sensor_1': np.sin(np.arange(5000) / 50)})
+        
+        fig = create_themed_line_chart(long_data, 'cycle', 'sensor_1', 'Long Chart')
+        self.assertEqual(len(fig.data[0].x), config.CHART_POINT_BUDGET)
+        
+        # Few overlaid engines stay SVG, many switch to WebGL
+        fig = create_sensor_comparison_chart({1: long_data, 2: long_data}, 'sensor_1')
+        self.assertEqual([trace.type for trace in fig.data], ['scatter', 'scatter'])
+        self.assertTrue(all(len(trace.x) == config.CHART_POINT_BUDGET for trace in fig.data))
+        
+        fig = create_sensor_comparison_chart({engine: long_data for engine in range(8)}, 'sensor_1')
+        self.assertTrue(all(trace.type == 'scattergl' for trace in fig.data))
+    
+    def test_trajectory_band_edges_share_cycles(self):
+        cycles = np.arange(5000)
+        rng = np.random.default_rng(0)
+        predicted = 300 - cycles / 20 + rng.normal(0, 5, len(cycles))
+        predictions = pd.DataFrame({
+            'cycle': cycles,
+            'predicted_RUL': predicted,
+            # Edges with their own noise would decimate to different cycles on their own
+            'RUL_lower': predicted - 10 + rng.normal(0, 5, len(cycles)),
+            'RUL_upper': predicted + 10 + rng.normal(0, 5, len(cycles)),
+        })
+        
+        fig = create_rul_trajectory_chart(predictions, 1)
+        upper, lower = fig.data[0], fig.data[1]
+        self.assertEqual(len(upper.x), config.CHART_POINT_BUDGET)
+        np.testing.assert_array_equal(upper.x, lower.x)
+        np.testing.assert_array_equal(upper.y, predictions.set_index('cycle').loc[upper.x, 'RUL_upper'])
+    
+    def test_cached_figure(self):
+        builds = []
+        def build():
+            builds.append(1)
+            return create_themed_line_chart(self.test_data, 'x', 'y', 'Cached Chart')
+        
+        first = cached_figure(('test_chart', 1, 'v1'), build)
+        self.assertIs(cached_figure(('test_chart', 1, 'v1'), build), first)
+        self.assertEqual(len(builds), 1)
+        
+        # A new data version builds a new figure
+        self.assertIsNot(cached_figure(('test_chart', 1, 'v2'), build), first)
+        self.assertEqual(len(builds), 2)
+    
+    def test_figure_nbytes(self):
+        # Estimated from the trace arrays: 1000 float64 x and y values
+        fig = go.Figure(go.Scatter(x=np.arange(1000.0), y=np.arange(1000.0)))
+        self.assertEqual(figure_nbytes(fig), 16000)
+        self.assertEqual(figure_nbytes(go.Figure()), 0)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import argparse
+import json
+from app.utils.data_processing import load_data
+from app.utils.features import add_features
+from app.utils.fleet import FleetData
+from app.utils.model import fit_model
+from app.utils.model_registry import save_model_artifact
+from app.utils.parallel import FleetExecutor
+from app.utils.training import DEFAULT_PARAM_GRID, best_params, cross_validate_grid
+import app.config as config
+
+def main(argv=None):
+    """Train the RUL model offline and register it under the models directory"""
+    parser = argparse.ArgumentParser(description="Train and register the RUL prediction model")
+    parser.add_argument('--dataset', choices=list(config.DATASETS), default=config.DEFAULT_DATASET,
+                        help="C-MAPSS subset to train on")
+    parser.add_argument('--n-estimators', type=int, default=50, help="Number of trees when not searching")
+    parser.add_argument('--search', action='store_true', help="Run a cross-validated hyperparameter sweep first")
+    parser.add_argument('--param-grid', type=json.loads, default=None,
+                        help="JSON parameter grid for the sweep, e.g. '{\"n_estimators\": [25, 50]}'")
+    parser.add_argument('--folds', type=int, default=5, help="Group k-fold splits (by unit_number)")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: all cores)")
+    parser.add_argument('--metric', choices=['rmse', 'nasa_score'], default='rmse', help="Metric used to pick the winner")
+    parser.add_argument('--results', default=None, help="Write the per-candidate CV summary to this CSV file")
+    parser.add_argument('--features', action='store_true', help="Add rolling/trend features per engine")
+    parser.add_argument('--window', type=int, default=config.FEATURE_WINDOW, help="Rolling feature window (cycles)")
+    parser.add_argument('--ewm-span', type=int, default=config.FEATURE_EWM_SPAN, help="EWMA span (cycles)")
+    parser.add_argument('--models-dir', default=config.MODELS_DIR, help="Model registry directory")
+    args = parser.parse_args(argv)
+    
+    # Sorted like the app's fleet, so data_hash matches its FleetData.version
+    fleet = FleetData(load_data(dataset=args.dataset))
+    feature_params = None
+    if args.features:
+        feature_params = {'window': args.window, 'ewm_span': args.ewm_span}
+        with FleetExecutor(max_workers=args.workers) as executor:
+            fleet = add_features(fleet, executor=executor, **feature_params)
+    train_data = fleet.data
+    params = {'n_estimators': args.n_estimators}
+    metrics = {}
+    
+    if args.search:
+        _, summary = cross_validate_grid(
+            train_data,
+            param_grid=args.param_grid or DEFAULT_PARAM_GRID,
+            n_splits=args.folds,
+            max_workers=args.workers
+        )
+        print(summary.to_string(index=False))
+        if args.results:
+            summary.to_csv(args.results, index=False)
+        
+        params = best_params(summary, args.metric)
+        winner = summary.loc[summary[f'{args.metric}_mean'].idxmin()]
+        metrics = {
+            column: float(winner[column]) for column in summary.columns
+            if column.endswith(('_mean', '_std'))
+        }
+        print(f"Best parameters by {args.metric}: {params}")
+    
+    model, scaler, sensor_cols, importance = fit_model(train_data, **params)
+    
+    version = save_model_artifact(
+        model, scaler, sensor_cols, importance,
+        data_hash=fleet.version,
+        params=params,
+        metrics=metrics,
+        feature_params=feature_params,
+        dataset=args.dataset,
+        models_dir=args.models_dir
+    )
+    print(f"Registered model version {version} in {args.models_dir}")
+
+if __name__ == "__main__":
+    main()